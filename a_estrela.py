@@ -0,0 +1,444 @@
+"""
+A* (A-Estrela): Menor Caminho Guiado por Heurística
+====================================================
+Implementação do A* com heurísticas intercambiáveis (euclidiana, Manhattan,
+octil e por marcos) e verificação de admissibilidade para depuração.
+
+CONCEITOS:
+----------
+A*:
+- O Dijkstra ordena a fila por g(v), o custo conhecido desde a origem; o A*
+  ordena por f(v) = g(v) + h(v), onde h(v) estima o custo de v até o destino
+- Com h = 0 o A* é exatamente o Dijkstra com destino
+- Quanto mais perto h estiver da distância real, menos vértices são
+  expandidos: a busca "mira" o destino em vez de crescer em todas as direções
+
+ADMISSIBILIDADE E CONSISTÊNCIA:
+- Admissível: h(v) <= distância real de v até o destino, para todo v.
+  Garante que o caminho encontrado é ótimo
+- Consistente: h(u) <= peso(u, v) + h(v) para toda aresta u -> v. Cada
+  vértice é expandido uma única vez
+- Esta implementação reabre um vértice já expandido se encontrar um
+  caminho melhor até ele, então uma heurística admissível mas inconsistente
+  continua dando o caminho ótimo (com algumas expansões a mais)
+
+HEURÍSTICAS (classe Heuristicas):
+- euclidiana: distância em linha reta entre as coordenadas dos vértices
+  (mapas, malhas viárias)
+- manhattan: |dx| + |dy| (grades com movimentos ortogonais)
+- octil: max(dx, dy) + (√2 - 1) * min(dx, dy) (grades com diagonais de custo √2)
+- marcos (ALT): distâncias pré-calculadas de/para alguns vértices "marco" e
+  a desigualdade triangular; não precisa de coordenadas
+- As geométricas aceitam um 'fator': o menor custo por unidade de distância
+  (ex.: terreno mais barato do mapa), para continuarem admissíveis
+
+MODO DE DEPURAÇÃO:
+- verificar_heuristica=True calcula as distâncias reais até o destino (um
+  Dijkstra pelas arestas de entrada) e lança ValueError no primeiro vértice
+  em que a heurística superestima o custo
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import heapq
+import math
+import random
+from typing import Callable, Dict, List, Optional
+
+from bellman_ford_dijkstra import Dijkstra, _rastrear_caminho
+from grafo import Grafo
+from rastreamento import Rastreador, obter_rastreador
+
+
+# h(vertice, destino) -> estimativa do custo restante
+Heuristica = Callable[[int, int], float]
+
+
+def _distancias(grafo: Grafo, origem: int, reverso: bool = False) -> Dict[int, float]:
+    """
+    Dijkstra sem rastreamento: distâncias a partir da origem ou, com
+    reverso=True, de cada vértice até ela (pelas arestas de entrada).
+    
+    Returns:
+        Dict[int, float]: Distância de cada vértice alcançado
+    """
+    obter_vizinhos = grafo.obter_predecessores if reverso else grafo.obter_vizinhos
+    distancia = {origem: 0}
+    fixados = set()
+    heap = [(0, origem)]
+    
+    while heap:
+        dist_u, u = heapq.heappop(heap)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        for v, peso in obter_vizinhos(u):
+            nova_distancia = dist_u + peso
+            if nova_distancia < distancia.get(v, math.inf):
+                distancia[v] = nova_distancia
+                heapq.heappush(heap, (nova_distancia, v))
+    
+    return distancia
+
+
+class Heuristicas:
+    """
+    Fábricas de heurísticas: cada método retorna uma função h(vertice, destino).
+    
+    As heurísticas geométricas leem grafo.coordenadas (Grafo.definir_coordenadas).
+    """
+    
+    @staticmethod
+    def nula() -> Heuristica:
+        """
+        Heurística zero: o A* se comporta como o Dijkstra com destino.
+        
+        Returns:
+            Heuristica: h(v, destino) = 0
+        """
+        return lambda vertice, destino: 0.0
+    
+    @staticmethod
+    def euclidiana(grafo: Grafo, fator: float = 1.0) -> Heuristica:
+        """
+        Distância em linha reta entre as coordenadas.
+        
+        Args:
+            grafo (Grafo): Grafo com coordenadas
+            fator (float): Menor custo por unidade de distância
+        
+        Returns:
+            Heuristica: h(v, destino) = fator * ||pos(v) - pos(destino)||
+        """
+        coordenadas = grafo.coordenadas
+        
+        def heuristica(vertice: int, destino: int) -> float:
+            x1, y1 = coordenadas[vertice]
+            x2, y2 = coordenadas[destino]
+            return fator * math.hypot(x1 - x2, y1 - y2)
+        
+        return heuristica
+    
+    @staticmethod
+    def manhattan(grafo: Grafo, fator: float = 1.0) -> Heuristica:
+        """
+        Soma das diferenças absolutas das coordenadas.
+        
+        Só é admissível quando cada passo muda uma coordenada de cada vez
+        (grades com vizinhança de 4).
+        
+        Args:
+            grafo (Grafo): Grafo com coordenadas
+            fator (float): Menor custo por unidade de distância
+        
+        Returns:
+            Heuristica: h(v, destino) = fator * (|dx| + |dy|)
+        """
+        coordenadas = grafo.coordenadas
+        
+        def heuristica(vertice: int, destino: int) -> float:
+            x1, y1 = coordenadas[vertice]
+            x2, y2 = coordenadas[destino]
+            return fator * (abs(x1 - x2) + abs(y1 - y2))
+        
+        return heuristica
+    
+    @staticmethod
+    def octil(grafo: Grafo, fator: float = 1.0) -> Heuristica:
+        """
+        Distância em uma grade com vizinhança de 8: passos retos custam 1 e
+        diagonais custam √2 (GeradorGrafos.grade com diagonais=True).
+        
+        Args:
+            grafo (Grafo): Grafo com coordenadas
+            fator (float): Menor custo por unidade de distância
+        
+        Returns:
+            Heuristica: h(v, destino) = fator * (max(dx, dy) + (√2 - 1) * min(dx, dy))
+        """
+        coordenadas = grafo.coordenadas
+        extra_diagonal = math.sqrt(2) - 1
+        
+        def heuristica(vertice: int, destino: int) -> float:
+            x1, y1 = coordenadas[vertice]
+            x2, y2 = coordenadas[destino]
+            dx = abs(x1 - x2)
+            dy = abs(y1 - y2)
+            if dx < dy:
+                dx, dy = dy, dx
+            return fator * (dx + extra_diagonal * dy)
+        
+        return heuristica
+    
+    @staticmethod
+    def marcos(grafo: Grafo, quantidade: int = 4, marcos: Optional[List[int]] = None,
+               semente: int = 42) -> Heuristica:
+        """
+        Heurística por marcos (ALT: A*, Landmarks e desigualdade Triangular).
+        
+        Para cada marco L, com distâncias pré-calculadas d(L, ·) e d(·, L):
+            d(v, t) >= d(L, t) - d(L, v)
+            d(v, t) >= d(v, L) - d(t, L)
+        h(v, t) é o maior desses limites entre todos os marcos.
+        
+        Se os marcos não forem informados, o primeiro é o vértice mais
+        distante de um vértice sorteado, e cada seguinte é o vértice mais
+        distante dos marcos já escolhidos (marcos na "borda" do grafo dão
+        limites melhores).
+        
+        Pré-processamento: um Dijkstra por marco (dois em grafos
+        direcionados: arestas de saída e de entrada).
+        
+        Args:
+            grafo (Grafo): Grafo ponderado (pesos não-negativos)
+            quantidade (int): Número de marcos a escolher
+            marcos (Optional[List[int]]): Marcos escolhidos manualmente
+            semente (int): Semente do sorteio do vértice inicial
+        
+        Returns:
+            Heuristica: h(v, destino) pelos marcos
+        
+        Raises:
+            ValueError: Se o grafo não tiver vértices
+        """
+        tabelas = []  # (distâncias a partir do marco, distâncias até o marco)
+        
+        def adicionar_marco(marco: int) -> Dict[int, float]:
+            a_partir = _distancias(grafo, marco)
+            ate = _distancias(grafo, marco, reverso=True) if grafo.direcionado else a_partir
+            tabelas.append((a_partir, ate))
+            return a_partir
+        
+        if marcos is not None:
+            for marco in marcos:
+                adicionar_marco(marco)
+        else:
+            vertices = grafo.obter_vertices()
+            if not vertices:
+                raise ValueError("O grafo não tem vértices para escolher marcos")
+            
+            # Escolha do mais distante: menor distância de cada vértice aos marcos
+            inicial = _distancias(grafo, random.Random(semente).choice(vertices))
+            mais_proximo = dict.fromkeys(inicial, math.inf)
+            proximo = max(inicial, key=inicial.__getitem__)
+            for _ in range(quantidade):
+                a_partir = adicionar_marco(proximo)
+                for v, d in a_partir.items():
+                    if v in mais_proximo and d < mais_proximo[v]:
+                        mais_proximo[v] = d
+                proximo = max(mais_proximo, key=mais_proximo.__getitem__)
+        
+        def heuristica(vertice: int, destino: int) -> float:
+            melhor = 0.0
+            for a_partir, ate in tabelas:
+                d_marco_v = a_partir.get(vertice)
+                d_marco_t = a_partir.get(destino)
+                if d_marco_v is not None and d_marco_t is not None and d_marco_t - d_marco_v > melhor:
+                    melhor = d_marco_t - d_marco_v
+                d_v_marco = ate.get(vertice)
+                d_t_marco = ate.get(destino)
+                if d_v_marco is not None and d_t_marco is not None and d_v_marco - d_t_marco > melhor:
+                    melhor = d_v_marco - d_t_marco
+            return melhor
+        
+        return heuristica
+
+
+class AEstrela:
+    """
+    Implementação do A* com reabertura de vértices.
+    """
+    
+    @staticmethod
+    def menor_caminho(grafo: Grafo, origem: int, destino: int,
+                      heuristica: Optional[Heuristica] = None,
+                      verificar_heuristica: bool = False,
+                      mostrar_passos: bool = True,
+                      rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Encontra o menor caminho de origem a destino usando o A*.
+        
+        FUNCIONAMENTO:
+        1. g(origem) = 0; a fila de prioridade é ordenada por f = g + h
+           (empates: menor h, ou seja, o vértice mais perto do destino)
+        2. Remove o vértice u de menor f e o expande:
+           para cada vizinho v com g(u) + peso(u,v) < g(v), atualiza g(v),
+           predecessor[v] = u e insere v na fila (reabrindo v se ele já
+           tinha sido expandido)
+        3. Para quando o destino é removido da fila
+        
+        Args:
+            grafo (Grafo): Grafo ponderado (pesos não-negativos)
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            heuristica (Optional[Heuristica]): h(v, destino); None usa a
+                heurística nula (equivale ao Dijkstra)
+            verificar_heuristica (bool): Modo de depuração: confere a
+                admissibilidade da heurística antes da busca
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+        
+        Returns:
+            Dict: Dicionário contendo:
+                - 'distancia': g(v) dos vértices alcançados
+                - 'predecessor': predecessor de cada vértice alcançado
+                - 'caminho': menor caminho até o destino (None se não há)
+                - 'custo': custo do caminho (None se não há)
+                - 'vertices_visitados': vértices expandidos, na ordem
+                - 'expandidos': número de expansões (inclui reaberturas)
+                - 'reabertos': vértices reabertos (0 com heurística consistente)
+        
+        Raises:
+            ValueError: Se verificar_heuristica=True e a heurística não for admissível
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        if heuristica is None:
+            heuristica = Heuristicas.nula()
+        if verificar_heuristica:
+            AEstrela.verificar_admissibilidade(grafo, destino, heuristica)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO A* - MENOR CAMINHO COM HEURÍSTICA")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Origem: {origem}  Destino: {destino}",
+                              algoritmo='A*', origem=origem, destino=destino)
+        
+        estimativa = {origem: heuristica(origem, destino)}  # h(v), calculada uma vez
+        distancia = {origem: 0}
+        predecessor = {origem: None}
+        expandidos_conjunto = set()
+        vertices_visitados = []
+        reabertos = 0
+        
+        # Fila de prioridade: (f, h, vértice)
+        heap = [(estimativa[origem], estimativa[origem], origem)]
+        
+        while heap:
+            f_u, h_u, u = heapq.heappop(heap)
+            
+            # Entrada obsoleta: g(u) já diminuiu depois que ela foi inserida
+            if u in expandidos_conjunto or f_u > distancia[u] + h_u:
+                continue
+            
+            expandidos_conjunto.add(u)
+            vertices_visitados.append(u)
+            
+            if ativo:
+                rastreador.evento('visita',
+                                  f"  Expandindo {u}: g = {distancia[u]:.2f}, h = {h_u:.2f}, f = {f_u:.2f}",
+                                  passo=len(vertices_visitados), vertice=u,
+                                  distancia=distancia[u], g=distancia[u], h=h_u, f=f_u,
+                                  tamanho_heap=len(heap))
+            
+            if u == destino:
+                if ativo:
+                    rastreador.evento('destino',
+                                      f"\n  ✓ Destino {destino} alcançado! Parando busca.",
+                                      vertice=destino)
+                break
+            
+            for v, peso in grafo.obter_vizinhos(u):
+                nova_distancia = distancia[u] + peso
+                if nova_distancia < distancia.get(v, math.inf):
+                    distancia[v] = nova_distancia
+                    predecessor[v] = u
+                    if v in expandidos_conjunto:
+                        # Heurística inconsistente: v precisa ser expandido de novo
+                        expandidos_conjunto.discard(v)
+                        reabertos += 1
+                    h_v = estimativa.get(v)
+                    if h_v is None:
+                        h_v = estimativa[v] = heuristica(v, destino)
+                    heapq.heappush(heap, (nova_distancia + h_v, h_v, v))
+        
+        caminho = None
+        custo = None
+        
+        if destino in expandidos_conjunto:
+            caminho = Dijkstra._reconstruir_caminho(predecessor, origem, destino)
+            custo = distancia[destino]
+            if ativo:
+                _rastrear_caminho(rastreador, grafo, origem, destino, caminho, custo)
+        elif ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Não há caminho de {origem} para {destino}",
+                              destino=destino)
+        
+        if ativo:
+            rastreador.evento('fim',
+                              f"\nVértices expandidos: {len(vertices_visitados)}"
+                              f"  Reabertos: {reabertos}",
+                              visitados=len(vertices_visitados),
+                              expandidos=len(vertices_visitados), reabertos=reabertos)
+        
+        return {
+            'distancia': distancia,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'custo': custo,
+            'vertices_visitados': vertices_visitados,
+            'expandidos': len(vertices_visitados),
+            'reabertos': reabertos
+        }
+    
+    @staticmethod
+    def verificar_admissibilidade(grafo: Grafo, destino: int, heuristica: Heuristica,
+                                  tolerancia: float = 1e-9):
+        """
+        Confere se a heurística nunca superestima a distância até o destino.
+        
+        Calcula a distância real de todo vértice até o destino (Dijkstra
+        pelas arestas de entrada) e compara com h(v, destino). Custa um
+        Dijkstra completo: use para depuração, não a cada consulta.
+        
+        Args:
+            grafo (Grafo): Grafo ponderado
+            destino (int): Vértice de destino
+            heuristica (Heuristica): Heurística a verificar
+            tolerancia (float): Folga relativa para erros de arredondamento
+        
+        Raises:
+            ValueError: No primeiro vértice em que h(v) > distância real
+        """
+        for vertice, real in _distancias(grafo, destino, reverso=True).items():
+            estimada = heuristica(vertice, destino)
+            if estimada > real + tolerancia * max(1.0, real):
+                raise ValueError(f"Heurística não admissível: h({vertice}) = {estimada} "
+                                 f"> distância real até {destino} = {real}")
+
+
+def demonstrar_a_estrela():
+    """
+    Função de demonstração do A* no mapa da cidade.
+    """
+    from grafo import GrafoExemplos
+    
+    print("\n" + "="*70)
+    print("DEMONSTRAÇÃO: A* COM HEURÍSTICAS")
+    print("="*70)
+    
+    grafo = GrafoExemplos.criar_mapa_cidade()
+    nomes = GrafoExemplos.obter_nomes_mapa_cidade()
+    origem, destino = 5, 9  # Aeroporto -> Biblioteca
+    print(f"\nMapa da cidade: {nomes[origem]} ({origem}) → {nomes[destino]} ({destino})")
+    
+    AEstrela.menor_caminho(grafo, origem, destino, Heuristicas.euclidiana(grafo),
+                           verificar_heuristica=True)
+    
+    print("\nComparação das heurísticas (vértices expandidos):")
+    for nome, heuristica in (('Nula (Dijkstra)', Heuristicas.nula()),
+                             ('Euclidiana', Heuristicas.euclidiana(grafo)),
+                             ('Marcos (ALT)', Heuristicas.marcos(grafo, 3))):
+        resultado = AEstrela.menor_caminho(grafo, origem, destino, heuristica,
+                                           verificar_heuristica=True, mostrar_passos=False)
+        print(f"  {nome:16} custo {resultado['custo']:.1f} km, "
+              f"{resultado['expandidos']} vértices expandidos")
+
+
+if __name__ == "__main__":
+    demonstrar_a_estrela()
@@ -7,9 +7,12 @@ Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
 Data: Dezembro 2025
 """
 
-from grafo import Grafo
+from grafo import ErroCiclo, Grafo
 from bfs_dfs import BFS, DFS
 from bellman_ford_dijkstra import BellmanFord, Dijkstra
+from componentes_fortes import Tarjan
+from a_estrela import AEstrela, Heuristicas
+from ordenacao_topologica import Kahn
 from mst_kruskal_prim import Kruskal, Prim
 
 
@@ -36,8 +39,8 @@ class AplicacaoRedeSocial:
             (2, 7), (6, 11), (12, 16)
         ]
         
-        for u, v in conexoes:
-            grafo.adicionar_aresta(u, v, 1)
+        origens, destinos = zip(*conexoes)
+        grafo.adicionar_arestas(origens, destinos)
         
         return grafo
     
@@ -71,7 +74,10 @@ class AplicacaoRedeSocial:
         print(f"\n🔍 Buscando conexão entre {nomes[origem]} e {nomes[destino]}...")
         print()
         
-        resultado = BFS.buscar(grafo, origem, destino, mostrar_passos=False)
+        # Busca bidirecional: em redes com milhões de pessoas a fronteira da
+        # BFS comum explode; partindo das duas pontas, cada lado explora
+        # apenas metade dos graus de separação
+        resultado = BFS.buscar_bidirecional(grafo, origem, destino, mostrar_passos=False)
         
         if resultado['caminho']:
             print(f"\n✓ CONEXÃO ENCONTRADA!")
@@ -113,8 +119,8 @@ class AplicacaoDependencias:
             (14, 15), (15, 16), (16, 17), (17, 9),
         ]
         
-        for u, v in dependencias:
-            grafo.adicionar_aresta(u, v, 1)
+        origens, destinos = zip(*dependencias)
+        grafo.adicionar_arestas(origens, destinos)
         
         return grafo
     
@@ -128,34 +134,49 @@ class AplicacaoDependencias:
             13: "PkgE", 14: "PkgF", 15: "PkgG", 16: "PkgH", 17: "PkgI"
         }
     
+    @staticmethod
+    def obter_tempos_instalacao():
+        """Retorna o tempo de instalação de cada pacote (em segundos)."""
+        return {
+            0: 40, 1: 25, 2: 30, 3: 10, 4: 5, 5: 15, 6: 20, 7: 10,
+            8: 35, 9: 5, 10: 5, 11: 5, 12: 5, 13: 5, 14: 5, 15: 5, 16: 5, 17: 5
+        }
+    
     @staticmethod
     def detectar_ciclo(grafo, inicio=0):
-        """Usa DFS para detectar ciclos."""
+        """
+        Usa DFS para detectar ciclos.
+        
+        A DFS usa uma pilha explícita: o caminho atual é a própria pilha
+        (sem copiar o caminho a cada vértice) e a posição de cada vértice no
+        caminho fica em um dicionário, então a busca é O(V + E) mesmo em
+        cadeias de dependências muito longas.
+        """
         visitados = set()
-        pilha_recursao = set()
-        ciclo_encontrado = []
+        posicao_no_caminho = {}  # Vértices na pilha da DFS -> posição no caminho
         
-        def dfs_ciclo(v, caminho):
-            visitados.add(v)
-            pilha_recursao.add(v)
-            caminho.append(v)
+        for vertice in grafo.obter_vertices():
+            if vertice in visitados:
+                continue
             
-            for vizinho, _ in grafo.obter_vizinhos(v):
-                if vizinho not in visitados:
-                    if dfs_ciclo(vizinho, caminho[:]):
-                        return True
-                elif vizinho in pilha_recursao:
-                    idx = caminho.index(vizinho)
-                    ciclo_encontrado.extend(caminho[idx:] + [vizinho])
-                    return True
+            visitados.add(vertice)
+            posicao_no_caminho[vertice] = 0
+            caminho = [vertice]
+            iteradores = [iter(grafo.obter_vizinhos(vertice))]
             
-            pilha_recursao.remove(v)
-            return False
-        
-        for vertice in grafo.obter_vertices():
-            if vertice not in visitados:
-                if dfs_ciclo(vertice, []):
-                    return ciclo_encontrado
+            while caminho:
+                for vizinho, _ in iteradores[-1]:
+                    if vizinho not in visitados:
+                        visitados.add(vizinho)
+                        posicao_no_caminho[vizinho] = len(caminho)
+                        caminho.append(vizinho)
+                        iteradores.append(iter(grafo.obter_vizinhos(vizinho)))
+                        break
+                    elif vizinho in posicao_no_caminho:
+                        return caminho[posicao_no_caminho[vizinho]:] + [vizinho]
+                else:
+                    del posicao_no_caminho[caminho.pop()]
+                    iteradores.pop()
         
         return []
     
@@ -191,6 +212,42 @@ class AplicacaoDependencias:
             print(f"\n✓ Sistema OK! Nenhum ciclo detectado.")
             print(f"  Instalação pode prosseguir normalmente.")
         
+        # Tarjan: todos os grupos circulares de uma vez (não só o primeiro ciclo)
+        componentes = Tarjan.componentes(grafo, mostrar_passos=False)
+        print(f"\n🔗 Grupos de dependências circulares (Tarjan): {len(componentes['ciclicos'])}")
+        for c in componentes['ciclicos']:
+            pacotes = [nomes[p] for p in componentes['componentes'][c]]
+            print(f"    {len(pacotes)} pacotes: {', '.join(pacotes)}")
+        
+        # Kahn: ondas de instalação em paralelo (pacotes fora dos ciclos)
+        instalacao = Kahn.ordenar(grafo, reverso=True, mostrar_passos=False)
+        critico = Kahn.caminho_critico(grafo, AplicacaoDependencias.obter_tempos_instalacao(),
+                                       reverso=True)
+        print(f"\n📥 Ondas de instalação (cada onda em paralelo):")
+        for k, onda in enumerate(instalacao['ondas']):
+            print(f"    Onda {k}: {', '.join(nomes[p] for p in onda)}")
+        print(f"    Caminho crítico ({critico['duracao_total']:.0f} s): "
+              f"{' → '.join(nomes[p] for p in critico['caminho'])}")
+        
+        # Detecção online: recusa a dependência que fecharia um ciclo ao ser adicionada
+        registro = Grafo(direcionado=True)
+        registro.ativar_deteccao_ciclos()
+        for origem, destino, _ in grafo.obter_arestas():
+            if origem < 9:  # Apenas a parte acíclica do sistema
+                registro.adicionar_aresta(origem, destino)
+        print(f"\n🛡️  Registro com detecção online: nova dependência Crypto → AppPrincipal")
+        try:
+            registro.adicionar_aresta(8, 0)
+        except ErroCiclo as erro:
+            print(f"    Recusada, fecharia o ciclo: {' → '.join(nomes[p] for p in erro.ciclo)}")
+        
+        # Dependências reversas: quem depende de cada pacote (arestas de entrada)
+        mais_usados = sorted(grafo.obter_vertices(), key=grafo.grau_entrada, reverse=True)[:3]
+        print(f"\n📊 Pacotes mais usados (impacto de uma atualização):")
+        for pacote in mais_usados:
+            dependentes = [nomes[p] for p, _ in grafo.obter_predecessores(pacote)]
+            print(f"    {nomes[pacote]:12} ← {len(dependentes)} dependente(s): {', '.join(dependentes)}")
+        
         print("\n" + "=" * 80)
 
 
@@ -237,8 +294,19 @@ class AplicacaoJogoRPG:
             (17, 0, 5),
         ]
         
-        for u, v, peso in conexoes:
-            grafo.adicionar_aresta(u, v, peso)
+        grafo.adicionar_arestas(*zip(*conexoes))
+        
+        # Posição de cada local no mapa: o custo de uma conexão nunca é menor
+        # que a distância em linha reta (terreno mais barato: estrada, custo 1)
+        posicoes = {
+            0: (7.1, 15.1), 1: (6.4, 15.2), 2: (5.7, 15.1), 3: (3.7, 14.6),
+            4: (8.6, 18.6), 5: (12.3, 20.0), 6: (15.9, 18.5), 7: (17.2, 17.0),
+            8: (7.9, 23.7), 9: (17.1, 25.9), 10: (21.0, 16.7), 11: (17.4, 15.0),
+            12: (0.0, 3.0), 13: (13.0, 0.0), 14: (14.8, 11.9), 15: (12.6, 11.5),
+            16: (11.9, 11.5), 17: (9.8, 12.2)
+        }
+        for local, (x, y) in posicoes.items():
+            grafo.definir_coordenadas(local, x, y)
         
         return grafo
     
@@ -288,18 +356,24 @@ class AplicacaoJogoRPG:
             for i in range(len(resultado['caminho']) - 1):
                 atual = resultado['caminho'][i]
                 proximo = resultado['caminho'][i + 1]
+                peso = grafo.peso(atual, proximo)
                 
-                for viz, peso in grafo.obter_vizinhos(atual):
-                    if viz == proximo:
-                        terreno = "Estrada" if peso == 1 else \
-                                 "Grama" if peso == 3 else \
-                                 "Floresta" if peso == 5 else \
-                                 "Montanha" if peso == 10 else "Pântano"
-                        
-                        print(f"    {i+1}. {nomes[atual]:15} → {nomes[proximo]:15} (Custo: {peso:2}, Terreno: {terreno})")
-                        break
+                terreno = "Estrada" if peso == 1 else \
+                         "Grama" if peso == 3 else \
+                         "Floresta" if peso == 5 else \
+                         "Montanha" if peso == 10 else "Pântano"
+                
+                print(f"    {i+1}. {nomes[atual]:15} → {nomes[proximo]:15} (Custo: {peso:2}, Terreno: {terreno})")
             
             print(f"\n💡 Dica: Rotas alternativas existem, mas custam mais energia!")
+            
+            # A*: a distância em linha reta até o destino guia a busca
+            a_estrela = AEstrela.menor_caminho(grafo, origem, destino,
+                                               Heuristicas.euclidiana(grafo),
+                                               mostrar_passos=False)
+            print(f"\n⭐ A* (heurística euclidiana): custo {a_estrela['custo']:.1f}, "
+                  f"{a_estrela['expandidos']} locais expandidos "
+                  f"(Dijkstra: {len(resultado['vertices_visitados'])})")
         
         print("\n" + "=" * 80)
 
@@ -357,10 +431,8 @@ class AplicacaoMercadoFinanceiro:
             (5, 6, 1.47), (6, 7, 0.94), (7, 5, 0.73),
         ]
         
-        import math
-        for u, v, taxa in taxas:
-            peso = -math.log(taxa)
-            grafo.adicionar_aresta(u, v, peso)
+        origens, destinos, valores = zip(*taxas)
+        grafo.adicionar_arestas(origens, destinos, [-math.log(taxa) for taxa in valores])
         
         return grafo
     
@@ -395,7 +467,7 @@ class AplicacaoMercadoFinanceiro:
         
         resultado = BellmanFord.menor_caminho(grafo, origem, destino, mostrar_passos=False)
         
-        if 'ciclo_negativo' in resultado and resultado['ciclo_negativo']:
+        if resultado['tem_ciclo_negativo']:
             print(f"⚠️  OPORTUNIDADE DE ARBITRAGEM DETECTADA!")
             print(f"\n  Existe um ciclo onde é possível obter LUCRO!")
             print(f"  Ciclo negativo encontrado no grafo.")
@@ -461,8 +533,7 @@ class AplicacaoRedeEletrica:
             (12, 8, 41),
         ]
         
-        for u, v, custo in conexoes:
-            grafo.adicionar_aresta(u, v, custo)
+        grafo.adicionar_arestas(*zip(*conexoes))
         
         return grafo
     
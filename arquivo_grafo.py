@@ -0,0 +1,259 @@
+"""
+Módulo de Persistência: Arquivo Binário de Grafo
+=================================================
+Este módulo salva e abre grafos em um formato binário versionado, pensado
+para grafos grandes (mapas rodoviários, redes de computadores).
+
+CONCEITOS:
+----------
+O arquivo guarda exatamente os vetores CSR do GrafoCompacto, um após o
+outro, alinhados em 8 bytes. Na abertura o arquivo é mapeado em memória
+(mmap) e os vetores são apenas "visões" (memoryview) sobre as páginas do
+arquivo: nada é lido, convertido ou copiado. O sistema operacional carrega
+cada página do disco somente quando ela é acessada pela primeira vez.
+
+Por isso o tempo de abertura não depende do tamanho do grafo.
+
+FORMATO (versão 1, little-endian):
+----------------------------------
+    Cabeçalho (64 bytes):
+        magic (8s)          b'GRAFOCSR'
+        versao (uint32)     versão do formato
+        flags (uint32)      bit 0 = direcionado, bit 1 = possui nomes
+        n (uint64)          número de linhas (vértices)
+        m (uint64)          número de entradas de adjacência
+        vertices (uint64)   número de vértices declarado no Grafo
+        tamanho_nomes (uint64) bytes do texto de nomes (0 sem nomes)
+        (preenchimento até 64 bytes)
+    Seções (nesta ordem):
+        ids        int64[n]      vértices em ordem crescente
+        offsets    int64[n + 1]  início da adjacência de cada linha
+        destinos   int64[m]      destino de cada entrada
+        pesos      float64[m]    peso de cada entrada
+        ordem      int64[n]      linhas na ordem das chaves de adjacência
+        posicao    int64[n]      posição de cada linha em 'ordem'
+    Tabela de nomes (opcional):
+        nomes_offsets int64[n + 1] início do nome de cada linha no texto
+        texto         bytes        nomes em UTF-8, concatenados
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Optional, Tuple, Iterator
+
+from grafo_compacto import GrafoCompacto
+
+
+class NomesArquivo:
+    """
+    Tabela de nomes de vértices lida diretamente do arquivo mapeado.
+    
+    Comporta-se como o dicionário vértice -> nome usado no resto do projeto
+    (nomes[v], v in nomes, nomes.get(v), nomes.items()), mas decodifica
+    cada nome apenas quando ele é consultado.
+    """
+    
+    def __init__(self, grafo: GrafoCompacto, offsets, texto):
+        """
+        Inicializa a tabela de nomes.
+        
+        Args:
+            grafo (GrafoCompacto): Grafo dono dos vértices
+            offsets: Início de cada nome no texto (tamanho n + 1)
+            texto: Nomes concatenados em UTF-8
+        """
+        self._grafo = grafo
+        self._offsets = offsets
+        self._texto = texto
+        self._rotulos = None  # Índice reverso nome -> linha (sob demanda)
+    
+    def __getitem__(self, vertice: int) -> str:
+        """Retorna o nome de um vértice (KeyError se não existir)."""
+        i = self._grafo._linha(vertice)
+        if i < 0:
+            raise KeyError(vertice)
+        return bytes(self._texto[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+    
+    def get(self, vertice: int, padrao: Optional[str] = None) -> Optional[str]:
+        """Retorna o nome de um vértice, ou 'padrao' se não existir."""
+        try:
+            return self[vertice]
+        except KeyError:
+            return padrao
+    
+    def __contains__(self, vertice: int) -> bool:
+        """Verifica se o vértice possui nome na tabela."""
+        return self._grafo._linha(vertice) >= 0
+    
+    def __len__(self) -> int:
+        """Retorna o número de nomes."""
+        return len(self._offsets) - 1
+    
+    def __iter__(self) -> Iterator[int]:
+        """Percorre os vértices em ordem crescente."""
+        return iter(self._grafo.obter_vertices())
+    
+    def items(self) -> Iterator[Tuple[int, str]]:
+        """Percorre os pares (vértice, nome)."""
+        for v in self._grafo.obter_vertices():
+            yield v, self[v]
+    
+    def obter_vertice(self, nome: str) -> Optional[int]:
+        """
+        Retorna o vértice de um nome (consulta reversa em O(1)).
+        
+        Na primeira chamada constrói uma TabelaRotulos sobre o texto
+        mapeado, sem copiá-lo. Nomes repetidos resolvem para o menor vértice.
+        
+        Args:
+            nome (str): Nome do vértice
+        
+        Returns:
+            Optional[int]: Vértice, ou None se o nome não existir
+        """
+        if self._rotulos is None:
+            from rotulos import TabelaRotulos
+            self._rotulos = TabelaRotulos.de_vetores(self._offsets, self._texto)
+        linha = self._rotulos.obter_id(nome)
+        if linha is None:
+            return None
+        return self._grafo._ids[linha]
+
+
+class ArquivoGrafo:
+    """
+    Leitura e escrita do formato binário de grafos.
+    """
+    
+    MAGIC = b'GRAFOCSR'
+    VERSAO = 1
+    CABECALHO = struct.Struct('<8sIIQQQQ')
+    TAMANHO_CABECALHO = 64
+    
+    FLAG_DIRECIONADO = 1
+    FLAG_NOMES = 2
+    
+    @staticmethod
+    def salvar(grafo, caminho: str, nomes: Optional[Dict[int, str]] = None):
+        """
+        Salva um grafo no formato binário.
+        
+        Args:
+            grafo (Grafo ou GrafoCompacto): Grafo a ser salvo (vértices inteiros)
+            caminho (str): Caminho do arquivo de saída
+            nomes (Optional[Dict[int, str]]): Nomes dos vértices (opcional)
+        """
+        if not isinstance(grafo, GrafoCompacto):
+            grafo = grafo.compactar()
+        
+        vetores = grafo.obter_vetores()
+        ids = vetores['ids']
+        n = len(ids)
+        m = len(vetores['destinos'])
+        
+        flags = ArquivoGrafo.FLAG_DIRECIONADO if grafo.direcionado else 0
+        
+        texto = b''
+        nomes_offsets = None
+        if nomes is not None:
+            flags |= ArquivoGrafo.FLAG_NOMES
+            partes = [nomes.get(v, '').encode('utf-8') for v in ids]
+            nomes_offsets = array('q', bytes(8 * (n + 1)))
+            for i, parte in enumerate(partes):
+                nomes_offsets[i + 1] = nomes_offsets[i] + len(parte)
+            texto = b''.join(partes)
+        
+        cabecalho = ArquivoGrafo.CABECALHO.pack(
+            ArquivoGrafo.MAGIC, ArquivoGrafo.VERSAO, flags,
+            n, m, grafo.vertices, len(texto)
+        )
+        
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(cabecalho.ljust(ArquivoGrafo.TAMANHO_CABECALHO, b'\0'))
+            for nome, tipo in (('ids', 'q'), ('offsets', 'q'), ('destinos', 'q'),
+                               ('pesos', 'd'), ('ordem', 'q'), ('posicao', 'q')):
+                ArquivoGrafo._escrever_vetor(arquivo, vetores[nome], tipo)
+            if nomes_offsets is not None:
+                nomes_offsets.tofile(arquivo)
+                arquivo.write(texto)
+    
+    @staticmethod
+    def _escrever_vetor(arquivo, vetor, tipo: str):
+        """Escreve um vetor em formato binário little-endian."""
+        if isinstance(vetor, array) and vetor.typecode == tipo:
+            vetor.tofile(arquivo)
+        else:
+            # memoryview de outro arquivo ou sequência qualquer
+            array(tipo, vetor).tofile(arquivo)
+    
+    @staticmethod
+    def abrir(caminho: str) -> Tuple[GrafoCompacto, Optional[NomesArquivo]]:
+        """
+        Abre um grafo salvo, mapeando o arquivo em memória (sem cópia).
+        
+        Args:
+            caminho (str): Caminho do arquivo
+        
+        Returns:
+            Tuple[GrafoCompacto, Optional[NomesArquivo]]: Grafo somente leitura
+                e tabela de nomes (None se o arquivo não tiver nomes)
+        
+        Raises:
+            ValueError: Se o arquivo não é um grafo válido ou tem versão desconhecida
+        """
+        if sys.byteorder != 'little':
+            raise ValueError("Formato binário de grafo requer arquitetura little-endian")
+        
+        with open(caminho, 'rb') as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        if len(mapa) < ArquivoGrafo.TAMANHO_CABECALHO:
+            raise ValueError(f"Arquivo {caminho} é pequeno demais para ser um grafo")
+        
+        magic, versao, flags, n, m, vertices, tamanho_nomes = \
+            ArquivoGrafo.CABECALHO.unpack_from(mapa, 0)
+        
+        if magic != ArquivoGrafo.MAGIC:
+            raise ValueError(f"Arquivo {caminho} não é um grafo binário")
+        if versao != ArquivoGrafo.VERSAO:
+            raise ValueError(f"Versão {versao} do formato não suportada "
+                             f"(esperada: {ArquivoGrafo.VERSAO})")
+        
+        esperado = ArquivoGrafo.TAMANHO_CABECALHO + 8 * (4 * n + 1 + 2 * m)
+        if flags & ArquivoGrafo.FLAG_NOMES:
+            esperado += 8 * (n + 1) + tamanho_nomes
+        if len(mapa) != esperado:
+            raise ValueError(f"Arquivo {caminho} corrompido: {len(mapa)} bytes, "
+                             f"esperados {esperado}")
+        
+        visao = memoryview(mapa)
+        posicao_atual = [ArquivoGrafo.TAMANHO_CABECALHO]
+        
+        def secao(quantidade: int, tipo: str):
+            inicio = posicao_atual[0]
+            posicao_atual[0] += 8 * quantidade
+            return visao[inicio:posicao_atual[0]].cast(tipo)
+        
+        ids = secao(n, 'q')
+        offsets = secao(n + 1, 'q')
+        destinos = secao(m, 'q')
+        pesos = secao(m, 'd')
+        ordem = secao(n, 'q')
+        posicao = secao(n, 'q')
+        
+        grafo = GrafoCompacto(ids, offsets, destinos, pesos, ordem, posicao,
+                              bool(flags & ArquivoGrafo.FLAG_DIRECIONADO), vertices)
+        
+        nomes = None
+        if flags & ArquivoGrafo.FLAG_NOMES:
+            nomes_offsets = secao(n + 1, 'q')
+            inicio = posicao_atual[0]
+            nomes = NomesArquivo(grafo, nomes_offsets,
+                                 visao[inicio:inicio + tamanho_nomes])
+        
+        return grafo, nomes
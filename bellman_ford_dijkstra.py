@@ -17,8 +17,14 @@ DIJKSTRA:
 - Encontra o menor caminho de um vértice origem para todos os outros vértices.
 - NÃO funciona com arestas de peso negativo.
 - Mais eficiente que Bellman-Ford quando não há pesos negativos.
+- Variante bidirecional (consultas origem -> destino): uma busca a partir de
+  cada ponta, parando quando topo_origem + topo_destino >= μ (melhor custo
+  encontrado até então).
 - Usa uma fila de prioridade (heap) para selecionar o próximo vértice.
 - Complexidade: O((V + E) * log V) com heap binário.
+- Fila 'heapq' (padrão): entradas duplicadas, descartadas ao sair do heap.
+  Filas 'binario'/'quaternario' (heap_indexado.py): diminuição de chave,
+  no máximo uma entrada por vértice.
 
 QUANDO USAR CADA UM:
 -------------------
@@ -36,9 +42,44 @@ Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
 Data: Dezembro 2025
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 import heapq
+from eventos import Evento, Visita, Relaxamento, CicloNegativo, Fim
 from grafo import Grafo
+from heap_indexado import criar_heap
+from rastreamento import Rastreador, obter_rastreador
+
+
+def _rastrear_distancias(rastreador: Rastreador, origem: int, vertices: List[int],
+                         distancia: Dict[int, float]):
+    """Envia ao rastreador a tabela de distâncias finais."""
+    rastreador.mensagem(f"\n{'='*70}")
+    rastreador.mensagem(f"DISTÂNCIAS FINAIS A PARTIR DA ORIGEM {origem}:")
+    rastreador.mensagem(f"{'='*70}")
+    
+    for v in sorted(vertices):
+        if distancia[v] == float('inf'):
+            rastreador.mensagem(f"  Vértice {v}: ∞ (não alcançável)")
+        else:
+            rastreador.mensagem(f"  Vértice {v}: {distancia[v]}")
+
+
+def _rastrear_caminho(rastreador: Rastreador, grafo: Grafo, origem: int, destino: int,
+                      caminho: List[int], custo: float):
+    """Envia ao rastreador o menor caminho encontrado e o peso de cada aresta."""
+    rastreador.mensagem(f"\n{'='*70}")
+    rastreador.mensagem(f"MENOR CAMINHO DE {origem} PARA {destino}:")
+    rastreador.mensagem(f"{'='*70}")
+    rastreador.evento('caminho',
+                      f"  Caminho: {' → '.join(map(str, caminho))}\n"
+                      f"  Custo total: {custo}",
+                      caminho=caminho, custo=custo)
+    
+    # Mostra detalhes do caminho
+    rastreador.mensagem(f"\n  Detalhes do caminho:")
+    for i in range(len(caminho) - 1):
+        u, v = caminho[i], caminho[i + 1]
+        rastreador.mensagem(f"    {u} → {v}: peso = {grafo.peso(u, v)}")
 
 
 class BellmanFord:
@@ -47,7 +88,9 @@ class BellmanFord:
     """
     
     @staticmethod
-    def menor_caminho(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Dict:
+    def menor_caminho(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                      mostrar_passos: bool = True,
+                      rastreador: Optional[Rastreador] = None) -> Dict:
         """
         Encontra o menor caminho usando o algoritmo de Bellman-Ford.
         
@@ -65,15 +108,22 @@ class BellmanFord:
             grafo (Grafo): Grafo ponderado
             origem (int): Vértice de origem
             destino (Optional[int]): Vértice de destino (None para calcular para todos)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
             
         Returns:
             Dict: Dicionário contendo:
                 - 'distancia': distância mínima para cada vértice
                 - 'predecessor': predecessor de cada vértice no caminho mínimo
-                - 'caminho': caminho mínimo até o destino (se especificado)
+                - 'caminho': caminho mínimo até o destino (se especificado;
+                  None se houver ciclo negativo, pois o caminho não está definido)
                 - 'tem_ciclo_negativo': True se há ciclo de peso negativo
                 - 'custo': custo total do caminho (se destino especificado)
         """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
         vertices = grafo.obter_vertices()
         
         # Inicialização
@@ -81,28 +131,33 @@ class BellmanFord:
         predecessor = {v: None for v in vertices}
         distancia[origem] = 0
         
-        print(f"\n{'='*70}")
-        print(f"EXECUTANDO BELLMAN-FORD - ALGORITMO DE MENOR CAMINHO")
-        print(f"{'='*70}")
-        print(f"Origem: {origem}")
-        if destino is not None:
-            print(f"Destino: {destino}")
-        print(f"\nNúmero de vértices: {len(vertices)}")
-        print(f"Número de iterações necessárias: {len(vertices) - 1}")
-        
-        print(f"\nInicialização:")
-        print(f"  Distância[{origem}] = 0")
-        print(f"  Distância[outros] = ∞")
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO BELLMAN-FORD - ALGORITMO DE MENOR CAMINHO")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='Bellman-Ford',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+            rastreador.mensagem(f"\nNúmero de vértices: {len(vertices)}")
+            rastreador.mensagem(f"Número de iterações necessárias: {len(vertices) - 1}")
+            
+            rastreador.mensagem(f"\nInicialização:")
+            rastreador.mensagem(f"  Distância[{origem}] = 0")
+            rastreador.mensagem(f"  Distância[outros] = ∞")
         
         # Obtém todas as arestas
         arestas = grafo.obter_arestas()
-        print(f"\nTotal de arestas a serem relaxadas: {len(arestas)}")
+        if ativo:
+            rastreador.mensagem(f"\nTotal de arestas a serem relaxadas: {len(arestas)}")
         
         # Relaxa todas as arestas V-1 vezes
         for iteracao in range(len(vertices) - 1):
-            print(f"\n{'─'*70}")
-            print(f"ITERAÇÃO {iteracao + 1}/{len(vertices) - 1}")
-            print(f"{'─'*70}")
+            if ativo:
+                rastreador.mensagem(f"\n{'─'*70}")
+                rastreador.evento('iteracao', f"ITERAÇÃO {iteracao + 1}/{len(vertices) - 1}",
+                                  iteracao=iteracao + 1, total=len(vertices) - 1)
+                rastreador.mensagem(f"{'─'*70}")
             
             atualizacoes = 0
             
@@ -115,41 +170,41 @@ class BellmanFord:
                     predecessor[v] = u
                     atualizacoes += 1
                     
-                    print(f"  Relaxando aresta {u} → {v} (peso: {peso})")
-                    print(f"    Distância[{v}]: {distancia_antiga if distancia_antiga != float('inf') else '∞'} → {distancia[v]}")
+                    if ativo:
+                        rastreador.evento(
+                            'relaxamento',
+                            f"  Relaxando aresta {u} → {v} (peso: {peso})\n"
+                            f"    Distância[{v}]: {distancia_antiga if distancia_antiga != float('inf') else '∞'} → {distancia[v]}",
+                            u=u, v=v, peso=peso, anterior=distancia_antiga, nova=distancia[v])
             
             if atualizacoes == 0:
-                print(f"  Nenhuma atualização nesta iteração. Algoritmo pode terminar mais cedo!")
+                if ativo:
+                    rastreador.mensagem(f"  Nenhuma atualização nesta iteração. Algoritmo pode terminar mais cedo!")
                 break
-            else:
-                print(f"  Total de atualizações: {atualizacoes}")
+            elif ativo:
+                rastreador.mensagem(f"  Total de atualizações: {atualizacoes}")
         
         # Verifica ciclos de peso negativo
-        print(f"\n{'─'*70}")
-        print(f"VERIFICAÇÃO DE CICLOS NEGATIVOS")
-        print(f"{'─'*70}")
+        if ativo:
+            rastreador.mensagem(f"\n{'─'*70}")
+            rastreador.mensagem(f"VERIFICAÇÃO DE CICLOS NEGATIVOS")
+            rastreador.mensagem(f"{'─'*70}")
         
         tem_ciclo_negativo = False
         for u, v, peso in arestas:
             if distancia[u] != float('inf') and distancia[u] + peso < distancia[v]:
                 tem_ciclo_negativo = True
-                print(f"  ⚠ CICLO NEGATIVO DETECTADO!")
-                print(f"  Aresta {u} → {v} ainda pode ser relaxada")
+                if ativo:
+                    rastreador.evento('ciclo_negativo',
+                                      f"  ⚠ CICLO NEGATIVO DETECTADO!\n"
+                                      f"  Aresta {u} → {v} ainda pode ser relaxada",
+                                      u=u, v=v, peso=peso)
                 break
         
-        if not tem_ciclo_negativo:
-            print(f"  ✓ Nenhum ciclo negativo detectado")
-        
-        # Mostra resultado final
-        print(f"\n{'='*70}")
-        print(f"DISTÂNCIAS FINAIS A PARTIR DA ORIGEM {origem}:")
-        print(f"{'='*70}")
-        
-        for v in sorted(vertices):
-            if distancia[v] == float('inf'):
-                print(f"  Vértice {v}: ∞ (não alcançável)")
-            else:
-                print(f"  Vértice {v}: {distancia[v]}")
+        if ativo:
+            if not tem_ciclo_negativo:
+                rastreador.mensagem(f"  ✓ Nenhum ciclo negativo detectado")
+            _rastrear_distancias(rastreador, origem, vertices, distancia)
         
         # Reconstrói o caminho se um destino foi especificado
         caminho = None
@@ -157,28 +212,22 @@ class BellmanFord:
         
         if destino is not None:
             if distancia[destino] == float('inf'):
-                print(f"\n✗ Não há caminho de {origem} para {destino}")
+                if ativo:
+                    rastreador.evento('sem_caminho',
+                                      f"\n✗ Não há caminho de {origem} para {destino}",
+                                      destino=destino)
+            elif tem_ciclo_negativo:
+                # Os predecessores podem formar um laço: não há menor caminho
+                if ativo:
+                    rastreador.evento('sem_caminho',
+                                      f"\n✗ Menor caminho de {origem} para {destino} indefinido "
+                                      f"(ciclo negativo)",
+                                      destino=destino)
             else:
                 caminho = BellmanFord._reconstruir_caminho(predecessor, origem, destino)
                 custo = distancia[destino]
-                
-                print(f"\n{'='*70}")
-                print(f"MENOR CAMINHO DE {origem} PARA {destino}:")
-                print(f"{'='*70}")
-                print(f"  Caminho: {' → '.join(map(str, caminho))}")
-                print(f"  Custo total: {custo}")
-                
-                # Mostra detalhes do caminho
-                print(f"\n  Detalhes do caminho:")
-                for i in range(len(caminho) - 1):
-                    u, v = caminho[i], caminho[i + 1]
-                    # Encontra o peso da aresta
-                    peso_aresta = None
-                    for vizinho, peso in grafo.obter_vizinhos(u):
-                        if vizinho == v:
-                            peso_aresta = peso
-                            break
-                    print(f"    {u} → {v}: peso = {peso_aresta}")
+                if ativo:
+                    _rastrear_caminho(rastreador, grafo, origem, destino, caminho, custo)
         
         return {
             'distancia': distancia,
@@ -188,6 +237,59 @@ class BellmanFord:
             'custo': custo
         }
     
+    @staticmethod
+    def passos(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Iterator[Evento]:
+        """
+        Executa o Bellman-Ford passo a passo (gerador de eventos).
+        
+        Args:
+            grafo (Grafo): Grafo ponderado
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para calcular para todos)
+            
+        Yields:
+            Evento: Relaxamento (distância melhorada), CicloNegativo (se
+                houver) e, por último, Fim com o mesmo resultado de
+                BellmanFord.menor_caminho
+        """
+        vertices = grafo.obter_vertices()
+        distancia = {v: float('inf') for v in vertices}
+        predecessor = {v: None for v in vertices}
+        distancia[origem] = 0
+        arestas = grafo.obter_arestas()
+        
+        for iteracao in range(len(vertices) - 1):
+            atualizacoes = 0
+            for u, v, peso in arestas:
+                if distancia[u] != float('inf') and distancia[u] + peso < distancia[v]:
+                    distancia[v] = distancia[u] + peso
+                    predecessor[v] = u
+                    atualizacoes += 1
+                    yield Relaxamento(u, v, peso, distancia[v])
+            if atualizacoes == 0:
+                break
+        
+        tem_ciclo_negativo = False
+        for u, v, peso in arestas:
+            if distancia[u] != float('inf') and distancia[u] + peso < distancia[v]:
+                tem_ciclo_negativo = True
+                yield CicloNegativo(u, v, peso)
+                break
+        
+        caminho = None
+        custo = None
+        if destino is not None and distancia[destino] != float('inf') and not tem_ciclo_negativo:
+            caminho = BellmanFord._reconstruir_caminho(predecessor, origem, destino)
+            custo = distancia[destino]
+        
+        yield Fim({
+            'distancia': distancia,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'tem_ciclo_negativo': tem_ciclo_negativo,
+            'custo': custo
+        })
+    
     @staticmethod
     def _reconstruir_caminho(predecessor: Dict, origem: int, destino: int) -> List[int]:
         """Reconstrói o caminho do destino até a origem."""
@@ -208,7 +310,10 @@ class Dijkstra:
     """
     
     @staticmethod
-    def menor_caminho(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Dict:
+    def menor_caminho(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                      mostrar_passos: bool = True,
+                      rastreador: Optional[Rastreador] = None,
+                      fila: str = 'heapq') -> Dict:
         """
         Encontra o menor caminho usando o algoritmo de Dijkstra.
         
@@ -221,12 +326,17 @@ class Dijkstra:
               Se dist[u] + peso(u,v) < dist[v]:
                  dist[v] = dist[u] + peso(u,v)
                  predecessor[v] = u
-                 Adiciona v na fila de prioridade
+                 Adiciona v na fila de prioridade (ou diminui sua chave)
         
         Args:
             grafo (Grafo): Grafo ponderado (pesos não-negativos)
             origem (int): Vértice de origem
             destino (Optional[int]): Vértice de destino (None para calcular para todos)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            fila (str): Fila de prioridade: 'heapq' (remoção preguiçosa),
+                'binario' ou 'quaternario' (heap indexado com diminuição de chave)
             
         Returns:
             Dict: Dicionário contendo:
@@ -235,7 +345,15 @@ class Dijkstra:
                 - 'caminho': caminho mínimo até o destino (se especificado)
                 - 'custo': custo total do caminho (se destino especificado)
                 - 'vertices_visitados': ordem de visita dos vértices
+                - 'estatisticas_fila': inserções, remoções, diminuições de
+                  chave e tamanho máximo da fila
+            
+        Raises:
+            ValueError: Se a fila não for conhecida
         """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
         vertices = grafo.obter_vertices()
         
         # Inicialização
@@ -246,45 +364,77 @@ class Dijkstra:
         vertices_visitados = []
         
         # Fila de prioridade (heap): (distância, vértice)
-        heap = [(0, origem)]
-        
-        print(f"\n{'='*70}")
-        print(f"EXECUTANDO DIJKSTRA - ALGORITMO DE MENOR CAMINHO")
-        print(f"{'='*70}")
-        print(f"Origem: {origem}")
-        if destino is not None:
-            print(f"Destino: {destino}")
-        print(f"\nNúmero de vértices: {len(vertices)}")
-        
-        print(f"\nInicialização:")
-        print(f"  Distância[{origem}] = 0")
-        print(f"  Distância[outros] = ∞")
-        print(f"  Heap inicial: [(0, {origem})]")
+        indexado = fila != 'heapq'
+        if indexado:
+            # Heap indexado sobre ids densos: índice na lista (ordenada) de vértices
+            itens = vertices
+            indice = {v: i for i, v in enumerate(itens)}
+            if origem not in indice:
+                # Origem sem arestas (fora de obter_vertices): último índice,
+                # como no heapq, que a visita mesmo assim
+                indice[origem] = len(itens)
+                itens = itens + [origem]
+            heap = criar_heap(fila, len(itens))
+            heap.inserir(indice[origem], 0)
+        else:
+            heap = [(0, origem)]
+        remocoes = 0
+        tamanho_maximo = 0
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO DIJKSTRA - ALGORITMO DE MENOR CAMINHO")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='Dijkstra',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+            rastreador.mensagem(f"\nNúmero de vértices: {len(vertices)}")
+            
+            rastreador.mensagem(f"\nInicialização:")
+            rastreador.mensagem(f"  Distância[{origem}] = 0")
+            rastreador.mensagem(f"  Distância[outros] = ∞")
+            rastreador.mensagem(f"  Heap inicial: [(0, {origem})]")
         
         passo = 1
         
         # Loop principal
         while heap:
             # Remove o vértice com menor distância
-            dist_u, u = heapq.heappop(heap)
-            
-            # Se já foi visitado, pula (pode haver duplicatas no heap)
-            if u in visitados:
-                continue
+            if indexado:
+                dist_u, i = heap.remover_minimo()
+                u = itens[i]
+            else:
+                # O tamanho máximo do heap sempre é atingido logo antes de uma remoção
+                if len(heap) > tamanho_maximo:
+                    tamanho_maximo = len(heap)
+                remocoes += 1
+                dist_u, u = heapq.heappop(heap)
+                
+                # Se já foi visitado, pula (pode haver duplicatas no heap)
+                if u in visitados:
+                    continue
             
             visitados.add(u)
             vertices_visitados.append(u)
             
-            print(f"\n{'─'*70}")
-            print(f"PASSO {passo}")
-            print(f"{'─'*70}")
-            print(f"  Processando vértice: {u}")
-            print(f"  Distância atual: {dist_u}")
-            print(f"  Vértices restantes no heap: {len(heap)}")
+            if ativo:
+                rastreador.mensagem(f"\n{'─'*70}")
+                rastreador.mensagem(f"PASSO {passo}")
+                rastreador.mensagem(f"{'─'*70}")
+                rastreador.evento('visita',
+                                  f"  Processando vértice: {u}\n"
+                                  f"  Distância atual: {dist_u}\n"
+                                  f"  Vértices restantes no heap: {len(heap)}",
+                                  passo=passo, vertice=u, distancia=dist_u,
+                                  tamanho_heap=len(heap))
             
             # Se chegou no destino, pode parar (otimização)
             if destino is not None and u == destino:
-                print(f"\n  ✓ Destino {destino} alcançado! Parando busca.")
+                if ativo:
+                    rastreador.evento('destino',
+                                      f"\n  ✓ Destino {destino} alcançado! Parando busca.",
+                                      vertice=destino)
                 break
             
             # Relaxa arestas dos vizinhos
@@ -297,58 +447,311 @@ class Dijkstra:
                         distancia_antiga = distancia[v]
                         distancia[v] = nova_distancia
                         predecessor[v] = u
-                        heapq.heappush(heap, (nova_distancia, v))
+                        if indexado:
+                            heap.inserir_ou_diminuir(indice[v], nova_distancia)
+                        else:
+                            heapq.heappush(heap, (nova_distancia, v))
                         atualizacoes += 1
                         
-                        print(f"  Relaxando aresta {u} → {v} (peso: {peso})")
-                        print(f"    Distância[{v}]: {distancia_antiga if distancia_antiga != float('inf') else '∞'} → {nova_distancia}")
+                        if ativo:
+                            rastreador.evento(
+                                'relaxamento',
+                                f"  Relaxando aresta {u} → {v} (peso: {peso})\n"
+                                f"    Distância[{v}]: {distancia_antiga if distancia_antiga != float('inf') else '∞'} → {nova_distancia}",
+                                u=u, v=v, peso=peso, anterior=distancia_antiga, nova=nova_distancia)
             
-            if atualizacoes == 0:
-                print(f"  Nenhum vizinho foi atualizado")
-            else:
-                print(f"  Total de atualizações: {atualizacoes}")
+            if ativo:
+                if atualizacoes == 0:
+                    rastreador.mensagem(f"  Nenhum vizinho foi atualizado")
+                else:
+                    rastreador.mensagem(f"  Total de atualizações: {atualizacoes}")
             
             passo += 1
         
-        # Mostra resultado final
-        print(f"\n{'='*70}")
-        print(f"DISTÂNCIAS FINAIS A PARTIR DA ORIGEM {origem}:")
-        print(f"{'='*70}")
+        if indexado:
+            estatisticas_fila = heap.estatisticas()
+        else:
+            # Toda entrada inserida foi removida ou ainda está no heap
+            estatisticas_fila = {
+                'insercoes': remocoes + len(heap),
+                'remocoes': remocoes,
+                'diminuicoes': 0,
+                'tamanho_maximo': tamanho_maximo
+            }
         
-        for v in sorted(vertices):
-            if distancia[v] == float('inf'):
-                print(f"  Vértice {v}: ∞ (não alcançável)")
-            else:
-                print(f"  Vértice {v}: {distancia[v]}")
+        if ativo:
+            _rastrear_distancias(rastreador, origem, vertices, distancia)
         
         # Reconstrói o caminho se um destino foi especificado
         caminho = None
         custo = None
         
         if destino is not None:
-            if distancia[destino] == float('inf'):
-                print(f"\n✗ Não há caminho de {origem} para {destino}")
+            # Destino sem arestas: fora de distancia, sem caminho
+            if distancia.get(destino, float('inf')) == float('inf'):
+                if ativo:
+                    rastreador.evento('sem_caminho',
+                                      f"\n✗ Não há caminho de {origem} para {destino}",
+                                      destino=destino)
             else:
                 caminho = Dijkstra._reconstruir_caminho(predecessor, origem, destino)
                 custo = distancia[destino]
-                
-                print(f"\n{'='*70}")
-                print(f"MENOR CAMINHO DE {origem} PARA {destino}:")
-                print(f"{'='*70}")
-                print(f"  Caminho: {' → '.join(map(str, caminho))}")
-                print(f"  Custo total: {custo}")
-                
-                # Mostra detalhes do caminho
-                print(f"\n  Detalhes do caminho:")
-                for i in range(len(caminho) - 1):
-                    u, v = caminho[i], caminho[i + 1]
-                    # Encontra o peso da aresta
-                    peso_aresta = None
-                    for vizinho, peso in grafo.obter_vizinhos(u):
-                        if vizinho == v:
-                            peso_aresta = peso
-                            break
-                    print(f"    {u} → {v}: peso = {peso_aresta}")
+                if ativo:
+                    _rastrear_caminho(rastreador, grafo, origem, destino, caminho, custo)
+        
+        return {
+            'distancia': distancia,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'custo': custo,
+            'vertices_visitados': vertices_visitados,
+            'estatisticas_fila': estatisticas_fila
+        }
+    
+    @staticmethod
+    def menor_caminho_multiplas_origens(grafo: Grafo, origens: Iterable[int],
+                                        mostrar_passos: bool = True,
+                                        rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Calcula, em uma única execução, a distância de cada vértice até a
+        origem mais próxima (ex.: a farmácia mais próxima de cada ponto do mapa).
+        
+        FUNCIONAMENTO:
+        - Todas as origens entram no heap com distância 0, como se houvesse
+          um vértice fictício ligado a cada uma delas por arestas de peso 0
+        - O Dijkstra segue normalmente; cada relaxamento propaga também a
+          origem de quem relaxou
+        - Custo O((V + E) log V), igual a um único Dijkstra, em vez de um
+          Dijkstra por origem
+        
+        Args:
+            grafo (Grafo): Grafo ponderado (pesos não-negativos)
+            origens (Iterable[int]): Vértices de origem
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Dicionário contendo:
+                - 'distancia': distância até a origem mais próxima (infinito se inalcançável)
+                - 'origem_mais_proxima': origem mais próxima de cada vértice (None se inalcançável)
+                - 'predecessor': predecessor de cada vértice no caminho mínimo
+                - 'vertices_visitados': ordem de visita dos vértices
+            
+        Raises:
+            ValueError: Se nenhuma origem for informada
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        origens = list(dict.fromkeys(origens))  # Remove repetidas, mantendo a ordem
+        if not origens:
+            raise ValueError("É necessário informar ao menos uma origem")
+        
+        vertices = grafo.obter_vertices()
+        distancia = {v: float('inf') for v in vertices}
+        predecessor = {v: None for v in vertices}
+        origem_mais_proxima = {v: None for v in vertices}
+        for o in origens:
+            distancia[o] = 0
+            predecessor[o] = None
+            origem_mais_proxima[o] = o
+        visitados = set()
+        vertices_visitados = []
+        
+        # (distância, posição da origem, vértice): em empates, vence a
+        # origem que aparece primeiro na lista
+        indice_origem = {o: i for i, o in enumerate(origens)}
+        heap = [(0, i, o) for i, o in enumerate(origens)]
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO DIJKSTRA - MÚLTIPLAS ORIGENS")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Origens: {origens}", algoritmo='Dijkstra',
+                              origem=origens[0], destino=None, origens=origens)
+        
+        while heap:
+            dist_u, _, u = heapq.heappop(heap)
+            if u in visitados:
+                continue
+            
+            visitados.add(u)
+            vertices_visitados.append(u)
+            origem_u = origem_mais_proxima[u]
+            
+            if ativo:
+                rastreador.evento('visita',
+                                  f"  Processando {u}: distância {dist_u} até {origem_u}",
+                                  vertice=u, distancia=dist_u, origem=origem_u,
+                                  tamanho_heap=len(heap))
+            
+            for v, peso in grafo.obter_vizinhos(u):
+                if v not in visitados:
+                    nova_distancia = dist_u + peso
+                    if nova_distancia < distancia[v]:
+                        distancia_antiga = distancia[v]
+                        distancia[v] = nova_distancia
+                        predecessor[v] = u
+                        origem_mais_proxima[v] = origem_u
+                        heapq.heappush(heap, (nova_distancia, indice_origem[origem_u], v))
+                        
+                        if ativo:
+                            rastreador.evento(
+                                'relaxamento',
+                                f"    Distância[{v}]: {distancia_antiga if distancia_antiga != float('inf') else '∞'} → {nova_distancia} (origem {origem_u})",
+                                u=u, v=v, peso=peso, anterior=distancia_antiga, nova=nova_distancia)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"ORIGEM MAIS PRÓXIMA DE CADA VÉRTICE:")
+            rastreador.mensagem(f"{'='*70}")
+            for v in sorted(vertices):
+                if origem_mais_proxima[v] is None:
+                    rastreador.mensagem(f"  Vértice {v}: ∞ (não alcançável)")
+                else:
+                    rastreador.mensagem(f"  Vértice {v}: {distancia[v]} (origem {origem_mais_proxima[v]})")
+            rastreador.evento('fim', f"\nTotal de vértices alcançados: {len(vertices_visitados)}",
+                              visitados=len(vertices_visitados))
+        
+        return {
+            'distancia': distancia,
+            'origem_mais_proxima': origem_mais_proxima,
+            'predecessor': predecessor,
+            'vertices_visitados': vertices_visitados
+        }
+    
+    @staticmethod
+    def menor_caminho_bidirecional(grafo: Grafo, origem: int, destino: int,
+                                   mostrar_passos: bool = True,
+                                   rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Encontra o menor caminho de origem a destino com duas buscas de
+        Dijkstra: uma a partir da origem e outra a partir do destino.
+        
+        FUNCIONAMENTO:
+        1. A busca da origem segue as arestas de saída; a do destino, as
+           arestas de entrada (obter_predecessores)
+        2. A cada passo avança o lado cujo heap tem a menor distância
+        3. Ao relaxar uma aresta até um vértice já alcançado pelo outro lado,
+           atualiza μ = melhor dist_origem[v] + dist_destino[v] conhecido
+        4. Para quando topo_origem + topo_destino >= μ: nenhum caminho
+           ainda não examinado pode ser menor que μ
+        
+        Cada lado cresce uma "bola" de raio próximo a metade da distância,
+        então em malhas viárias são fixados cerca de metade dos vértices do
+        Dijkstra unidirecional com destino.
+        
+        Args:
+            grafo (Grafo): Grafo ponderado (pesos não-negativos)
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Mesmas chaves de Dijkstra.menor_caminho, exceto
+                'estatisticas_fila'. 'distancia' e 'predecessor' cobrem os
+                vértices alcançados a partir da origem e os vértices do
+                caminho; 'vertices_visitados' lista os vértices fixados
+                pelos dois lados, na ordem em que foram fixados
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO DIJKSTRA BIDIRECIONAL")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='Dijkstra',
+                              origem=origem, destino=destino)
+            rastreador.mensagem(f"Destino: {destino}")
+        
+        # Lado da origem: distância e predecessor; lado do destino: distância e sucessor
+        distancia = {origem: 0}
+        predecessor = {origem: None}
+        distancia_destino = {destino: 0}
+        sucessor = {destino: None}
+        fixados_origem = set()
+        fixados_destino = set()
+        heap_origem = [(0, origem)]
+        heap_destino = [(0, destino)]
+        vertices_visitados = []
+        
+        melhor = 0 if origem == destino else float('inf')  # μ
+        encontro = origem if origem == destino else None
+        
+        while heap_origem and heap_destino:
+            if heap_origem[0][0] + heap_destino[0][0] >= melhor:
+                break
+            
+            # Avança o lado com a menor distância no topo do heap
+            if heap_origem[0][0] <= heap_destino[0][0]:
+                lado = 'origem'
+                heap, fixados = heap_origem, fixados_origem
+                dist_lado, anterior, dist_outro = distancia, predecessor, distancia_destino
+                obter_vizinhos = grafo.obter_vizinhos
+            else:
+                lado = 'destino'
+                heap, fixados = heap_destino, fixados_destino
+                dist_lado, anterior, dist_outro = distancia_destino, sucessor, distancia
+                obter_vizinhos = grafo.obter_predecessores
+            
+            dist_u, u = heapq.heappop(heap)
+            if u in fixados:
+                continue
+            fixados.add(u)
+            vertices_visitados.append(u)
+            
+            if ativo:
+                rastreador.evento('visita',
+                                  f"  Lado {lado}: processando {u} (distância {dist_u})",
+                                  lado=lado, vertice=u, distancia=dist_u,
+                                  tamanho_heap=len(heap))
+            
+            for v, peso in obter_vizinhos(u):
+                if v in fixados:
+                    continue
+                nova_distancia = dist_u + peso
+                if nova_distancia < dist_lado.get(v, float('inf')):
+                    dist_lado[v] = nova_distancia
+                    anterior[v] = u
+                    heapq.heappush(heap, (nova_distancia, v))
+                    
+                    # Caminho completo passando por v: candidato a μ
+                    if v in dist_outro and nova_distancia + dist_outro[v] < melhor:
+                        melhor = nova_distancia + dist_outro[v]
+                        encontro = v
+                        if ativo:
+                            rastreador.evento('encontro',
+                                              f"    Caminho passando por {v}: custo {melhor}",
+                                              vertice=v, custo=melhor)
+        
+        caminho = None
+        custo = None
+        
+        if encontro is not None:
+            # Origem -> encontro pelos predecessores, encontro -> destino pelos sucessores
+            caminho = Dijkstra._reconstruir_caminho(predecessor, origem, encontro)
+            atual = sucessor[encontro]
+            while atual is not None:
+                distancia[atual] = melhor - distancia_destino[atual]
+                predecessor[atual] = caminho[-1]
+                caminho.append(atual)
+                atual = sucessor[atual]
+            custo = melhor
+            if ativo:
+                _rastrear_caminho(rastreador, grafo, origem, destino, caminho, custo)
+        elif ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Não há caminho de {origem} para {destino}",
+                              destino=destino)
+        
+        if ativo:
+            rastreador.evento('fim',
+                              f"\nTotal de vértices fixados (dois lados): {len(vertices_visitados)}",
+                              visitados=len(vertices_visitados))
         
         return {
             'distancia': distancia,
@@ -358,6 +761,75 @@ class Dijkstra:
             'vertices_visitados': vertices_visitados
         }
     
+    @staticmethod
+    def passos(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Iterator[Evento]:
+        """
+        Executa o Dijkstra passo a passo (gerador de eventos).
+        
+        Args:
+            grafo (Grafo): Grafo ponderado (pesos não-negativos)
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para calcular para todos)
+            
+        Yields:
+            Evento: Visita (vértice retirado do heap, com sua distância final),
+                Relaxamento (distância melhorada) e, por último, Fim com o
+                mesmo resultado de Dijkstra.menor_caminho
+        """
+        vertices = grafo.obter_vertices()
+        distancia = {v: float('inf') for v in vertices}
+        predecessor = {v: None for v in vertices}
+        distancia[origem] = 0
+        visitados = set()
+        vertices_visitados = []
+        heap = [(0, origem)]
+        remocoes = 0
+        tamanho_maximo = 0
+        
+        while heap:
+            if len(heap) > tamanho_maximo:
+                tamanho_maximo = len(heap)
+            remocoes += 1
+            dist_u, u = heapq.heappop(heap)
+            if u in visitados:
+                continue
+            
+            visitados.add(u)
+            vertices_visitados.append(u)
+            yield Visita(u, dist_u)
+            
+            if destino is not None and u == destino:
+                break
+            
+            for v, peso in grafo.obter_vizinhos(u):
+                if v not in visitados:
+                    nova_distancia = distancia[u] + peso
+                    if nova_distancia < distancia[v]:
+                        distancia[v] = nova_distancia
+                        predecessor[v] = u
+                        heapq.heappush(heap, (nova_distancia, v))
+                        yield Relaxamento(u, v, peso, nova_distancia)
+        
+        caminho = None
+        custo = None
+        if destino is not None and distancia.get(destino, float('inf')) != float('inf'):
+            caminho = Dijkstra._reconstruir_caminho(predecessor, origem, destino)
+            custo = distancia[destino]
+        
+        yield Fim({
+            'distancia': distancia,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'custo': custo,
+            'vertices_visitados': vertices_visitados,
+            'estatisticas_fila': {
+                'insercoes': remocoes + len(heap),
+                'remocoes': remocoes,
+                'diminuicoes': 0,
+                'tamanho_maximo': tamanho_maximo
+            }
+        })
+    
     @staticmethod
     def _reconstruir_caminho(predecessor: Dict, origem: int, destino: int) -> List[int]:
         """Reconstrói o caminho do destino até a origem."""
@@ -366,7 +838,8 @@ class Dijkstra:
         
         while atual is not None:
             caminho.append(atual)
-            atual = predecessor[atual]
+            # A origem pode não estar em predecessor (vértice sem arestas)
+            atual = predecessor.get(atual)
         
         caminho.reverse()
         return caminho
@@ -432,6 +905,29 @@ def demonstrar_bellman_ford_dijkstra():
     print(f"\nObservações:")
     print(f"- Bellman-Ford: Funciona com pesos negativos, complexidade O(V*E)")
     print(f"- Dijkstra: Mais eficiente, mas requer pesos não-negativos, O((V+E)logV)")
+    
+    # Dijkstra bidirecional: mesmo custo, menos vértices fixados
+    resultado_bi = Dijkstra.menor_caminho_bidirecional(grafo, 0, 5, mostrar_passos=False)
+    print(f"\nDijkstra bidirecional:")
+    print(f"  Custo: {resultado_bi['custo']} km")
+    print(f"  Vértices fixados: {len(resultado_bi['vertices_visitados'])} "
+          f"(unidirecional: {len(resultado_dijk['vertices_visitados'])})")
+    
+    # Dijkstra com múltiplas origens
+    print("\n" + "="*70)
+    print("EXEMPLO 3: DIJKSTRA COM MÚLTIPLAS ORIGENS")
+    print("Serviço de saúde (Hospital ou Farmácia) mais próximo de cada local")
+    print("="*70)
+    servicos_saude = [3, 14]
+    resultado_saude = Dijkstra.menor_caminho_multiplas_origens(grafo, servicos_saude,
+                                                               mostrar_passos=False)
+    
+    for v in sorted(grafo.obter_vertices()):
+        mais_proximo = resultado_saude['origem_mais_proxima'][v]
+        print(f"  {nomes[v]:<18} → {nomes[mais_proximo]:<9} "
+              f"({resultado_saude['distancia'][v]:.1f} km)")
+    
+    print(f"\nUma única execução do Dijkstra, em vez de uma por serviço de saúde")
 
 
 if __name__ == "__main__":
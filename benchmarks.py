@@ -0,0 +1,813 @@
+"""
+Benchmarks de Desempenho
+========================
+Medições de tempo e memória das estruturas e algoritmos para grafos grandes.
+
+Cada benchmark também confere se os resultados das versões comparadas são
+iguais, servindo como verificação rápida de consistência.
+
+Execute com:
+    python benchmarks.py
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from grafo import Grafo
+
+
+def _cronometrar(funcao, *args, **kwargs):
+    """
+    Executa uma função e mede o tempo gasto.
+    
+    Returns:
+        Tuple: (resultado da função, tempo em segundos)
+    """
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def _lista_arestas_aleatoria(num_vertices: int, num_arestas: int, semente: int = 42):
+    """Gera uma lista de arestas aleatórias (origem, destino, peso)."""
+    rng = random.Random(semente)
+    return [(rng.randrange(num_vertices), rng.randrange(num_vertices), rng.uniform(1, 100))
+            for _ in range(num_arestas)]
+
+
+def benchmark_arquivo_grafo(num_vertices: int = 100_000, num_arestas: int = 500_000):
+    """
+    Compara abrir um grafo do arquivo binário (mmap) com reconstruí-lo
+    a partir da lista de arestas, e confere a ida e volta salvar/abrir.
+    
+    Args:
+        num_vertices (int): Número de vértices do grafo aleatório
+        num_arestas (int): Número de arestas do grafo aleatório
+    """
+    from arquivo_grafo import ArquivoGrafo
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: ARQUIVO BINÁRIO (MMAP) vs RECONSTRUÇÃO")
+    print(f"{'='*70}")
+    print(f"Vértices: {num_vertices}  Arestas: {num_arestas}")
+    
+    arestas = _lista_arestas_aleatoria(num_vertices, num_arestas)
+    
+    def reconstruir():
+        g = Grafo(num_vertices, direcionado=False)
+        for u, v, peso in arestas:
+            g.adicionar_aresta(u, v, peso)
+        return g
+    
+    grafo, t_reconstruir = _cronometrar(reconstruir)
+    nomes = {v: f"v{v}" for v in grafo.obter_vertices()}
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'grafo.bin')
+        _, t_salvar = _cronometrar(ArquivoGrafo.salvar, grafo, caminho, nomes)
+        (aberto, nomes_abertos), t_abrir = _cronometrar(ArquivoGrafo.abrir, caminho)
+        
+        # Primeira consulta após a abertura
+        origem = arestas[0][0]
+        _, t_consulta = _cronometrar(aberto.obter_vizinhos, origem)
+        
+        # Ida e volta: o grafo aberto deve ser idêntico ao original
+        assert aberto.direcionado == grafo.direcionado
+        assert aberto.obter_vertices() == grafo.obter_vertices()
+        for v in grafo.obter_vertices()[:1000]:
+            assert aberto.obter_vizinhos(v) == [(d, float(p)) for d, p in grafo.obter_vizinhos(v)]
+            assert nomes_abertos[v] == nomes[v]
+        assert len(aberto.obter_arestas()) == len(grafo.obter_arestas())
+        
+        tamanho = os.path.getsize(caminho)
+        del aberto, nomes_abertos
+    
+    print(f"\nReconstruir com adicionar_aresta: {t_reconstruir:.3f} s")
+    print(f"Salvar arquivo binário:           {t_salvar:.3f} s ({tamanho / 2**20:.1f} MiB)")
+    print(f"Abrir arquivo (mmap):             {t_abrir * 1000:.3f} ms")
+    print(f"Primeira consulta de vizinhos:    {t_consulta * 1000:.3f} ms")
+    print(f"✓ Ida e volta salvar/abrir preserva vértices, arestas e nomes")
+
+
+def benchmark_insercao_em_lote(num_vertices: int = 100_000, num_arestas: int = 500_000):
+    """
+    Compara adicionar_aresta (uma chamada por aresta) com adicionar_arestas
+    (inserção em lote) e confere se os grafos resultantes são idênticos.
+    
+    Args:
+        num_vertices (int): Número de vértices do grafo aleatório
+        num_arestas (int): Número de arestas do grafo aleatório
+    """
+    from array import array
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: INSERÇÃO ARESTA A ARESTA vs EM LOTE")
+    print(f"{'='*70}")
+    print(f"Vértices: {num_vertices}  Arestas: {num_arestas}")
+    
+    arestas = _lista_arestas_aleatoria(num_vertices, num_arestas)
+    origens = array('q', (u for u, _, _ in arestas))
+    destinos = array('q', (v for _, v, _ in arestas))
+    pesos = array('d', (p for _, _, p in arestas))
+    
+    def aresta_a_aresta():
+        g = Grafo(num_vertices, direcionado=False)
+        for u, v, peso in arestas:
+            g.adicionar_aresta(u, v, peso)
+        return g
+    
+    def em_lote():
+        g = Grafo(num_vertices, direcionado=False)
+        g.adicionar_arestas(origens, destinos, pesos)
+        return g
+    
+    g1, t_individual = _cronometrar(aresta_a_aresta)
+    g2, t_lote = _cronometrar(em_lote)
+    
+    assert g1.obter_arestas() == g2.obter_arestas()
+    assert g1.obter_vertices() == g2.obter_vertices()
+    
+    print(f"\nadicionar_aresta (uma chamada por aresta): {t_individual:.3f} s")
+    print(f"adicionar_arestas (em lote):               {t_lote:.3f} s")
+    print(f"Aceleração: {t_individual / t_lote:.2f}x")
+    print(f"✓ Os dois grafos são idênticos")
+
+
+def benchmark_rastreamento(num_vertices: int = 20_000, arestas_por_vertice: int = 3):
+    """
+    Compara os algoritmos com o rastreador nulo (mostrar_passos=False) e com
+    o texto dos passos descartado em memória (como a GUI fazia antes).
+    
+    Args:
+        num_vertices (int): Número de vértices do grafo Barabási–Albert
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+    """
+    import contextlib
+    import io
+    from bfs_dfs import BFS
+    from bellman_ford_dijkstra import Dijkstra
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: CUSTO DO RASTREAMENTO (PRINT) NOS ALGORITMOS")
+    print(f"{'='*70}")
+    
+    grafo = GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice,
+                                          distribuicao_pesos='uniforme')
+    print(f"Vértices: {num_vertices}  Arestas: {len(grafo.obter_arestas())}")
+    
+    for nome, algoritmo in (("BFS", BFS.buscar), ("Dijkstra", Dijkstra.menor_caminho)):
+        silencioso, t_silencioso = _cronometrar(algoritmo, grafo, 0, mostrar_passos=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            detalhado, t_detalhado = _cronometrar(algoritmo, grafo, 0)
+        
+        assert silencioso['distancia'] == detalhado['distancia']
+        
+        print(f"\n{nome}:")
+        print(f"  Com passos (texto descartado): {t_detalhado:.3f} s")
+        print(f"  mostrar_passos=False:          {t_silencioso:.3f} s")
+        print(f"  Aceleração: {t_detalhado / t_silencioso:.1f}x")
+    
+    print(f"\n✓ Resultados idênticos com e sem rastreamento")
+
+
+def benchmark_bfs_bidirecional(num_vertices: int = 200_000, arestas_por_vertice: int = 3,
+                               consultas: int = 20):
+    """
+    Compara BFS.buscar e BFS.buscar_bidirecional em consultas ponto a ponto
+    (graus de separação) em uma rede no estilo rede social.
+    
+    Args:
+        num_vertices (int): Número de vértices do grafo Barabási–Albert
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+        consultas (int): Número de pares (origem, destino) sorteados
+    """
+    from bfs_dfs import BFS
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: BFS UNIDIRECIONAL vs BIDIRECIONAL (PONTO A PONTO)")
+    print(f"{'='*70}")
+    
+    rng = random.Random(7)
+    for direcionado in (False, True):
+        if direcionado:
+            grafo = GeradorGrafos.erdos_renyi(num_vertices, num_arestas=num_vertices * arestas_por_vertice,
+                                              direcionado=True)
+            descricao = "Erdős–Rényi direcionado"
+        else:
+            grafo = GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice)
+            descricao = "Barabási–Albert"
+        pares = [(rng.randrange(num_vertices), rng.randrange(num_vertices))
+                 for _ in range(consultas)]
+        
+        t_uni = t_bi = 0.0
+        expandidos_uni = expandidos_bi = 0
+        for origem, destino in pares:
+            uni, t = _cronometrar(BFS.buscar, grafo, origem, destino, mostrar_passos=False)
+            t_uni += t
+            bi, t = _cronometrar(BFS.buscar_bidirecional, grafo, origem, destino,
+                                 mostrar_passos=False)
+            t_bi += t
+            
+            assert uni['encontrado'] == bi['encontrado']
+            if uni['caminho']:
+                assert len(uni['caminho']) == len(bi['caminho'])
+            expandidos_uni += len(uni['visitados'])
+            expandidos_bi += len(bi['visitados'])
+        
+        print(f"\n{descricao} - Vértices: {num_vertices}  Consultas: {consultas}")
+        print(f"  Unidirecional: {t_uni:.3f} s  ({expandidos_uni // consultas} vértices expandidos por consulta)")
+        print(f"  Bidirecional:  {t_bi:.3f} s  ({expandidos_bi // consultas} vértices expandidos por consulta)")
+        print(f"  Aceleração: {t_uni / t_bi:.1f}x")
+    
+    print(f"\n✓ Mesmo número de arestas no caminho nas duas versões")
+
+
+def benchmark_bfs_direcao(num_vertices: int = 300_000, arestas_por_vertice: int = 4):
+    """
+    Compara BFS.buscar com a BFS otimizada por direção (top-down/bottom-up)
+    em grafos com distribuição de graus em lei de potência.
+    
+    A versão só top-down sobre os mesmos vetores CSR (alfa infinito) separa o
+    ganho da troca de direção do ganho da representação.
+    
+    Args:
+        num_vertices (int): Número de vértices dos grafos gerados
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+    """
+    from bfs_dfs import BFS
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: BFS OTIMIZADA POR DIREÇÃO (TOP-DOWN/BOTTOM-UP)")
+    print(f"{'='*70}")
+    
+    grafos = (
+        ("Barabási–Albert", GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice)),
+        ("Erdős–Rényi direcionado",
+         GeradorGrafos.erdos_renyi(num_vertices, num_arestas=2 * arestas_por_vertice * num_vertices,
+                                   direcionado=True)),
+    )
+    
+    for nome, grafo in grafos:
+        print(f"\n{nome} - Vértices: {num_vertices}  Arestas: {len(grafo.obter_arestas())}")
+        
+        # O snapshot CSR (e o transposto) é construído uma vez e reutilizado
+        compacto, t_snapshot = _cronometrar(grafo.snapshot)
+        _, t_transposto = _cronometrar(compacto.obter_vetores_entrada)
+        
+        comum, t_comum = _cronometrar(BFS.buscar, grafo, 0, mostrar_passos=False)
+        top_down, t_top_down = _cronometrar(BFS.buscar_direcao_otimizada, compacto, 0,
+                                            alfa=float('inf'), mostrar_passos=False)
+        otimizada, t_otimizada = _cronometrar(BFS.buscar_direcao_otimizada, compacto, 0,
+                                              mostrar_passos=False)
+        
+        assert comum['distancia'] == top_down['distancia'] == otimizada['distancia']
+        
+        print(f"  snapshot() + transposto (uma vez): {t_snapshot + t_transposto:.3f} s")
+        print(f"  BFS.buscar (Grafo):                {t_comum:.3f} s")
+        print(f"  Só top-down (CSR):                 {t_top_down:.3f} s")
+        print(f"  Otimizada por direção (CSR):       {t_otimizada:.3f} s")
+        print(f"  Aceleração sobre BFS.buscar: {t_comum / t_otimizada:.1f}x")
+        print(f"  Direções por nível: {', '.join(otimizada['direcoes'])}")
+    
+    print(f"\n✓ Distâncias idênticas nas três versões")
+
+
+def benchmark_dfs(tamanho_cadeia: int = 1_000_000, num_vertices: int = 200_000,
+                  arestas_por_vertice: int = 3):
+    """
+    Mede a DFS em uma cadeia longa (pior caso de profundidade) e em um grafo
+    Barabási–Albert, comparando DFS.buscar (recursiva e iterativa) com o
+    percurso completo DFS.percorrer.
+    
+    Na cadeia, a pilha chega a ter todos os vértices: uma DFS recursiva de
+    verdade estouraria o limite de recursão do Python.
+    
+    Args:
+        tamanho_cadeia (int): Número de vértices da cadeia 0 -> 1 -> ... -> n-1
+        num_vertices (int): Número de vértices do grafo Barabási–Albert
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+    """
+    from bfs_dfs import DFS
+    from geradores import GeradorGrafos
+    from grafo import Grafo
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: DFS COM PILHA EXPLÍCITA")
+    print(f"{'='*70}")
+    
+    cadeia = Grafo(tamanho_cadeia, direcionado=True)
+    cadeia.adicionar_arestas(range(tamanho_cadeia - 1), range(1, tamanho_cadeia))
+    
+    grafos = (
+        (f"Cadeia de {tamanho_cadeia} vértices", cadeia, tamanho_cadeia - 1),
+        (f"Barabási–Albert ({num_vertices} vértices)",
+         GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice), None),
+    )
+    
+    for nome, grafo, destino in grafos:
+        print(f"\n{nome} - Arestas: {len(grafo.obter_arestas())}")
+        
+        compacto, t_snapshot = _cronometrar(grafo.snapshot)
+        recursiva, t_recursiva = _cronometrar(DFS.buscar, grafo, 0, destino,
+                                              usar_recursao=True, mostrar_passos=False)
+        iterativa, t_iterativa = _cronometrar(DFS.buscar, grafo, 0, destino,
+                                              usar_recursao=False, mostrar_passos=False)
+        percurso, t_percurso = _cronometrar(DFS.percorrer, compacto, 0, mostrar_passos=False)
+        
+        assert percurso['pre_ordem'] == recursiva['visitados']
+        assert len(percurso['pos_ordem']) == len(percurso['pre_ordem'])
+        assert all(percurso['descoberta'][v] < percurso['termino'][v] for v in percurso['pre_ordem'])
+        
+        print(f"  snapshot() (uma vez):             {t_snapshot:.3f} s")
+        print(f"  DFS.buscar (pilha de iteradores): {t_recursiva:.3f} s")
+        print(f"  DFS.buscar (pilha simples):       {t_iterativa:.3f} s")
+        print(f"  DFS.percorrer (CSR, bytearray):   {t_percurso:.3f} s")
+        print(f"  Vértices alcançados: {len(percurso['pre_ordem'])}")
+    
+    print(f"\n✓ Pré-ordem idêntica à DFS recursiva, sem estouro de pilha")
+
+
+def benchmark_bfs_vetorizada(num_vertices: int = 300_000, arestas_por_vertice: int = 4):
+    """
+    Compara BFS.buscar (dicionários, um vizinho por vez) com a BFS
+    vetorizada nível a nível (NumPy) em grafos com mais de 10^6 arestas.
+    
+    Args:
+        num_vertices (int): Número de vértices dos grafos gerados
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+    """
+    from bfs_dfs import BFS
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: BFS VETORIZADA (NUMPY) x BFS COM DICIONÁRIOS")
+    print(f"{'='*70}")
+    
+    try:
+        import numpy
+    except ImportError:
+        print("\nNumPy não instalado: benchmark ignorado (pip install numpy)")
+        return
+    
+    grafos = (
+        ("Barabási–Albert", GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice)),
+        ("Erdős–Rényi direcionado",
+         GeradorGrafos.erdos_renyi(num_vertices, num_arestas=2 * arestas_por_vertice * num_vertices,
+                                   direcionado=True)),
+    )
+    
+    for nome, grafo in grafos:
+        print(f"\n{nome} - Vértices: {num_vertices}  Arestas: {len(grafo.obter_arestas())}")
+        
+        compacto, t_snapshot = _cronometrar(grafo.snapshot)
+        comum, t_comum = _cronometrar(BFS.buscar, grafo, 0, mostrar_passos=False)
+        vetorizada, t_vetorizada = _cronometrar(BFS.buscar_vetorizada, compacto, 0,
+                                                mostrar_passos=False)
+        
+        assert comum['visitados'] == vetorizada['visitados']
+        assert comum['distancia'] == vetorizada['distancia']
+        assert comum['predecessor'] == vetorizada['predecessor']
+        
+        print(f"  snapshot() (uma vez):      {t_snapshot:.3f} s")
+        print(f"  BFS.buscar (Grafo):        {t_comum:.3f} s")
+        print(f"  BFS vetorizada (NumPy):    {t_vetorizada:.3f} s")
+        print(f"  Aceleração: {t_comum / t_vetorizada:.1f}x")
+    
+    print(f"\n✓ Ordem de visita, distâncias e predecessores idênticos")
+
+
+def benchmark_bfs_paralela(num_vertices: int = 20_000, arestas_por_vertice: int = 3,
+                           num_origens: int = 200):
+    """
+    Compara uma chamada de BFS.buscar por origem com o driver de todas as
+    origens (bfs_paralela), em um processo e com um processo por CPU.
+    
+    Args:
+        num_vertices (int): Número de vértices do grafo Barabási–Albert
+        arestas_por_vertice (int): Arestas criadas por vértice novo
+        num_origens (int): Número de origens (espaçadas uniformemente)
+    """
+    import os
+    from bfs_dfs import BFS
+    from bfs_paralela import distancias_todas_origens, estatisticas_distancias
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: BFS DE TODAS AS ORIGENS (PROCESSOS + MEMÓRIA COMPARTILHADA)")
+    print(f"{'='*70}")
+    
+    grafo = GeradorGrafos.barabasi_albert(num_vertices, arestas_por_vertice)
+    origens = list(range(0, num_vertices, max(1, num_vertices // num_origens)))
+    processos = os.cpu_count() or 1
+    print(f"\nVértices: {num_vertices}  Arestas: {len(grafo.obter_arestas())}  "
+          f"Origens: {len(origens)}  CPUs: {processos}")
+    
+    def uma_bfs_por_origem():
+        return [BFS.buscar(grafo, o, mostrar_passos=False)['distancia'] for o in origens]
+    
+    referencia, t_serial = _cronometrar(uma_bfs_por_origem)
+    _, t_um = _cronometrar(estatisticas_distancias, grafo, origens, processos=1)
+    estatisticas, t_todos = _cronometrar(estatisticas_distancias, grafo, origens,
+                                         processos=processos)
+    
+    vertices = grafo.obter_vertices()
+    for (origem, linha), distancia in zip(distancias_todas_origens(grafo, origens[:20]),
+                                          referencia):
+        assert dict(zip(vertices, linha)) == distancia
+    assert all(estatisticas['excentricidade'][o] == max(d.values())
+               for o, d in zip(origens, referencia))
+    
+    print(f"  BFS.buscar por origem:         {t_serial:.3f} s")
+    print(f"  Todas as origens, 1 processo:  {t_um:.3f} s")
+    print(f"  Todas as origens, {processos} processo(s): {t_todos:.3f} s")
+    print(f"  Aceleração: {t_serial / t_todos:.1f}x")
+    print(f"  Diâmetro (entre as origens): {estatisticas['diametro']}")
+    
+    print(f"\n✓ Distâncias e excentricidades idênticas às do BFS.buscar")
+
+
+def benchmark_componentes(num_pacotes: int = 100_000, dependencias_por_pacote: int = 2):
+    """
+    Mede o Tarjan iterativo em um "registro de pacotes" aleatório com
+    100 mil vértices, comparando com a detecção do primeiro ciclo.
+    
+    Args:
+        num_pacotes (int): Número de vértices
+        dependencias_por_pacote (int): Arestas por vértice (em média)
+    """
+    from aplicacoes_praticas import AplicacaoDependencias
+    from componentes_fortes import Tarjan
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: COMPONENTES FORTEMENTE CONEXOS (TARJAN ITERATIVO)")
+    print(f"{'='*70}")
+    
+    grafo = GeradorGrafos.erdos_renyi(num_pacotes,
+                                      num_arestas=dependencias_por_pacote * num_pacotes,
+                                      direcionado=True)
+    print(f"\nPacotes: {num_pacotes}  Dependências: {len(grafo.obter_arestas())}")
+    
+    ciclo, t_ciclo = _cronometrar(AplicacaoDependencias.detectar_ciclo, grafo)
+    resultado, t_tarjan = _cronometrar(Tarjan.componentes, grafo, mostrar_passos=False)
+    
+    # Condensação em ordem topológica e o ciclo encontrado dentro de um componente
+    assert all(u < v for u, v, _ in resultado['condensacao'].obter_arestas())
+    assert len({resultado['componente'][v] for v in ciclo}) <= 1
+    
+    tamanhos = sorted((len(resultado['componentes'][c]) for c in resultado['ciclicos']),
+                      reverse=True)
+    print(f"  Primeiro ciclo (detectar_ciclo): {t_ciclo:.3f} s ({max(len(ciclo) - 1, 0)} pacotes)")
+    print(f"  Todos os componentes (Tarjan):   {t_tarjan:.3f} s")
+    print(f"  Componentes: {len(resultado['componentes'])}  "
+          f"Grupos circulares: {len(tamanhos)}  Maior: {tamanhos[0] if tamanhos else 0}")
+    print(f"  Arestas da condensação: {len(resultado['condensacao'].obter_arestas())}")
+    
+    print(f"\n✓ Condensação acíclica, em ordem topológica")
+
+
+def benchmark_ordenacao_topologica(num_pacotes: int = 100_000, dependencias_por_pacote: int = 3):
+    """
+    Mede a ordenação topológica (ondas), o caminho crítico e o escalonador
+    em um DAG aleatório com 100 mil vértices.
+    
+    Args:
+        num_pacotes (int): Número de vértices
+        dependencias_por_pacote (int): Arestas por vértice (em média)
+    """
+    import random
+    from geradores import GeradorGrafos
+    from grafo import Grafo
+    from ordenacao_topologica import Escalonador, Kahn
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: ORDENAÇÃO TOPOLÓGICA (KAHN), ONDAS E CAMINHO CRÍTICO")
+    print(f"{'='*70}")
+    
+    # DAG: só as arestas u -> v com u < v de um grafo aleatório
+    aleatorio = GeradorGrafos.erdos_renyi(num_pacotes,
+                                          num_arestas=2 * dependencias_por_pacote * num_pacotes,
+                                          direcionado=True)
+    arestas = [(u, v) for u, v, _ in aleatorio.obter_arestas() if u < v]
+    grafo = Grafo(num_pacotes, direcionado=True)
+    grafo.adicionar_arestas(*zip(*arestas))
+    print(f"\nVértices: {len(grafo.obter_vertices())}  Arestas: {len(arestas)}")
+    
+    rng = random.Random(42)
+    duracao = {v: rng.uniform(1, 60) for v in grafo.obter_vertices()}
+    
+    _, t_snapshot = _cronometrar(grafo.snapshot)
+    resultado, t_ordenar = _cronometrar(Kahn.ordenar, grafo, mostrar_passos=False)
+    critico, t_critico = _cronometrar(Kahn.caminho_critico, grafo, duracao)
+    
+    def escalonar():
+        escalonador = Escalonador(grafo)
+        prontas = escalonador.prontas()
+        while prontas:
+            prontas.extend(escalonador.concluir(prontas.pop()))
+        return escalonador.finalizado()
+    
+    finalizado, t_escalonar = _cronometrar(escalonar)
+    
+    posicao = {v: i for i, v in enumerate(resultado['ordem'])}
+    assert not resultado['tem_ciclo'] and finalizado
+    assert all(posicao[u] < posicao[v] for u, v in arestas)
+    
+    print(f"  snapshot() (uma vez):              {t_snapshot:.3f} s")
+    print(f"  Ordem + ondas (Kahn.ordenar):      {t_ordenar:.3f} s ({len(resultado['ondas'])} ondas)")
+    print(f"  Caminho crítico:                   {t_critico:.3f} s "
+          f"({len(critico['caminho'])} tarefas, {critico['duracao_total']:.0f} s)")
+    print(f"  Escalonador (concluir 1 a 1):      {t_escalonar:.3f} s")
+    
+    print(f"\n✓ Toda aresta respeitada pela ordem topológica")
+
+
+def benchmark_deteccao_online(num_pacotes: int = 100_000, dependencias_por_pacote: int = 3,
+                              tentativas_ciclo: int = 1_000):
+    """
+    Compara a detecção de ciclos online (Pearce–Kelly, a cada aresta
+    inserida) com uma DFS completa no registro de 100 mil pacotes.
+    
+    Args:
+        num_pacotes (int): Número de vértices
+        dependencias_por_pacote (int): Arestas por vértice
+        tentativas_ciclo (int): Arestas que fecham ciclo a serem recusadas
+    """
+    import random
+    from aplicacoes_praticas import AplicacaoDependencias
+    from grafo import ErroCiclo, Grafo
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: DETECÇÃO DE CICLOS ONLINE (PEARCE–KELLY) x DFS COMPLETA")
+    print(f"{'='*70}")
+    
+    # DAG segundo uma ordem escondida, com arestas inseridas em ordem aleatória
+    # (a ordem topológica mantida precisa ser corrigida ao longo da inserção)
+    rng = random.Random(42)
+    escondida = list(range(num_pacotes))
+    rng.shuffle(escondida)
+    arestas = set()
+    while len(arestas) < dependencias_por_pacote * num_pacotes:
+        i, j = rng.randrange(num_pacotes), rng.randrange(num_pacotes)
+        if i != j:
+            arestas.add((escondida[min(i, j)], escondida[max(i, j)]))
+    arestas = list(arestas)
+    rng.shuffle(arestas)
+    print(f"\nVértices: {num_pacotes}  Arestas: {len(arestas)}")
+    
+    def inserir(ativar):
+        grafo = Grafo(num_pacotes, direcionado=True)
+        if ativar:
+            grafo.ativar_deteccao_ciclos()
+        for u, v in arestas:
+            grafo.adicionar_aresta(u, v)
+        return grafo
+    
+    _, t_sem = _cronometrar(inserir, False)
+    registro, t_com = _cronometrar(inserir, True)
+    ciclo, t_dfs = _cronometrar(AplicacaoDependencias.detectar_ciclo, registro)
+    assert not ciclo
+    
+    def recusar():
+        recusadas = 0
+        for u, v in rng.sample(arestas, tentativas_ciclo):
+            try:
+                registro.adicionar_aresta(v, u)
+            except ErroCiclo as erro:
+                recusadas += 1
+                c = erro.ciclo
+                assert c[0] == c[-1] == v and c[1] == u
+                assert all(registro.tem_aresta(a, b) for a, b in zip(c[1:], c[2:]))
+        return recusadas
+    
+    recusadas, t_recusar = _cronometrar(recusar)
+    assert recusadas == tentativas_ciclo
+    
+    custo_online = (t_com - t_sem) / len(arestas)
+    custo_recusa = t_recusar / tentativas_ciclo
+    print(f"  Inserção sem detecção:             {t_sem:.3f} s")
+    print(f"  Inserção com detecção online:      {t_com:.3f} s "
+          f"({custo_online * 1e6:.1f} µs a mais por aresta)")
+    print(f"  Recusa de aresta que fecha ciclo:  {custo_recusa * 1e3:.3f} ms por aresta")
+    print(f"  DFS completa (detectar_ciclo):     {t_dfs * 1e3:.1f} ms por verificação")
+    print(f"  → Por aresta, a verificação online custa ~{t_dfs / max(custo_online, 1e-9):.0f}x "
+          f"menos que uma DFS completa")
+    
+    print(f"\n✓ {recusadas} arestas que fechavam ciclo recusadas com o ciclo correto")
+
+
+def benchmark_heap_indexado(num_vertices: int = 3_000, probabilidade: float = 0.05):
+    """
+    Compara a fila com remoção preguiçosa (heapq) e o heap indexado (binário
+    e 4-ário) no Dijkstra e no Prim, em um grafo denso com pesos aleatórios:
+    inserções, remoções, diminuições de chave, tamanho máximo e tempo.
+    
+    Args:
+        num_vertices (int): Número de vértices
+        probabilidade (float): Probabilidade de cada par ser ligado
+    """
+    from bellman_ford_dijkstra import Dijkstra
+    from geradores import GeradorGrafos
+    from mst_kruskal_prim import Prim
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: HEAP INDEXADO x HEAPQ (REMOÇÃO PREGUIÇOSA)")
+    print(f"{'='*70}")
+    
+    grafo = GeradorGrafos.erdos_renyi(num_vertices, probabilidade,
+                                      distribuicao_pesos='uniforme', peso_max=100.0)
+    print(f"\nVértices: {num_vertices}  Arestas: {len(grafo.obter_arestas())}")
+    
+    for nome, executar in (('Dijkstra', lambda fila: Dijkstra.menor_caminho(
+                                grafo, 0, mostrar_passos=False, fila=fila)),
+                           ('Prim', lambda fila: Prim.mst(
+                                grafo, 0, mostrar_passos=False, fila=fila))):
+        print(f"\n{nome}:")
+        print(f"  {'Fila':12} {'Inserções':>10} {'Remoções':>10} {'Diminuições':>12} "
+              f"{'Máx. heap':>10} {'Tempo':>9}")
+        
+        referencia = None
+        for fila in ('heapq', 'binario', 'quaternario'):
+            resultado, tempo = _cronometrar(executar, fila)
+            
+            # Mesma ordem de visita e mesmo resultado com qualquer fila
+            visitados = resultado['vertices_visitados']
+            if referencia is None:
+                referencia = visitados
+            assert visitados == referencia
+            
+            e = resultado['estatisticas_fila']
+            print(f"  {fila:12} {e['insercoes']:>10} {e['remocoes']:>10} {e['diminuicoes']:>12} "
+                  f"{e['tamanho_maximo']:>10} {tempo:>8.3f}s")
+    
+    # Origem sem arestas (fora de obter_vertices): mesmo resultado com qualquer fila
+    isolado = Grafo(3)
+    isolado.adicionar_aresta(0, 1, 2.0)
+    referencia = Dijkstra.menor_caminho(isolado, 2, mostrar_passos=False)
+    for fila in ('binario', 'quaternario'):
+        resultado = Dijkstra.menor_caminho(isolado, 2, mostrar_passos=False, fila=fila)
+        assert resultado['distancia'] == referencia['distancia'] == {0: float('inf'), 1: float('inf'), 2: 0}
+        assert resultado['vertices_visitados'] == referencia['vertices_visitados']
+    
+    print(f"\n✓ Mesmos resultados com as três filas; o heap indexado nunca passa de V itens")
+
+
+def benchmark_dijkstra_bidirecional(num_vertices: int = 100_000, grau_medio: float = 6.0,
+                                    consultas: int = 20):
+    """
+    Compara Dijkstra.menor_caminho (com destino) e
+    Dijkstra.menor_caminho_bidirecional em consultas ponto a ponto em uma
+    malha no estilo viário (grafo geométrico) e em um grafo direcionado.
+    
+    Args:
+        num_vertices (int): Número de vértices
+        grau_medio (float): Grau médio aproximado
+        consultas (int): Número de pares (origem, destino) sorteados
+    """
+    import math
+    from bellman_ford_dijkstra import Dijkstra
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: DIJKSTRA UNIDIRECIONAL vs BIDIRECIONAL (PONTO A PONTO)")
+    print(f"{'='*70}")
+    
+    rng = random.Random(11)
+    for direcionado in (False, True):
+        if direcionado:
+            grafo = GeradorGrafos.erdos_renyi(num_vertices, num_arestas=int(num_vertices * grau_medio),
+                                              direcionado=True, distribuicao_pesos='uniforme')
+            descricao = "Erdős–Rényi direcionado (busca reversa por arestas de entrada)"
+        else:
+            raio = math.sqrt(grau_medio / (math.pi * num_vertices))
+            grafo = GeradorGrafos.geometrico(num_vertices, raio)
+            descricao = "Geométrico (malha viária)"
+        # Vértices isolados do grafo geométrico não aparecem em obter_vertices()
+        vertices = grafo.obter_vertices()
+        pares = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(consultas)]
+        
+        t_uni = t_bi = 0.0
+        fixados_uni = fixados_bi = 0
+        for origem, destino in pares:
+            uni, t = _cronometrar(Dijkstra.menor_caminho, grafo, origem, destino,
+                                  mostrar_passos=False)
+            t_uni += t
+            bi, t = _cronometrar(Dijkstra.menor_caminho_bidirecional, grafo, origem, destino,
+                                 mostrar_passos=False)
+            t_bi += t
+            
+            assert (uni['custo'] is None) == (bi['custo'] is None)
+            if uni['custo'] is not None:
+                assert math.isclose(uni['custo'], bi['custo'])
+            fixados_uni += len(uni['vertices_visitados'])
+            fixados_bi += len(bi['vertices_visitados'])
+        
+        print(f"\n{descricao} - Vértices: {num_vertices}  Consultas: {consultas}")
+        print(f"  Unidirecional: {t_uni:.3f} s  ({fixados_uni // consultas} vértices fixados por consulta)")
+        print(f"  Bidirecional:  {t_bi:.3f} s  ({fixados_bi // consultas} vértices fixados por consulta)")
+        print(f"  Vértices fixados: {fixados_bi / max(fixados_uni, 1):.0%} do unidirecional  "
+              f"Aceleração: {t_uni / t_bi:.1f}x")
+    
+    print(f"\n✓ Mesmo custo nas duas versões")
+
+
+def benchmark_a_estrela(lado: int = 300, obstaculos: float = 0.25, consultas: int = 20,
+                        num_marcos: int = 8):
+    """
+    Mede a redução do espaço de busca do A* em um mapa de jogo grande: grade
+    com vizinhança de 8 (diagonais custam √2) e células bloqueadas.
+    
+    Args:
+        lado (int): Lado da grade (lado * lado células)
+        obstaculos (float): Fração de células bloqueadas
+        consultas (int): Número de pares (origem, destino) sorteados
+        num_marcos (int): Marcos da heurística ALT
+    """
+    import math
+    from a_estrela import AEstrela, Heuristicas
+    from bellman_ford_dijkstra import Dijkstra
+    from geradores import GeradorGrafos
+    
+    print(f"\n{'='*70}")
+    print(f"BENCHMARK: A* x DIJKSTRA EM MAPA DE JOGO ({lado}x{lado}, {obstaculos:.0%} BLOQUEADO)")
+    print(f"{'='*70}")
+    
+    rng = random.Random(5)
+    grade = GeradorGrafos.grade(lado, lado, diagonais=True, coordenadas=True)
+    bloqueadas = {v for v in range(lado * lado) if rng.random() < obstaculos}
+    arestas = [(u, v, p) for u, v, p in grade.obter_arestas()
+               if u not in bloqueadas and v not in bloqueadas]
+    mapa = Grafo(lado * lado)
+    mapa.adicionar_arestas(*zip(*arestas))
+    mapa.coordenadas = grade.coordenadas
+    print(f"\nCélulas livres: {lado * lado - len(bloqueadas)}  Arestas: {len(arestas)}")
+    
+    marcos, t_marcos = _cronometrar(Heuristicas.marcos, mapa, num_marcos)
+    heuristicas = [('Nula (= Dijkstra)', Heuristicas.nula()),
+                   ('Euclidiana', Heuristicas.euclidiana(mapa)),
+                   ('Octil', Heuristicas.octil(mapa)),
+                   (f'Marcos (ALT, {num_marcos})', marcos)]
+    
+    # Só pares com caminho (sem caminho, qualquer busca expande o componente inteiro)
+    livres = [v for v in range(lado * lado) if v not in bloqueadas]
+    pares = []
+    custos = []
+    t_dijkstra = 0.0
+    expandidos_dijkstra = 0
+    while len(pares) < consultas:
+        origem, destino = rng.choice(livres), rng.choice(livres)
+        resultado, t = _cronometrar(Dijkstra.menor_caminho, mapa, origem, destino,
+                                    mostrar_passos=False)
+        if resultado['custo'] is None:
+            continue
+        pares.append((origem, destino))
+        custos.append(resultado['custo'])
+        t_dijkstra += t
+        expandidos_dijkstra += len(resultado['vertices_visitados'])
+    
+    # Modo de depuração em uma consulta: todas as heurísticas são admissíveis
+    for _, heuristica in heuristicas:
+        AEstrela.verificar_admissibilidade(mapa, pares[0][1], heuristica)
+    
+    print(f"  Pré-processamento dos marcos: {t_marcos:.3f} s")
+    print(f"\n  {'Busca':24} {'Expandidos/consulta':>20} {'Redução':>9} {'Tempo':>9}")
+    print(f"  {'Dijkstra.menor_caminho':24} {expandidos_dijkstra // consultas:>20} "
+          f"{'':>9} {t_dijkstra:>8.3f}s")
+    for nome, heuristica in heuristicas:
+        t_total = 0.0
+        expandidos = 0
+        for (origem, destino), custo in zip(pares, custos):
+            resultado, t = _cronometrar(AEstrela.menor_caminho, mapa, origem, destino,
+                                        heuristica, mostrar_passos=False)
+            t_total += t
+            expandidos += resultado['expandidos']
+            assert math.isclose(resultado['custo'], custo)
+        print(f"  {'A* ' + nome:24} {expandidos // consultas:>20} "
+              f"{expandidos_dijkstra / max(expandidos, 1):>8.1f}x {t_total:>8.3f}s")
+    
+    print(f"\n✓ Mesmo custo do Dijkstra com todas as heurísticas (todas admissíveis)")
+
+
+if __name__ == "__main__":
+    benchmark_arquivo_grafo()
+    benchmark_insercao_em_lote()
+    benchmark_rastreamento()
+    benchmark_bfs_bidirecional()
+    benchmark_bfs_direcao()
+    benchmark_dfs()
+    benchmark_bfs_vetorizada()
+    benchmark_bfs_paralela()
+    benchmark_componentes()
+    benchmark_ordenacao_topologica()
+    benchmark_deteccao_online()
+    benchmark_heap_indexado()
+    benchmark_dijkstra_bidirecional()
+    benchmark_a_estrela()
@@ -11,12 +11,22 @@ BFS (Breadth-First Search - Busca em Largura):
 - Utiliza uma FILA (queue) para controlar a ordem de visita.
 - Garante encontrar o caminho com MENOR NÚMERO DE ARESTAS.
 - Complexidade: O(V + E), onde V = vértices e E = arestas.
+- Variante bidirecional (consultas origem -> destino): expande a menor de
+  duas fronteiras, uma de cada ponta, e para quando elas se encontram.
+- Variante otimizada por direção: nos níveis com fronteira grande, os
+  vértices não visitados procuram um pai na fronteira (bottom-up).
+- Variante vetorizada (NumPy, opcional): processa um nível inteiro por vez
+  com operações sobre os vetores CSR, sem laço Python por vizinho.
 
 DFS (Depth-First Search - Busca em Profundidade):
 - Explora o grafo seguindo um caminho o mais profundo possível antes de retroceder.
 - Utiliza uma PILHA (stack) ou recursão para controlar a ordem de visita.
 - Útil para detectar ciclos, ordenação topológica, componentes conectados.
 - Complexidade: O(V + E), onde V = vértices e E = arestas.
+- A "recursão" é simulada com uma pilha explícita: não há limite de
+  profundidade (cadeias com milhões de vértices).
+- Percurso completo (percorrer): pré-ordem, pós-ordem, tempos de
+  descoberta/término e predecessores de toda a floresta DFS.
 
 APLICAÇÕES PRÁTICAS:
 -------------------
@@ -29,9 +39,53 @@ Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
 Data: Dezembro 2025
 """
 
+from array import array
 from collections import deque
-from typing import List, Dict, Set, Optional, Tuple
+from numbers import Integral
+from typing import Iterable, Iterator, List, Dict, Set, Optional, Tuple
+from eventos import Evento, Visita, Enfileiramento, Fim
 from grafo import Grafo
+from rastreamento import Rastreador, RASTREADOR_NULO, obter_rastreador
+
+
+def _vetores_por_linha(grafo: Grafo, entrada: bool = False) -> Tuple:
+    """
+    Obtém os vetores CSR de um grafo com os vizinhos já convertidos em linhas.
+    
+    Usa o snapshot() de um Grafo, ou o próprio GrafoCompacto. Quando os
+    vértices são exatamente 0..n-1 a linha é o próprio vértice e os vetores
+    são usados sem cópia; caso contrário, os destinos convertidos para
+    linhas ficam guardados no GrafoCompacto (O(E) só na primeira consulta
+    a cada snapshot).
+    
+    Args:
+        grafo (Grafo): Grafo ou GrafoCompacto
+        entrada (bool): Se True, retorna também (offsets, origens) das
+            arestas de entrada, em linhas
+        
+    Returns:
+        Tuple: (ids, offsets, destinos, obter_linha, entrada), em que ids[linha]
+            é o vértice, obter_linha(vertice) retorna a linha (ou None) e
+            entrada é None se não foi pedida
+    """
+    compacto = grafo if hasattr(grafo, 'obter_vetores') else grafo.snapshot()
+    vetores = compacto.obter_vetores()
+    ids = vetores['ids']
+    offsets = vetores['offsets']
+    n = len(ids)
+    
+    linhas = compacto.obter_vetores_linhas(entrada)
+    destinos = linhas['destinos']
+    
+    if linhas['linha'] is not None:
+        obter_linha = linhas['linha'].get
+    else:
+        obter_linha = lambda v: int(v) if isinstance(v, Integral) and 0 <= v < n else None
+    
+    if entrada:
+        offsets_entrada = compacto.obter_vetores_entrada()['offsets']
+        return ids, offsets, destinos, obter_linha, (offsets_entrada, linhas['origens'])
+    return ids, offsets, destinos, obter_linha, None
 
 
 class BFS:
@@ -40,7 +94,8 @@ class BFS:
     """
     
     @staticmethod
-    def buscar(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Dict:
+    def buscar(grafo: Grafo, origem: int, destino: Optional[int] = None,
+               mostrar_passos: bool = True, rastreador: Optional[Rastreador] = None) -> Dict:
         """
         Executa a busca em largura a partir de um vértice de origem.
         
@@ -58,6 +113,9 @@ class BFS:
             grafo (Grafo): Grafo a ser explorado
             origem (int): Vértice de origem
             destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
             
         Returns:
             Dict: Dicionário contendo:
@@ -67,18 +125,23 @@ class BFS:
                 - 'caminho': caminho até o destino (se especificado)
                 - 'encontrado': True se destino foi encontrado
         """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
         visitados = []  # Ordem de visita dos vértices
         predecessor = {origem: None}  # Mapa de predecessores
         distancia = {origem: 0}  # Distância de cada vértice à origem
         fila = deque([origem])  # Fila para BFS
         
-        print(f"\n{'='*60}")
-        print(f"EXECUTANDO BFS - BUSCA EM LARGURA")
-        print(f"{'='*60}")
-        print(f"Origem: {origem}")
-        if destino is not None:
-            print(f"Destino: {destino}")
-        print(f"\nIniciando busca...")
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO BFS - BUSCA EM LARGURA")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='BFS',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+            rastreador.mensagem(f"\nIniciando busca...")
         
         passo = 1
         
@@ -88,14 +151,21 @@ class BFS:
             vertice_atual = fila.popleft()
             visitados.append(vertice_atual)
             
-            print(f"\nPasso {passo}:")
-            print(f"  Visitando vértice: {vertice_atual}")
-            print(f"  Distância da origem: {distancia[vertice_atual]}")
-            print(f"  Fila atual: {list(fila)}")
+            if ativo:
+                rastreador.evento(
+                    'visita',
+                    f"\nPasso {passo}:\n"
+                    f"  Visitando vértice: {vertice_atual}\n"
+                    f"  Distância da origem: {distancia[vertice_atual]}\n"
+                    f"  Fila atual: {list(fila)}",
+                    passo=passo, vertice=vertice_atual,
+                    distancia=distancia[vertice_atual], fila=list(fila))
             
             # Se encontrou o destino, pode parar
             if destino is not None and vertice_atual == destino:
-                print(f"\n✓ Destino {destino} encontrado!")
+                if ativo:
+                    rastreador.evento('destino', f"\n✓ Destino {destino} encontrado!",
+                                      vertice=destino)
                 break
             
             # Explora todos os vizinhos
@@ -108,10 +178,13 @@ class BFS:
                     fila.append(vizinho)
                     vizinhos_nao_visitados.append(vizinho)
             
-            if vizinhos_nao_visitados:
-                print(f"  Novos vizinhos adicionados à fila: {vizinhos_nao_visitados}")
-            else:
-                print(f"  Nenhum vizinho novo encontrado")
+            if ativo:
+                if vizinhos_nao_visitados:
+                    texto = f"  Novos vizinhos adicionados à fila: {vizinhos_nao_visitados}"
+                else:
+                    texto = f"  Nenhum vizinho novo encontrado"
+                rastreador.evento('descoberta', texto, vertice=vertice_atual,
+                                  vizinhos=vizinhos_nao_visitados)
             
             passo += 1
         
@@ -121,16 +194,496 @@ class BFS:
         if destino is not None and destino in predecessor:
             caminho = BFS._reconstruir_caminho(predecessor, origem, destino)
             encontrado = True
-            print(f"\n{'='*60}")
-            print(f"CAMINHO ENCONTRADO:")
-            print(f"  {' -> '.join(map(str, caminho))}")
-            print(f"  Número de arestas: {len(caminho) - 1}")
-            print(f"{'='*60}")
-        elif destino is not None:
-            print(f"\n✗ Destino {destino} não foi encontrado (não há caminho)")
+            if ativo:
+                rastreador.mensagem(f"\n{'='*60}")
+                rastreador.evento('caminho',
+                                  f"CAMINHO ENCONTRADO:\n"
+                                  f"  {' -> '.join(map(str, caminho))}\n"
+                                  f"  Número de arestas: {len(caminho) - 1}",
+                                  caminho=caminho, custo=len(caminho) - 1)
+                rastreador.mensagem(f"{'='*60}")
+        elif destino is not None and ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
+        
+        if ativo:
+            rastreador.evento('fim',
+                              f"\nVértices visitados na ordem: {visitados}\n"
+                              f"Total de vértices explorados: {len(visitados)}",
+                              visitados=len(visitados))
+        
+        return {
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'distancia': distancia,
+            'caminho': caminho,
+            'encontrado': encontrado
+        }
+    
+    @staticmethod
+    def buscar_bidirecional(grafo: Grafo, origem: int, destino: int,
+                            mostrar_passos: bool = True,
+                            rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Encontra o caminho com menos arestas expandindo duas fronteiras,
+        uma a partir da origem e outra a partir do destino.
+        
+        FUNCIONAMENTO:
+        1. Mantém uma fronteira da origem (arestas de saída) e outra do
+           destino (arestas de entrada, via obter_predecessores)
+        2. A cada rodada expande um nível inteiro da MENOR fronteira
+        3. Para quando um vértice descoberto já foi alcançado pelo outro lado
+        
+        Com fator de ramificação b e distância d, cada lado explora cerca de
+        b^(d/2) vértices, em vez dos b^d da busca a partir de um lado só.
+        Em grafos direcionados a primeira consulta de predecessores constrói
+        o índice de arestas de entrada do grafo (uma única vez).
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Mesmas chaves de BFS.buscar. 'predecessor' e 'distancia'
+                cobrem os vértices alcançados a partir da origem e os
+                vértices do caminho; 'visitados' lista os vértices
+                expandidos pelos dois lados, na ordem de expansão
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO BFS BIDIRECIONAL")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='BFS',
+                              origem=origem, destino=destino)
+            rastreador.mensagem(f"Destino: {destino}")
+        
+        # Lado da origem: predecessor e distância; lado do destino: sucessor e distância
+        predecessor = {origem: None}
+        distancia = {origem: 0}
+        sucessor = {destino: None}
+        distancia_destino = {destino: 0}
+        fronteira_origem = [origem]
+        fronteira_destino = [destino]
+        visitados = []
+        encontro = origem if origem == destino else None
+        
+        while encontro is None and fronteira_origem and fronteira_destino:
+            # Expande a menor fronteira
+            if len(fronteira_origem) <= len(fronteira_destino):
+                lado = 'origem'
+                fronteira, alcancados, outro_lado = fronteira_origem, predecessor, distancia_destino
+                dist_lado = distancia
+                obter_vizinhos = grafo.obter_vizinhos
+            else:
+                lado = 'destino'
+                fronteira, alcancados, outro_lado = fronteira_destino, sucessor, distancia
+                dist_lado = distancia_destino
+                obter_vizinhos = grafo.obter_predecessores
+            
+            if ativo:
+                rastreador.evento('nivel',
+                                  f"\nExpandindo fronteira do lado {lado}: "
+                                  f"nível {dist_lado[fronteira[0]]}, {len(fronteira)} vértices",
+                                  lado=lado, nivel=dist_lado[fronteira[0]],
+                                  tamanho=len(fronteira))
+            
+            proxima = []
+            for vertice in fronteira:
+                visitados.append(vertice)
+                nivel = dist_lado[vertice] + 1
+                for vizinho, peso in obter_vizinhos(vertice):
+                    if vizinho not in alcancados:
+                        alcancados[vizinho] = vertice
+                        dist_lado[vizinho] = nivel
+                        proxima.append(vizinho)
+                        if vizinho in outro_lado:
+                            # Os níveis anteriores não se tocaram, então todo
+                            # encontro neste nível tem a mesma distância total
+                            # (a mínima): o primeiro já serve
+                            encontro = vizinho
+                            break
+                if encontro is not None:
+                    break
+            
+            if lado == 'origem':
+                fronteira_origem = proxima
+            else:
+                fronteira_destino = proxima
+        
+        if encontro is not None and ativo and origem != destino:
+            rastreador.evento('encontro',
+                              f"  ✓ Fronteiras se encontraram no vértice {encontro}",
+                              vertice=encontro)
+        
+        caminho = None
+        if encontro is not None:
+            # Origem -> encontro pelos predecessores, encontro -> destino pelos sucessores
+            caminho = BFS._reconstruir_caminho(predecessor, origem, encontro)
+            atual = sucessor[encontro]
+            while atual is not None:
+                predecessor[atual] = caminho[-1]
+                distancia[atual] = len(caminho)
+                caminho.append(atual)
+                atual = sucessor[atual]
+            if ativo:
+                rastreador.mensagem(f"\n{'='*60}")
+                rastreador.evento('caminho',
+                                  f"CAMINHO ENCONTRADO:\n"
+                                  f"  {' -> '.join(map(str, caminho))}\n"
+                                  f"  Número de arestas: {len(caminho) - 1}",
+                                  caminho=caminho, custo=len(caminho) - 1)
+                rastreador.mensagem(f"{'='*60}")
+        elif ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
+        
+        if ativo:
+            rastreador.evento('fim',
+                              f"\nTotal de vértices expandidos (dois lados): {len(visitados)}",
+                              visitados=len(visitados))
+        
+        return {
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'distancia': distancia,
+            'caminho': caminho,
+            'encontrado': caminho is not None
+        }
+    
+    @staticmethod
+    def buscar_direcao_otimizada(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                                 alfa: float = 14.0, beta: float = 24.0,
+                                 mostrar_passos: bool = True,
+                                 rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Busca em largura que alterna entre expansão top-down e bottom-up.
+        
+        FUNCIONAMENTO:
+        - Top-down (BFS comum): cada vértice da fronteira percorre suas
+          arestas de saída procurando vértices não visitados
+        - Bottom-up: cada vértice NÃO visitado percorre suas arestas de
+          entrada e para no primeiro predecessor que está na fronteira
+        
+        Em grafos de diâmetro pequeno (redes sociais, lei de potência) os
+        níveis do meio alcançam quase todo o grafo: no top-down a maioria
+        das arestas examinadas leva a vértices já visitados; no bottom-up
+        cada vértice restante costuma achar um pai nas primeiras arestas.
+        
+        Escolha da direção a cada nível (heurística de Beamer):
+        - top-down -> bottom-up quando arestas da fronteira > arestas dos
+          vértices não visitados / alfa
+        - bottom-up -> top-down quando vértices na fronteira < V / beta
+        
+        A busca roda sobre os vetores CSR do grafo (o snapshot() de um Grafo;
+        um GrafoCompacto é usado diretamente), com os visitados e a fronteira
+        marcados em bytearrays indexados pela linha do vértice.
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado (Grafo ou GrafoCompacto)
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
+            alfa (float): Limiar para passar ao bottom-up
+            beta (float): Limiar para voltar ao top-down
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Mesmas chaves de BFS.buscar, mais 'direcoes' (direção usada
+                em cada nível). As distâncias são as mesmas de BFS.buscar;
+                'visitados' segue a ordem de descoberta (nível a nível) e,
+                com destino, inclui o nível inteiro em que ele foi alcançado
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        ids, offsets, destinos, obter_linha, entrada = _vetores_por_linha(grafo, entrada=True)
+        offsets_entrada, origens = entrada
+        n = len(ids)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO BFS OTIMIZADA POR DIREÇÃO (TOP-DOWN/BOTTOM-UP)")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='BFS',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+        
+        linha_origem = obter_linha(origem)
+        linha_destino = obter_linha(destino) if destino is not None else None
+        
+        if linha_origem is None:
+            # Origem sem arestas e fora do grafo: como no BFS.buscar, só ela é visitada
+            ordem, niveis_fim, pai, direcoes = [], [], None, []
+        else:
+            visitado = bytearray(n)
+            pai = array('q', [-1]) * n
+            visitado[linha_origem] = 1
+            fronteira = [linha_origem]
+            ordem = [linha_origem]
+            niveis_fim = [1]   # ordem[niveis_fim[k-1]:niveis_fim[k]] = nível k
+            direcoes = []
+            restantes = None  # Vértices não visitados (só no bottom-up)
+            
+            arestas_fronteira = offsets[linha_origem + 1] - offsets[linha_origem]
+            arestas_nao_visitadas = offsets[n] - arestas_fronteira
+            bottom_up = False
+            
+            while fronteira:
+                if linha_destino is not None and visitado[linha_destino]:
+                    break
+                
+                if bottom_up:
+                    bottom_up = len(fronteira) >= n / beta
+                else:
+                    bottom_up = arestas_fronteira > arestas_nao_visitadas / alfa
+                direcoes.append('bottom-up' if bottom_up else 'top-down')
+                
+                proxima = []
+                if bottom_up:
+                    na_fronteira = bytearray(n)
+                    for u in fronteira:
+                        na_fronteira[u] = 1
+                    if restantes is None:
+                        restantes = [v for v in range(n) if not visitado[v]]
+                    ainda_restantes = []
+                    for v in restantes:
+                        for u in origens[offsets_entrada[v]:offsets_entrada[v + 1]]:
+                            if na_fronteira[u]:
+                                visitado[v] = 1
+                                pai[v] = u
+                                proxima.append(v)
+                                break
+                        else:
+                            ainda_restantes.append(v)
+                    restantes = ainda_restantes
+                else:
+                    for u in fronteira:
+                        for v in destinos[offsets[u]:offsets[u + 1]]:
+                            if not visitado[v]:
+                                visitado[v] = 1
+                                pai[v] = u
+                                proxima.append(v)
+                    restantes = None
+                
+                arestas_fronteira = 0
+                for v in proxima:
+                    arestas_fronteira += offsets[v + 1] - offsets[v]
+                arestas_nao_visitadas -= arestas_fronteira
+                
+                if ativo:
+                    rastreador.evento('nivel',
+                                      f"Nível {len(niveis_fim)} ({direcoes[-1]}): "
+                                      f"{len(proxima)} vértices descobertos",
+                                      nivel=len(niveis_fim), direcao=direcoes[-1],
+                                      tamanho=len(proxima))
+                
+                ordem.extend(proxima)
+                niveis_fim.append(len(ordem))
+                fronteira = proxima
+        
+        # Converte linhas de volta para vértices
+        if linha_origem is None:
+            visitados = [origem]
+            predecessor = {origem: None}
+            distancia = {origem: 0}
+        else:
+            visitados = [ids[v] for v in ordem]
+            predecessor = {origem: None}
+            distancia = {}
+            inicio_nivel = 0
+            for nivel, fim_nivel in enumerate(niveis_fim):
+                for i in range(inicio_nivel, fim_nivel):
+                    distancia[visitados[i]] = nivel
+                inicio_nivel = fim_nivel
+            for v in ordem[1:]:
+                predecessor[ids[v]] = ids[pai[v]]
+        
+        caminho = None
+        encontrado = False
+        if destino is not None and destino in predecessor:
+            caminho = BFS._reconstruir_caminho(predecessor, origem, destino)
+            encontrado = True
+            if ativo:
+                rastreador.mensagem(f"\n{'='*60}")
+                rastreador.evento('caminho',
+                                  f"CAMINHO ENCONTRADO:\n"
+                                  f"  {' -> '.join(map(str, caminho))}\n"
+                                  f"  Número de arestas: {len(caminho) - 1}",
+                                  caminho=caminho, custo=len(caminho) - 1)
+                rastreador.mensagem(f"{'='*60}")
+        elif destino is not None and ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
+        
+        if ativo:
+            rastreador.evento('fim',
+                              f"\nDireções por nível: {direcoes}\n"
+                              f"Total de vértices alcançados: {len(visitados)}",
+                              visitados=len(visitados))
+        
+        return {
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'distancia': distancia,
+            'caminho': caminho,
+            'encontrado': encontrado,
+            'direcoes': direcoes
+        }
+    
+    @staticmethod
+    def buscar_vetorizada(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                          mostrar_passos: bool = True,
+                          rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Busca em largura nível a nível com operações vetorizadas do NumPy.
+        
+        Em vez de um laço Python por vizinho, cada nível é processado de uma
+        vez sobre os vetores CSR (offsets/destinos) do grafo:
+        1. Reúne todos os vizinhos da fronteira com indexação vetorizada
+           (np.repeat + np.arange sobre os intervalos de offsets)
+        2. Descarta os já visitados com uma máscara booleana
+        3. Mantém a primeira ocorrência de cada vértice novo (o mesmo pai que
+           a BFS comum escolheria) e grava distância e predecessor em bloco
+        
+        A ordem de descoberta é a mesma da BFS comum: a fronteira seguinte
+        segue a ordem em que os vértices aparecem nas listas de vizinhos.
+        
+        O NumPy é opcional no projeto: ele só é importado ao chamar este
+        método.
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado (Grafo ou GrafoCompacto)
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Mesmas chaves de BFS.buscar. Com destino, 'visitados'
+                inclui o nível inteiro em que ele foi alcançado
+            
+        Raises:
+            ImportError: Se o NumPy não estiver instalado
+        """
+        try:
+            import numpy as np
+        except ImportError as erro:
+            raise ImportError("BFS.buscar_vetorizada requer o NumPy (pip install numpy)") from erro
+        
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        ids, offsets, destinos, obter_linha, _ = _vetores_por_linha(grafo)
+        n = len(ids)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO BFS VETORIZADA (NÍVEL A NÍVEL)")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='BFS',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+        
+        linha_origem = obter_linha(origem)
+        linha_destino = obter_linha(destino) if destino is not None else None
+        
+        if linha_origem is None:
+            # Origem sem arestas e fora do grafo: como no BFS.buscar, só ela é visitada
+            visitados = [origem]
+            predecessor = {origem: None}
+            distancia = {origem: 0}
+        else:
+            # Visões sem cópia sobre os arrays do CSR
+            vetor_offsets = np.frombuffer(offsets, dtype=np.int64)
+            vetor_destinos = np.frombuffer(destinos, dtype=np.int64)
+            
+            visitado = np.zeros(n, dtype=bool)
+            pai = np.full(n, -1, dtype=np.int64)
+            nivel = np.zeros(n, dtype=np.int64)
+            visitado[linha_origem] = True
+            fronteira = np.array([linha_origem], dtype=np.int64)
+            niveis = [fronteira]
+            
+            while fronteira.size:
+                if linha_destino is not None and visitado[linha_destino]:
+                    break
+                
+                # 1. Todos os vizinhos da fronteira, na ordem das listas de adjacência
+                inicios = vetor_offsets[fronteira]
+                graus = vetor_offsets[fronteira + 1] - inicios
+                total = int(graus.sum())
+                if total == 0:
+                    break
+                posicoes = np.arange(total) + np.repeat(inicios - (np.cumsum(graus) - graus), graus)
+                vizinhos = vetor_destinos[posicoes]
+                pais = np.repeat(fronteira, graus)
+                
+                # 2. Máscara dos ainda não visitados
+                novos = ~visitado[vizinhos]
+                vizinhos = vizinhos[novos]
+                pais = pais[novos]
+                
+                # 3. Primeira ocorrência de cada vértice, na ordem de descoberta
+                _, primeiras = np.unique(vizinhos, return_index=True)
+                primeiras.sort()
+                proxima = vizinhos[primeiras]
+                
+                visitado[proxima] = True
+                pai[proxima] = pais[primeiras]
+                nivel[proxima] = len(niveis)
+                
+                if ativo:
+                    rastreador.evento('nivel',
+                                      f"Nível {len(niveis)}: {proxima.size} vértices descobertos",
+                                      nivel=len(niveis), tamanho=int(proxima.size))
+                
+                if proxima.size:
+                    niveis.append(proxima)
+                fronteira = proxima
+            
+            # Converte linhas de volta para vértices, em bloco
+            ordem = np.concatenate(niveis)
+            vetor_ids = np.frombuffer(ids, dtype=np.int64)
+            visitados = vetor_ids[ordem].tolist()
+            distancia = dict(zip(visitados, nivel[ordem].tolist()))
+            predecessor = dict(zip(visitados, vetor_ids[pai[ordem]].tolist()))
+            predecessor[origem] = None
+        
+        caminho = None
+        encontrado = False
+        if destino is not None and destino in predecessor:
+            caminho = BFS._reconstruir_caminho(predecessor, origem, destino)
+            encontrado = True
+            if ativo:
+                rastreador.mensagem(f"\n{'='*60}")
+                rastreador.evento('caminho',
+                                  f"CAMINHO ENCONTRADO:\n"
+                                  f"  {' -> '.join(map(str, caminho))}\n"
+                                  f"  Número de arestas: {len(caminho) - 1}",
+                                  caminho=caminho, custo=len(caminho) - 1)
+                rastreador.mensagem(f"{'='*60}")
+        elif destino is not None and ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
         
-        print(f"\nVértices visitados na ordem: {visitados}")
-        print(f"Total de vértices explorados: {len(visitados)}")
+        if ativo:
+            rastreador.evento('fim', f"\nTotal de vértices alcançados: {len(visitados)}",
+                              visitados=len(visitados))
         
         return {
             'visitados': visitados,
@@ -140,6 +693,146 @@ class BFS:
             'encontrado': encontrado
         }
     
+    @staticmethod
+    def buscar_multiplas_origens(grafo: Grafo, origens: Iterable[int],
+                                 mostrar_passos: bool = True,
+                                 rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Executa uma única BFS a partir de várias origens ao mesmo tempo.
+        
+        Responde "qual a origem mais próxima de cada vértice?" (ex.: o
+        hospital mais próximo de cada ponto do mapa) em O(V + E), em vez de
+        uma BFS por origem.
+        
+        FUNCIONAMENTO:
+        - Todas as origens entram na fila com distância 0, como se houvesse
+          um vértice fictício ligado a cada uma delas
+        - Cada vértice descoberto herda a origem do vértice que o descobriu
+        - A fila continua em ordem de distância, então a primeira descoberta
+          de um vértice vem da origem mais próxima (empates ficam com a origem
+          que aparece primeiro na lista)
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado
+            origens (Iterable[int]): Vértices de origem
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Dicionário contendo:
+                - 'visitados': ordem de visita dos vértices
+                - 'predecessor': mapa de predecessores (None nas origens)
+                - 'distancia': distância (em número de arestas) até a origem mais próxima
+                - 'origem_mais_proxima': origem mais próxima de cada vértice alcançado
+            
+        Raises:
+            ValueError: Se nenhuma origem for informada
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        origens = list(dict.fromkeys(origens))  # Remove repetidas, mantendo a ordem
+        if not origens:
+            raise ValueError("É necessário informar ao menos uma origem")
+        
+        visitados = []
+        predecessor = dict.fromkeys(origens)
+        distancia = dict.fromkeys(origens, 0)
+        origem_mais_proxima = {v: v for v in origens}
+        fila = deque(origens)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO BFS - MÚLTIPLAS ORIGENS")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origens: {origens}", algoritmo='BFS',
+                              origem=origens[0], destino=None, origens=origens)
+        
+        while fila:
+            vertice_atual = fila.popleft()
+            visitados.append(vertice_atual)
+            
+            if ativo:
+                rastreador.evento('visita',
+                                  f"  Visitando {vertice_atual} (distância "
+                                  f"{distancia[vertice_atual]} de "
+                                  f"{origem_mais_proxima[vertice_atual]})",
+                                  vertice=vertice_atual, distancia=distancia[vertice_atual],
+                                  origem=origem_mais_proxima[vertice_atual])
+            
+            proxima_distancia = distancia[vertice_atual] + 1
+            origem_atual = origem_mais_proxima[vertice_atual]
+            for vizinho, peso in grafo.obter_vizinhos(vertice_atual):
+                if vizinho not in predecessor:
+                    predecessor[vizinho] = vertice_atual
+                    distancia[vizinho] = proxima_distancia
+                    origem_mais_proxima[vizinho] = origem_atual
+                    fila.append(vizinho)
+        
+        if ativo:
+            rastreador.evento('fim', f"\nTotal de vértices alcançados: {len(visitados)}",
+                              visitados=len(visitados))
+        
+        return {
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'distancia': distancia,
+            'origem_mais_proxima': origem_mais_proxima
+        }
+    
+    @staticmethod
+    def passos(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Iterator[Evento]:
+        """
+        Executa a busca em largura passo a passo (gerador de eventos).
+        
+        A busca só avança quando o próximo evento é pedido; nada é impresso
+        nem acumulado além das estruturas da própria busca.
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
+            
+        Yields:
+            Evento: Visita (vértice retirado da fila, com sua distância),
+                Enfileiramento (vizinho descoberto) e, por último, Fim com
+                o mesmo resultado de BFS.buscar
+        """
+        visitados = []
+        predecessor = {origem: None}
+        distancia = {origem: 0}
+        fila = deque([origem])
+        
+        while fila:
+            vertice_atual = fila.popleft()
+            visitados.append(vertice_atual)
+            yield Visita(vertice_atual, distancia[vertice_atual])
+            
+            if destino is not None and vertice_atual == destino:
+                break
+            
+            for vizinho, peso in grafo.obter_vizinhos(vertice_atual):
+                if vizinho not in predecessor:
+                    predecessor[vizinho] = vertice_atual
+                    distancia[vizinho] = distancia[vertice_atual] + 1
+                    fila.append(vizinho)
+                    yield Enfileiramento(vizinho, vertice_atual)
+        
+        caminho = None
+        encontrado = False
+        if destino is not None and destino in predecessor:
+            caminho = BFS._reconstruir_caminho(predecessor, origem, destino)
+            encontrado = True
+        
+        yield Fim({
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'distancia': distancia,
+            'caminho': caminho,
+            'encontrado': encontrado
+        })
+    
     @staticmethod
     def _reconstruir_caminho(predecessor: Dict, origem: int, destino: int) -> List[int]:
         """
@@ -173,7 +866,8 @@ class DFS:
     
     @staticmethod
     def buscar(grafo: Grafo, origem: int, destino: Optional[int] = None, 
-               usar_recursao: bool = True) -> Dict:
+               usar_recursao: bool = True, mostrar_passos: bool = True,
+               rastreador: Optional[Rastreador] = None) -> Dict:
         """
         Executa a busca em profundidade a partir de um vértice de origem.
         
@@ -190,6 +884,9 @@ class DFS:
             origem (int): Vértice de origem
             destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
             usar_recursao (bool): True para versão recursiva, False para iterativa
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
             
         Returns:
             Dict: Dicionário contendo:
@@ -198,96 +895,257 @@ class DFS:
                 - 'caminho': caminho até o destino (se especificado)
                 - 'encontrado': True se destino foi encontrado
         """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
         if usar_recursao:
-            return DFS._buscar_recursivo(grafo, origem, destino)
+            return DFS._buscar_recursivo(grafo, origem, destino, rastreador)
         else:
-            return DFS._buscar_iterativo(grafo, origem, destino)
+            return DFS._buscar_iterativo(grafo, origem, destino, rastreador)
     
     @staticmethod
-    def _buscar_recursivo(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Dict:
+    def percorrer(grafo: Grafo, origem: Optional[int] = None, mostrar_passos: bool = True,
+                  rastreador: Optional[Rastreador] = None) -> Dict:
         """
-        Implementação recursiva do DFS.
+        Percorre o grafo em profundidade, calculando pré-ordem, pós-ordem,
+        tempos de descoberta/término e predecessores, em O(V + E).
+        
+        FUNCIONAMENTO:
+        - Cada quadro da pilha é um vértice e um cursor para o próximo
+          vizinho a explorar no vetor CSR (a mesma ordem da versão
+          recursiva, sem o limite de recursão do Python: cadeias de milhões
+          de vértices); os cursores são inteiros em um array, sem um objeto
+          iterador por vértice para o coletor de lixo percorrer
+        - Os visitados ficam em um bytearray indexado pela linha CSR do
+          vértice (um byte por vértice)
+        - O relógio avança uma unidade a cada descoberta e a cada término,
+          como no DFS clássico: descoberta[v] < descoberta[w] < termino[w] <
+          termino[v] quando w é descendente de v
+        
+        Args:
+            grafo (Grafo): Grafo a ser percorrido (Grafo ou GrafoCompacto)
+            origem (Optional[int]): Vértice inicial; se None, percorre a
+                floresta inteira, iniciando árvores na ordem de obter_vertices()
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            
+        Returns:
+            Dict: Dicionário contendo:
+                - 'pre_ordem': vértices na ordem de descoberta
+                - 'pos_ordem': vértices na ordem de término
+                - 'descoberta': tempo de descoberta de cada vértice alcançado
+                - 'termino': tempo de término de cada vértice alcançado
+                - 'predecessor': pai de cada vértice na floresta DFS (None nas raízes)
         """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        ids, offsets, destinos, obter_linha, _ = _vetores_por_linha(grafo)
+        n = len(ids)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO DFS - PERCURSO COMPLETO (PILHA EXPLÍCITA)")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem if origem is not None else 'todos os vértices'}",
+                              algoritmo='DFS', origem=origem, destino=None)
+        
+        if origem is not None and obter_linha(origem) is None:
+            # Vértice sem arestas e fora do grafo: uma árvore com um só vértice
+            return {
+                'pre_ordem': [origem],
+                'pos_ordem': [origem],
+                'descoberta': {origem: 0},
+                'termino': {origem: 1},
+                'predecessor': {origem: None}
+            }
+        
+        visitado = bytearray(n)
+        pai = array('q', [-1]) * n
+        descoberta = array('q', [-1]) * n
+        termino = array('q', [-1]) * n
+        proximo = array('q', offsets)  # Cursor do próximo vizinho de cada linha
+        pre_ordem = []
+        pos_ordem = []
+        tempo = 0
+        
+        raizes = range(n) if origem is None else (obter_linha(origem),)
+        for raiz in raizes:
+            if visitado[raiz]:
+                continue
+            
+            visitado[raiz] = 1
+            descoberta[raiz] = tempo
+            tempo += 1
+            pre_ordem.append(raiz)
+            if ativo:
+                rastreador.evento('visita', f"\nNova árvore a partir de {ids[raiz]}",
+                                  vertice=ids[raiz], profundidade=0)
+            
+            pilha = [raiz]
+            
+            while pilha:
+                v = pilha[-1]
+                i = proximo[v]
+                fim = offsets[v + 1]
+                while i < fim and visitado[destinos[i]]:
+                    i += 1
+                
+                if i < fim:
+                    # Desce para o primeiro vizinho ainda não visitado
+                    w = destinos[i]
+                    proximo[v] = i + 1
+                    visitado[w] = 1
+                    pai[w] = v
+                    descoberta[w] = tempo
+                    tempo += 1
+                    pre_ordem.append(w)
+                    if ativo:
+                        rastreador.evento('visita',
+                                          f"{'  ' * len(pilha)}Visitando {ids[w]} "
+                                          f"(descoberta: {descoberta[w]})",
+                                          vertice=ids[w], profundidade=len(pilha))
+                    pilha.append(w)
+                else:
+                    # Todos os vizinhos explorados: termina o vértice e retrocede
+                    pilha.pop()
+                    termino[v] = tempo
+                    tempo += 1
+                    pos_ordem.append(v)
+                    if ativo:
+                        rastreador.evento('termino',
+                                          f"{'  ' * len(pilha)}Terminado {ids[v]} "
+                                          f"(término: {termino[v]})",
+                                          vertice=ids[v])
+        
+        if ativo:
+            rastreador.evento('fim', f"\nTotal de vértices percorridos: {len(pre_ordem)}",
+                              visitados=len(pre_ordem))
+        
+        # Converte linhas de volta para vértices
+        if n and ids[0] == 0 and ids[n - 1] == n - 1:
+            vertice = None
+        else:
+            vertice = ids.__getitem__
+            pre_ordem = list(map(vertice, pre_ordem))
+            pos_ordem = list(map(vertice, pos_ordem))
+        
+        linhas = pre_ordem if vertice is None else list(map(obter_linha, pre_ordem))
+        pais = [ids[p] if p >= 0 else None for p in map(pai.__getitem__, linhas)]
+        
+        return {
+            'pre_ordem': pre_ordem,
+            'pos_ordem': pos_ordem,
+            'descoberta': dict(zip(pre_ordem, map(descoberta.__getitem__, linhas))),
+            'termino': dict(zip(pre_ordem, map(termino.__getitem__, linhas))),
+            'predecessor': dict(zip(pre_ordem, pais))
+        }
+    
+    @staticmethod
+    def _buscar_recursivo(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                          rastreador: Rastreador = RASTREADOR_NULO) -> Dict:
+        """
+        DFS na ordem da versão recursiva, com uma pilha explícita de
+        iteradores de vizinhos (sem limite de recursão do Python).
+        """
+        ativo = rastreador.ativo
         visitados = []
         predecessor = {origem: None}
-        encontrado = [False]  # Usar lista para permitir modificação na recursão
-        
-        print(f"\n{'='*60}")
-        print(f"EXECUTANDO DFS - BUSCA EM PROFUNDIDADE (RECURSIVA)")
-        print(f"{'='*60}")
-        print(f"Origem: {origem}")
-        if destino is not None:
-            print(f"Destino: {destino}")
-        print(f"\nIniciando busca...")
-        
-        def dfs_recursivo_helper(vertice: int, profundidade: int = 0):
-            """Função auxiliar recursiva."""
-            # Se já encontrou o destino, não precisa continuar
-            if encontrado[0]:
-                return
-            
+        pilha = []  # Cada entrada: (vértice, iterador dos vizinhos que faltam explorar)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO DFS - BUSCA EM PROFUNDIDADE (RECURSIVA)")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='DFS',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+            rastreador.mensagem(f"\nIniciando busca...")
+        
+        def visitar(vertice: int, profundidade: int) -> bool:
+            """Visita um vértice e empilha seus vizinhos; retorna True se é o destino."""
             visitados.append(vertice)
-            print(f"\n{'  ' * profundidade}Visitando vértice: {vertice} (profundidade: {profundidade})")
+            if ativo:
+                rastreador.evento('visita',
+                                  f"\n{'  ' * profundidade}Visitando vértice: {vertice} (profundidade: {profundidade})",
+                                  vertice=vertice, profundidade=profundidade)
             
             # Verifica se encontrou o destino
             if destino is not None and vertice == destino:
-                print(f"\n{'  ' * profundidade}✓ Destino {destino} encontrado!")
-                encontrado[0] = True
-                return
+                if ativo:
+                    rastreador.evento('destino',
+                                      f"\n{'  ' * profundidade}✓ Destino {destino} encontrado!",
+                                      vertice=destino)
+                return True
             
-            # Explora vizinhos não visitados
             vizinhos = grafo.obter_vizinhos(vertice)
-            vizinhos_nao_visitados = [v for v, _ in vizinhos if v not in predecessor]
             
-            if vizinhos_nao_visitados:
-                print(f"{'  ' * profundidade}Explorando vizinhos: {vizinhos_nao_visitados}")
+            if ativo:
+                vizinhos_nao_visitados = [v for v, _ in vizinhos if v not in predecessor]
+                if vizinhos_nao_visitados:
+                    rastreador.evento('descoberta',
+                                      f"{'  ' * profundidade}Explorando vizinhos: {vizinhos_nao_visitados}",
+                                      vertice=vertice, vizinhos=vizinhos_nao_visitados)
             
+            pilha.append((vertice, iter(vizinhos)))
+            return False
+        
+        # Cada iteração desce para o próximo vizinho não visitado do topo da
+        # pilha ou, se não houver, retrocede (o retorno da recursão)
+        encontrado = visitar(origem, 0)
+        while pilha and not encontrado:
+            vertice, vizinhos = pilha[-1]
             for vizinho, peso in vizinhos:
-                if vizinho not in predecessor and not encontrado[0]:
+                if vizinho not in predecessor:
                     predecessor[vizinho] = vertice
-                    dfs_recursivo_helper(vizinho, profundidade + 1)
-        
-        # Inicia a busca recursiva
-        dfs_recursivo_helper(origem)
+                    encontrado = visitar(vizinho, len(pilha))
+                    break
+            else:
+                pilha.pop()
         
         # Reconstrói o caminho se um destino foi especificado
         caminho = None
         if destino is not None and destino in predecessor:
             caminho = DFS._reconstruir_caminho(predecessor, origem, destino)
-            print(f"\n{'='*60}")
-            print(f"CAMINHO ENCONTRADO:")
-            print(f"  {' -> '.join(map(str, caminho))}")
-            print(f"  Número de arestas: {len(caminho) - 1}")
-            print(f"{'='*60}")
-        elif destino is not None:
-            print(f"\n✗ Destino {destino} não foi encontrado (não há caminho)")
+            if ativo:
+                DFS._rastrear_caminho(rastreador, caminho)
+        elif destino is not None and ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
         
-        print(f"\nVértices visitados na ordem: {visitados}")
-        print(f"Total de vértices explorados: {len(visitados)}")
+        if ativo:
+            DFS._rastrear_fim(rastreador, visitados)
         
         return {
             'visitados': visitados,
             'predecessor': predecessor,
             'caminho': caminho,
-            'encontrado': encontrado[0]
+            'encontrado': encontrado
         }
     
     @staticmethod
-    def _buscar_iterativo(grafo: Grafo, origem: int, destino: Optional[int] = None) -> Dict:
+    def _buscar_iterativo(grafo: Grafo, origem: int, destino: Optional[int] = None,
+                          rastreador: Rastreador = RASTREADOR_NULO) -> Dict:
         """
         Implementação iterativa do DFS usando pilha.
         """
+        ativo = rastreador.ativo
         visitados = []
+        visitados_conjunto = set()  # Mesmo conteúdo de 'visitados', consulta O(1)
         predecessor = {origem: None}
         pilha = [origem]  # Pilha para DFS
+        na_pilha = {origem}  # Vértices na pilha (um vértice nunca é empilhado duas vezes)
         
-        print(f"\n{'='*60}")
-        print(f"EXECUTANDO DFS - BUSCA EM PROFUNDIDADE (ITERATIVA)")
-        print(f"{'='*60}")
-        print(f"Origem: {origem}")
-        if destino is not None:
-            print(f"Destino: {destino}")
-        print(f"\nIniciando busca...")
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO DFS - BUSCA EM PROFUNDIDADE (ITERATIVA)")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Origem: {origem}", algoritmo='DFS',
+                              origem=origem, destino=destino)
+            if destino is not None:
+                rastreador.mensagem(f"Destino: {destino}")
+            rastreador.mensagem(f"\nIniciando busca...")
         
         passo = 1
         
@@ -295,20 +1153,27 @@ class DFS:
         while pilha:
             # Remove o último vértice da pilha (topo)
             vertice_atual = pilha.pop()
+            na_pilha.discard(vertice_atual)
             
             # Se já foi visitado, pula
-            if vertice_atual in visitados:
+            if vertice_atual in visitados_conjunto:
                 continue
             
             visitados.append(vertice_atual)
+            visitados_conjunto.add(vertice_atual)
             
-            print(f"\nPasso {passo}:")
-            print(f"  Visitando vértice: {vertice_atual}")
-            print(f"  Pilha atual: {pilha}")
+            if ativo:
+                rastreador.evento('visita',
+                                  f"\nPasso {passo}:\n"
+                                  f"  Visitando vértice: {vertice_atual}\n"
+                                  f"  Pilha atual: {pilha}",
+                                  passo=passo, vertice=vertice_atual, pilha=list(pilha))
             
             # Se encontrou o destino, pode parar
             if destino is not None and vertice_atual == destino:
-                print(f"\n✓ Destino {destino} encontrado!")
+                if ativo:
+                    rastreador.evento('destino', f"\n✓ Destino {destino} encontrado!",
+                                      vertice=destino)
                 break
             
             # Explora todos os vizinhos (adiciona na pilha em ordem reversa)
@@ -316,16 +1181,20 @@ class DFS:
             vizinhos_nao_visitados = []
             
             for vizinho, peso in reversed(vizinhos):
-                if vizinho not in visitados and vizinho not in [v for v in pilha]:
+                if vizinho not in visitados_conjunto and vizinho not in na_pilha:
                     if vizinho not in predecessor:
                         predecessor[vizinho] = vertice_atual
                     pilha.append(vizinho)
+                    na_pilha.add(vizinho)
                     vizinhos_nao_visitados.append(vizinho)
             
-            if vizinhos_nao_visitados:
-                print(f"  Novos vizinhos adicionados à pilha: {vizinhos_nao_visitados}")
-            else:
-                print(f"  Nenhum vizinho novo encontrado")
+            if ativo:
+                if vizinhos_nao_visitados:
+                    texto = f"  Novos vizinhos adicionados à pilha: {vizinhos_nao_visitados}"
+                else:
+                    texto = f"  Nenhum vizinho novo encontrado"
+                rastreador.evento('descoberta', texto, vertice=vertice_atual,
+                                  vizinhos=vizinhos_nao_visitados)
             
             passo += 1
         
@@ -335,16 +1204,15 @@ class DFS:
         if destino is not None and destino in predecessor:
             caminho = DFS._reconstruir_caminho(predecessor, origem, destino)
             encontrado = True
-            print(f"\n{'='*60}")
-            print(f"CAMINHO ENCONTRADO:")
-            print(f"  {' -> '.join(map(str, caminho))}")
-            print(f"  Número de arestas: {len(caminho) - 1}")
-            print(f"{'='*60}")
-        elif destino is not None:
-            print(f"\n✗ Destino {destino} não foi encontrado (não há caminho)")
+            if ativo:
+                DFS._rastrear_caminho(rastreador, caminho)
+        elif destino is not None and ativo:
+            rastreador.evento('sem_caminho',
+                              f"\n✗ Destino {destino} não foi encontrado (não há caminho)",
+                              destino=destino)
         
-        print(f"\nVértices visitados na ordem: {visitados}")
-        print(f"Total de vértices explorados: {len(visitados)}")
+        if ativo:
+            DFS._rastrear_fim(rastreador, visitados)
         
         return {
             'visitados': visitados,
@@ -353,6 +1221,153 @@ class DFS:
             'encontrado': encontrado
         }
     
+    @staticmethod
+    def passos(grafo: Grafo, origem: int, destino: Optional[int] = None,
+               usar_recursao: bool = True) -> Iterator[Evento]:
+        """
+        Executa a busca em profundidade passo a passo (gerador de eventos).
+        
+        A versão recursiva é reproduzida com uma pilha explícita de
+        iteradores de vizinhos (um gerador não pode pausar dentro de uma
+        recursão sem repassar cada evento pelos níveis de cima), visitando
+        os vértices exatamente na mesma ordem de DFS.buscar.
+        
+        Args:
+            grafo (Grafo): Grafo a ser explorado
+            origem (int): Vértice de origem
+            destino (Optional[int]): Vértice de destino (None para explorar todo o grafo)
+            usar_recursao (bool): True para a ordem da versão recursiva,
+                False para a ordem da versão iterativa
+            
+        Returns:
+            Iterator[Evento]: Gerador de eventos Visita (vértice visitado,
+                com sua profundidade), Enfileiramento (vizinho descoberto) e,
+                por último, Fim com o mesmo resultado de DFS.buscar
+        """
+        if usar_recursao:
+            return DFS._passos_recursivo(grafo, origem, destino)
+        else:
+            return DFS._passos_iterativo(grafo, origem, destino)
+    
+    @staticmethod
+    def _passos_recursivo(grafo: Grafo, origem: int,
+                          destino: Optional[int] = None) -> Iterator[Evento]:
+        """
+        Gerador de eventos na ordem do DFS recursivo.
+        """
+        visitados = [origem]
+        predecessor = {origem: None}
+        encontrado = False
+        
+        yield Visita(origem, 0)
+        if destino is not None and origem == destino:
+            encontrado = True
+            pilha = []
+        else:
+            # Cada entrada: (vértice, iterador dos vizinhos que faltam explorar)
+            pilha = [(origem, iter(grafo.obter_vizinhos(origem)))]
+        
+        while pilha:
+            vertice, vizinhos = pilha[-1]
+            for vizinho, peso in vizinhos:
+                if vizinho not in predecessor:
+                    break
+            else:
+                # Todos os vizinhos explorados: retrocede
+                pilha.pop()
+                continue
+            
+            predecessor[vizinho] = vertice
+            yield Enfileiramento(vizinho, vertice)
+            
+            visitados.append(vizinho)
+            yield Visita(vizinho, len(pilha))
+            
+            if destino is not None and vizinho == destino:
+                encontrado = True
+                break
+            
+            pilha.append((vizinho, iter(grafo.obter_vizinhos(vizinho))))
+        
+        caminho = None
+        if destino is not None and destino in predecessor:
+            caminho = DFS._reconstruir_caminho(predecessor, origem, destino)
+        
+        yield Fim({
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'encontrado': encontrado
+        })
+    
+    @staticmethod
+    def _passos_iterativo(grafo: Grafo, origem: int,
+                          destino: Optional[int] = None) -> Iterator[Evento]:
+        """
+        Gerador de eventos na ordem do DFS iterativo.
+        """
+        visitados = []
+        visitados_conjunto = set()
+        predecessor = {origem: None}
+        profundidade = {origem: 0}
+        pilha = [origem]
+        na_pilha = {origem}  # Um vértice nunca é empilhado duas vezes
+        
+        while pilha:
+            vertice_atual = pilha.pop()
+            na_pilha.discard(vertice_atual)
+            
+            if vertice_atual in visitados_conjunto:
+                continue
+            
+            visitados.append(vertice_atual)
+            visitados_conjunto.add(vertice_atual)
+            yield Visita(vertice_atual, profundidade[vertice_atual])
+            
+            if destino is not None and vertice_atual == destino:
+                break
+            
+            for vizinho, peso in reversed(grafo.obter_vizinhos(vertice_atual)):
+                if vizinho not in visitados_conjunto and vizinho not in na_pilha:
+                    if vizinho not in predecessor:
+                        predecessor[vizinho] = vertice_atual
+                        profundidade[vizinho] = profundidade[vertice_atual] + 1
+                    pilha.append(vizinho)
+                    na_pilha.add(vizinho)
+                    yield Enfileiramento(vizinho, vertice_atual)
+        
+        caminho = None
+        encontrado = False
+        if destino is not None and destino in predecessor:
+            caminho = DFS._reconstruir_caminho(predecessor, origem, destino)
+            encontrado = True
+        
+        yield Fim({
+            'visitados': visitados,
+            'predecessor': predecessor,
+            'caminho': caminho,
+            'encontrado': encontrado
+        })
+    
+    @staticmethod
+    def _rastrear_caminho(rastreador: Rastreador, caminho: List[int]):
+        """Envia ao rastreador o caminho encontrado."""
+        rastreador.mensagem(f"\n{'='*60}")
+        rastreador.evento('caminho',
+                          f"CAMINHO ENCONTRADO:\n"
+                          f"  {' -> '.join(map(str, caminho))}\n"
+                          f"  Número de arestas: {len(caminho) - 1}",
+                          caminho=caminho, custo=len(caminho) - 1)
+        rastreador.mensagem(f"{'='*60}")
+    
+    @staticmethod
+    def _rastrear_fim(rastreador: Rastreador, visitados: List[int]):
+        """Envia ao rastreador o resumo final da busca."""
+        rastreador.evento('fim',
+                          f"\nVértices visitados na ordem: {visitados}\n"
+                          f"Total de vértices explorados: {len(visitados)}",
+                          visitados=len(visitados))
+    
     @staticmethod
     def _reconstruir_caminho(predecessor: Dict, origem: int, destino: int) -> List[int]:
         """
@@ -0,0 +1,333 @@
+"""
+BFS de Todas as Origens em Paralelo
+===================================
+Calcula as distâncias (em número de arestas) a partir de todos os vértices,
+ou de um conjunto de origens, distribuindo as origens entre processos.
+
+CONCEITOS:
+----------
+Diâmetro, raio, excentricidade e centralidade de proximidade precisam da
+distância entre todos os pares de vértices: uma BFS por origem, V BFS ao
+todo. Cada BFS é independente das outras, então as origens são divididas
+em lotes e cada lote é processado por um trabalhador de um
+ProcessPoolExecutor (processos, e não threads: o laço da BFS é Python puro
+e não libera o GIL).
+
+COMPARTILHAMENTO DO GRAFO:
+--------------------------
+Os vetores CSR (offsets e destinos, int64) são copiados uma única vez para
+um bloco de memória compartilhada (multiprocessing.shared_memory). Cada
+trabalhador se conecta ao bloco ao iniciar e lê os vetores direto dele;
+as tarefas enviadas carregam apenas a lista de origens do lote, nunca o
+grafo.
+
+RESULTADOS:
+-----------
+- distancias_todas_origens: gera um par (origem, linha de distâncias) por
+  origem, à medida que os lotes terminam. Cada linha é um array('i') de V
+  posições (4 bytes por vértice, -1 = inalcançável)
+- estatisticas_distancias: cada trabalhador devolve só três números por
+  origem (alcançados, soma das distâncias, excentricidade); nenhuma linha
+  de distâncias sai do trabalhador
+
+Em ambos os casos cada trabalhador usa O(V) de memória por BFS, e no
+máximo 2 lotes por processo ficam aguardando consumo.
+
+USO:
+----
+    for origem, distancias in distancias_todas_origens(grafo, processos=4):
+        ...   # distancias[i] = distância até grafo.obter_vertices()[i]
+
+    estatisticas = estatisticas_distancias(grafo)
+    print(estatisticas['diametro'], estatisticas['raio'])
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from bfs_dfs import _vetores_por_linha
+from grafo import Grafo
+
+
+TAMANHO_LOTE = 32
+
+# Vetores CSR do processo trabalhador: (memória, offsets, destinos, n)
+_csr = None
+
+
+def _bfs_linha(offsets: Sequence[int], destinos: Sequence[int], n: int,
+               linha: int) -> Tuple[array, int, int, int]:
+    """
+    BFS nível a nível a partir de uma linha do CSR.
+    
+    Args:
+        offsets (Sequence[int]): Início das arestas de cada linha
+        destinos (Sequence[int]): Linha do destino de cada aresta
+        n (int): Número de vértices
+        linha (int): Linha da origem
+    
+    Returns:
+        Tuple[array, int, int, int]: (distâncias, vértices alcançados além da
+            origem, soma das distâncias, excentricidade)
+    """
+    distancia = array('i', [-1]) * n
+    distancia[linha] = 0
+    fronteira = [linha]
+    nivel = 0
+    alcancados = 0
+    soma = 0
+    
+    while True:
+        proxima = []
+        for u in fronteira:
+            for v in destinos[offsets[u]:offsets[u + 1]]:
+                if distancia[v] < 0:
+                    distancia[v] = nivel + 1
+                    proxima.append(v)
+        if not proxima:
+            break
+        nivel += 1
+        alcancados += len(proxima)
+        soma += nivel * len(proxima)
+        fronteira = proxima
+    
+    return distancia, alcancados, soma, nivel
+
+
+def _calcular_lote(offsets: Sequence[int], destinos: Sequence[int], n: int,
+                   linhas: List[int], resumir: bool) -> List[Tuple]:
+    """
+    Executa a BFS de cada linha do lote.
+    
+    Returns:
+        List[Tuple]: (linha, distâncias) ou, com resumir=True,
+            (linha, alcançados, soma, excentricidade)
+    """
+    resultados = []
+    for linha in linhas:
+        distancia, alcancados, soma, excentricidade = _bfs_linha(offsets, destinos, n, linha)
+        if resumir:
+            resultados.append((linha, alcancados, soma, excentricidade))
+        else:
+            resultados.append((linha, distancia))
+    return resultados
+
+
+def _inicializar_trabalhador(nome: str, n: int, total: int):
+    """Conecta o processo trabalhador ao bloco compartilhado com o CSR."""
+    global _csr
+    memoria = shared_memory.SharedMemory(name=nome)
+    vetor = memoria.buf.cast('q')
+    _csr = (memoria, vetor[:n + 1], vetor[n + 1:n + 1 + total], n)
+
+
+def _processar_lote(linhas: List[int], resumir: bool) -> List[Tuple]:
+    """Tarefa executada no trabalhador: lê o grafo do bloco compartilhado."""
+    _, offsets, destinos, n = _csr
+    return _calcular_lote(offsets, destinos, n, linhas, resumir)
+
+
+def _executar(grafo: Grafo, origens: Optional[Iterable[int]], processos: Optional[int],
+              tamanho_lote: int, resumir: bool) -> Iterator[Tuple]:
+    """
+    Divide as origens em lotes e gera os resultados de cada origem, na ordem
+    das origens, convertendo linhas de volta para vértices.
+    """
+    ids, offsets, destinos, obter_linha, _ = _vetores_por_linha(grafo)
+    n = len(ids)
+    
+    if origens is None:
+        linhas = range(n)
+    else:
+        linhas = []
+        for origem in origens:
+            linha = obter_linha(origem)
+            if linha is None:
+                raise ValueError(f"Vértice {origem} não pertence ao grafo")
+            linhas.append(linha)
+    
+    if tamanho_lote < 1:
+        raise ValueError("O tamanho do lote deve ser pelo menos 1")
+    lotes = [list(linhas[i:i + tamanho_lote]) for i in range(0, len(linhas), tamanho_lote)]
+    
+    if processos is None:
+        processos = os.cpu_count() or 1
+    processos = min(processos, len(lotes))
+    
+    if processos <= 1:
+        for lote in lotes:
+            for resultado in _calcular_lote(offsets, destinos, n, lote, resumir):
+                yield (ids[resultado[0]],) + resultado[1:]
+        return
+    
+    # Copia o CSR uma única vez para a memória compartilhada
+    total = len(destinos)
+    memoria = shared_memory.SharedMemory(create=True, size=8 * (n + 1 + total))
+    try:
+        vetor = memoria.buf.cast('q')
+        vetor[:n + 1] = memoryview(offsets).cast('B').cast('q')
+        vetor[n + 1:] = memoryview(destinos).cast('B').cast('q')
+        vetor.release()
+        
+        with ProcessPoolExecutor(processos, initializer=_inicializar_trabalhador,
+                                 initargs=(memoria.name, n, total)) as executor:
+            # No máximo 2 lotes por processo aguardando consumo
+            pendentes = deque()
+            proximo_lote = iter(lotes)
+            for lote in proximo_lote:
+                pendentes.append(executor.submit(_processar_lote, lote, resumir))
+                if len(pendentes) >= 2 * processos:
+                    break
+            
+            while pendentes:
+                resultados = pendentes.popleft().result()
+                lote = next(proximo_lote, None)
+                if lote is not None:
+                    pendentes.append(executor.submit(_processar_lote, lote, resumir))
+                for resultado in resultados:
+                    yield (ids[resultado[0]],) + resultado[1:]
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def distancias_todas_origens(grafo: Grafo, origens: Optional[Iterable[int]] = None,
+                             processos: Optional[int] = None,
+                             tamanho_lote: int = TAMANHO_LOTE) -> Iterator[Tuple[int, array]]:
+    """
+    Gera as distâncias em número de arestas a partir de cada origem.
+    
+    Args:
+        grafo (Grafo): Grafo (Grafo ou GrafoCompacto); os pesos são ignorados
+        origens (Optional[Iterable[int]]): Origens (None = todos os vértices)
+        processos (Optional[int]): Número de processos (None = número de CPUs;
+            1 = no próprio processo, sem pool)
+        tamanho_lote (int): Origens por tarefa enviada a um trabalhador
+    
+    Yields:
+        Tuple[int, array]: (origem, distâncias), na ordem das origens.
+            distancias[i] é a distância até grafo.obter_vertices()[i]
+            (-1 se inalcançável)
+    
+    Raises:
+        ValueError: Se uma origem não pertence ao grafo
+    """
+    for origem, distancia in _executar(grafo, origens, processos, tamanho_lote, False):
+        yield origem, distancia
+
+
+def estatisticas_distancias(grafo: Grafo, origens: Optional[Iterable[int]] = None,
+                            processos: Optional[int] = None,
+                            tamanho_lote: int = TAMANHO_LOTE) -> Dict:
+    """
+    Calcula estatísticas de distância (sem pesos) de todas as origens.
+    
+    Em grafos desconexos (ou direcionados), cada origem considera apenas os
+    vértices que ela alcança.
+    
+    Args:
+        grafo (Grafo): Grafo (Grafo ou GrafoCompacto); os pesos são ignorados
+        origens (Optional[Iterable[int]]): Origens (None = todos os vértices)
+        processos (Optional[int]): Número de processos (None = número de CPUs)
+        tamanho_lote (int): Origens por tarefa enviada a um trabalhador
+    
+    Returns:
+        Dict: Dicionário contendo:
+            - 'excentricidade': maior distância de cada origem a um vértice alcançável
+            - 'proximidade': centralidade de proximidade de Wasserman–Faust,
+              (alcançados / (V - 1)) * (alcançados / soma das distâncias)
+            - 'alcancados': número de vértices alcançados por cada origem (sem contar ela)
+            - 'diametro': maior excentricidade
+            - 'raio': menor excentricidade entre as origens que alcançam algum vértice
+            - 'centro': origens com excentricidade igual ao raio
+            - 'distancia_media': média das distâncias entre pares alcançáveis
+    
+    Raises:
+        ValueError: Se uma origem não pertence ao grafo
+    """
+    n = len(grafo.obter_vertices())
+    excentricidade = {}
+    proximidade = {}
+    alcancados = {}
+    soma_total = 0
+    pares = 0
+    
+    for origem, alcancados_origem, soma, maior in _executar(grafo, origens, processos,
+                                                             tamanho_lote, True):
+        excentricidade[origem] = maior
+        alcancados[origem] = alcancados_origem
+        if soma:
+            proximidade[origem] = (alcancados_origem / (n - 1)) * (alcancados_origem / soma)
+        else:
+            proximidade[origem] = 0.0
+        soma_total += soma
+        pares += alcancados_origem
+    
+    diametro = max(excentricidade.values(), default=0)
+    # Origens que não alcançam nenhum vértice (sumidouros) não definem o raio
+    raio = min((e for v, e in excentricidade.items() if alcancados[v]), default=0)
+    
+    return {
+        'excentricidade': excentricidade,
+        'proximidade': proximidade,
+        'alcancados': alcancados,
+        'diametro': diametro,
+        'raio': raio,
+        'centro': [v for v, e in excentricidade.items() if e == raio and alcancados[v]],
+        'distancia_media': soma_total / pares if pares else 0.0
+    }
+
+
+def demonstrar_bfs_paralela():
+    """
+    Demonstra as estatísticas de distância na rede de computadores e em um
+    grafo gerado maior, com vários processos.
+    """
+    import time
+    from geradores import GeradorGrafos
+    from grafo import GrafoExemplos
+    
+    print("\n" + "="*70)
+    print("DEMONSTRAÇÃO: BFS DE TODAS AS ORIGENS EM PARALELO")
+    print("="*70)
+    
+    grafo = GrafoExemplos.criar_mapa_cidade()
+    nomes = GrafoExemplos.obter_nomes_mapa_cidade()
+    estatisticas = estatisticas_distancias(grafo, processos=1)
+    
+    print("\nMapa da cidade (número de ruas entre os locais):")
+    print(f"  Diâmetro: {estatisticas['diametro']}")
+    print(f"  Raio: {estatisticas['raio']}")
+    print(f"  Centro: {', '.join(nomes[v] for v in estatisticas['centro'])}")
+    print(f"  Distância média: {estatisticas['distancia_media']:.2f}")
+    mais_central = max(estatisticas['proximidade'], key=estatisticas['proximidade'].get)
+    print(f"  Maior proximidade: {nomes[mais_central]} "
+          f"({estatisticas['proximidade'][mais_central]:.3f})")
+    
+    print("\nRuas a partir do Hospital (3) e da Farmácia (14):")
+    for origem, distancias in distancias_todas_origens(grafo, origens=[3, 14], processos=1):
+        print(f"  {nomes[origem]}: {list(distancias)}")
+    
+    num_vertices = 10_000
+    grafo = GeradorGrafos.barabasi_albert(num_vertices, 3)
+    origens = range(0, num_vertices, 50)
+    processos = os.cpu_count() or 1
+    
+    print(f"\nBarabási–Albert com {num_vertices} vértices, {len(origens)} origens, "
+          f"{processos} processo(s):")
+    inicio = time.perf_counter()
+    estatisticas = estatisticas_distancias(grafo, origens=origens, processos=processos)
+    print(f"  Diâmetro (entre as origens): {estatisticas['diametro']}")
+    print(f"  Distância média: {estatisticas['distancia_media']:.2f}")
+    print(f"  Tempo: {time.perf_counter() - inicio:.2f} s")
+
+
+if __name__ == "__main__":
+    demonstrar_bfs_paralela()
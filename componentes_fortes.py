@@ -0,0 +1,248 @@
+"""
+Componentes Fortemente Conexos: Algoritmo de Tarjan
+===================================================
+Implementação iterativa do algoritmo de Tarjan e construção do grafo de
+condensação (DAG dos componentes).
+
+CONCEITOS:
+----------
+COMPONENTE FORTEMENTE CONEXO (SCC):
+- Conjunto máximo de vértices em que cada um alcança todos os outros
+  seguindo as arestas direcionadas
+- Todo ciclo do grafo está inteiro dentro de um componente: os componentes
+  com mais de um vértice (ou com laço) são exatamente os grupos de
+  dependências circulares
+
+ALGORITMO DE TARJAN:
+- Uma única DFS; cada vértice recebe um índice de descoberta e o 'menor'
+  índice alcançável pela sua subárvore (low-link)
+- Os vértices ficam em uma pilha auxiliar; quando menor[v] == indice[v],
+  v é a raiz de um componente, formado por v e tudo acima dele na pilha
+- A DFS usa uma pilha explícita com um cursor por vértice (posição do
+  próximo vizinho no vetor CSR): sem limite de recursão
+- Complexidade: O(V + E)
+
+CONDENSAÇÃO:
+- Cada componente vira um vértice; há uma aresta A -> B se alguma aresta
+  do grafo sai de um vértice de A e chega a um de B
+- O resultado é sempre um DAG (sem ciclos)
+- Os componentes são numerados em ordem topológica: toda aresta da
+  condensação vai de um id menor para um id maior
+
+APLICAÇÕES PRÁTICAS:
+-------------------
+- Encontrar todos os grupos de dependências circulares de uma vez
+- Análise de alcançabilidade em redes (links entre páginas, chamadas entre funções)
+- Primeiro passo de algoritmos sobre grafos com ciclos (2-SAT, ordenação)
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+from array import array
+from typing import Dict, Optional
+
+from bfs_dfs import _vetores_por_linha
+from grafo import Grafo
+from rastreamento import Rastreador, obter_rastreador
+
+
+class Tarjan:
+    """
+    Implementação iterativa do algoritmo de Tarjan.
+    """
+    
+    @staticmethod
+    def componentes(grafo: Grafo, mostrar_passos: bool = True,
+                    rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Encontra os componentes fortemente conexos e a condensação do grafo.
+        
+        FUNCIONAMENTO:
+        1. Para cada vértice ainda não descoberto, inicia uma DFS
+        2. Ao descobrir v: indice[v] = menor[v] = contador; v vai para a pilha
+        3. Para cada aresta v -> w:
+           - w não descoberto: desce para w e, ao voltar,
+             menor[v] = min(menor[v], menor[w])
+           - w ainda na pilha: menor[v] = min(menor[v], indice[w])
+        4. Ao terminar v com menor[v] == indice[v]: desempilha até v,
+           formando um componente
+        5. Monta a condensação, sem arestas repetidas
+        
+        Args:
+            grafo (Grafo): Grafo direcionado (Grafo ou GrafoCompacto)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+        
+        Returns:
+            Dict: Dicionário contendo:
+                - 'componente': id do componente de cada vértice
+                - 'componentes': vértices de cada componente (índice = id),
+                  em ordem topológica da condensação
+                - 'condensacao': Grafo direcionado entre os ids dos componentes
+                  (componentes sem arestas para outros não aparecem nele)
+                - 'ciclicos': ids dos componentes que contêm ciclo (mais de um
+                  vértice ou laço)
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        ids, offsets, destinos, obter_linha, _ = _vetores_por_linha(grafo)
+        n = len(ids)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO TARJAN - COMPONENTES FORTEMENTE CONEXOS")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Vértices: {n}  Arestas: {len(destinos)}",
+                              algoritmo='Tarjan', vertices=n)
+        
+        indice = array('q', [-1]) * n
+        menor = array('q', [0]) * n
+        na_pilha = bytearray(n)
+        proximo = array('q', offsets)  # Cursor do próximo vizinho de cada linha
+        componente = array('q', [-1]) * n
+        pilha = []       # Pilha auxiliar do Tarjan
+        grupos = []      # Componentes na ordem em que se fecham (topológica reversa)
+        contador = 0
+        
+        for raiz in range(n):
+            if indice[raiz] >= 0:
+                continue
+            
+            indice[raiz] = menor[raiz] = contador
+            contador += 1
+            pilha.append(raiz)
+            na_pilha[raiz] = 1
+            chamadas = [raiz]  # Caminho atual da DFS
+            
+            while chamadas:
+                v = chamadas[-1]
+                i = proximo[v]
+                fim = offsets[v + 1]
+                descer = -1
+                while i < fim:
+                    w = destinos[i]
+                    i += 1
+                    if indice[w] < 0:
+                        descer = w
+                        break
+                    if na_pilha[w] and indice[w] < menor[v]:
+                        menor[v] = indice[w]
+                proximo[v] = i
+                
+                if descer >= 0:
+                    indice[descer] = menor[descer] = contador
+                    contador += 1
+                    pilha.append(descer)
+                    na_pilha[descer] = 1
+                    chamadas.append(descer)
+                    continue
+                
+                # v terminou: propaga o low-link para o pai na DFS
+                chamadas.pop()
+                if chamadas and menor[v] < menor[chamadas[-1]]:
+                    menor[chamadas[-1]] = menor[v]
+                
+                if menor[v] == indice[v]:
+                    # v é raiz de um componente: desempilha até ele
+                    grupo = []
+                    numero = len(grupos)
+                    while True:
+                        w = pilha.pop()
+                        na_pilha[w] = 0
+                        componente[w] = numero
+                        grupo.append(w)
+                        if w == v:
+                            break
+                    grupo.reverse()
+                    grupos.append(grupo)
+        
+        # Renumera em ordem topológica: o último componente fechado é uma fonte
+        total = len(grupos)
+        grupos.reverse()
+        for linha in range(n):
+            componente[linha] = total - 1 - componente[linha]
+        
+        # Condensação: uma aresta por par de componentes, sem repetição
+        origens = []
+        destinos_condensacao = []
+        ciclicos = []
+        marcado = array('q', [-1]) * total
+        for c, grupo in enumerate(grupos):
+            ciclico = len(grupo) > 1
+            for u in grupo:
+                for w in destinos[offsets[u]:offsets[u + 1]]:
+                    d = componente[w]
+                    if d == c:
+                        ciclico = ciclico or w == u
+                    elif marcado[d] != c:
+                        marcado[d] = c
+                        origens.append(c)
+                        destinos_condensacao.append(d)
+            if ciclico:
+                ciclicos.append(c)
+        
+        condensacao = Grafo(total, direcionado=True)
+        if origens:
+            condensacao.adicionar_arestas(origens, destinos_condensacao)
+        
+        # Converte linhas de volta para vértices
+        if n and ids[0] == 0 and ids[n - 1] == n - 1:
+            componentes = grupos
+            mapa_componente = dict(zip(range(n), componente))
+        else:
+            componentes = [[ids[u] for u in grupo] for grupo in grupos]
+            mapa_componente = dict(zip(ids, componente))
+        
+        if ativo:
+            for c in ciclicos:
+                rastreador.evento('componente',
+                                  f"  Componente {c} (cíclico): {componentes[c]}",
+                                  componente=c, vertices=componentes[c])
+            rastreador.evento('fim',
+                              f"\nComponentes: {total}  Com ciclo: {len(ciclicos)}\n"
+                              f"Arestas da condensação: {len(origens)}",
+                              componentes=total)
+        
+        return {
+            'componente': mapa_componente,
+            'componentes': componentes,
+            'condensacao': condensacao,
+            'ciclicos': ciclicos
+        }
+
+
+def demonstrar_componentes():
+    """
+    Função de demonstração do algoritmo de Tarjan no sistema de dependências.
+    """
+    from aplicacoes_praticas import AplicacaoDependencias
+    
+    print("\n" + "="*70)
+    print("DEMONSTRAÇÃO: COMPONENTES FORTEMENTE CONEXOS (TARJAN)")
+    print("="*70)
+    
+    grafo = AplicacaoDependencias.criar_sistema()
+    nomes = AplicacaoDependencias.obter_nomes()
+    
+    # Uma dependência a mais cria um segundo grupo circular
+    grafo.adicionar_aresta(8, 1)  # Crypto -> WebFramework
+    print("\nSistema de dependências + aresta Crypto -> WebFramework")
+    
+    resultado = Tarjan.componentes(grafo)
+    
+    print("\nGrupos de dependências circulares:")
+    for c in resultado['ciclicos']:
+        print(f"  Componente {c}: {', '.join(nomes[v] for v in resultado['componentes'][c])}")
+    
+    print("\nCondensação (DAG entre componentes):")
+    for u, v, _ in resultado['condensacao'].obter_arestas():
+        origem = ', '.join(nomes[x] for x in resultado['componentes'][u])
+        destino = ', '.join(nomes[x] for x in resultado['componentes'][v])
+        print(f"  [{origem}] -> [{destino}]")
+
+
+if __name__ == "__main__":
+    demonstrar_componentes()
@@ -0,0 +1,89 @@
+"""
+Módulo de Eventos: Passos Tipados dos Algoritmos
+=================================================
+Tipos dos eventos produzidos pelo modo "passo a passo" dos algoritmos
+(BFS.passos, DFS.passos, BellmanFord.passos, Dijkstra.passos,
+Kruskal.passos, Prim.passos).
+
+CONCEITOS:
+----------
+Cada método passos() é um gerador: ele executa o algoritmo apenas até o
+próximo evento e pausa. Quem consome (a GUI, um teste, um relatório)
+decide o ritmo, pedindo um evento de cada vez com next() ou um laço for.
+Nada é acumulado: a execução inteira nunca fica guardada em memória.
+
+    for evento in Dijkstra.passos(grafo, 0, 5):
+        if isinstance(evento, Relaxamento):
+            print(evento.v, evento.distancia)
+
+O último evento é sempre Fim, que carrega o mesmo dicionário de
+resultado da chamada normal (menor_caminho, buscar, mst).
+
+A chamada normal continua sendo um laço único, sem geradores; o modo
+passo a passo é uma alternativa, não uma camada por cima dela.
+
+EVENTOS:
+--------
+- Visita(vertice, distancia):          vértice retirado da fila/pilha/heap
+- Enfileiramento(vertice, predecessor): vértice descoberto e colocado na fila/pilha
+- Relaxamento(u, v, peso, distancia):  distância de v melhorada pela aresta u -> v
+- ArestaAceita(u, v, peso):            aresta incluída na árvore geradora mínima
+- ArestaRejeitada(u, v, peso):         aresta descartada (formaria ciclo)
+- CicloNegativo(u, v, peso):           aresta que ainda relaxa após V-1 iterações
+- Fim(resultado):                      fim da execução, com o resultado completo
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+from typing import Dict, NamedTuple, Union
+
+
+class Visita(NamedTuple):
+    """Vértice retirado da estrutura de controle e processado."""
+    vertice: int
+    distancia: float  # Nível (BFS), profundidade (DFS) ou custo (Dijkstra)
+
+
+class Enfileiramento(NamedTuple):
+    """Vértice descoberto e colocado na fila (BFS) ou pilha (DFS)."""
+    vertice: int
+    predecessor: int
+
+
+class Relaxamento(NamedTuple):
+    """Distância de v melhorada pela aresta u -> v."""
+    u: int
+    v: int
+    peso: float
+    distancia: float  # Nova distância de v
+
+
+class ArestaAceita(NamedTuple):
+    """Aresta incluída na árvore geradora mínima."""
+    u: int
+    v: int
+    peso: float
+
+
+class ArestaRejeitada(NamedTuple):
+    """Aresta descartada por ligar vértices já conectados."""
+    u: int
+    v: int
+    peso: float
+
+
+class CicloNegativo(NamedTuple):
+    """Aresta que ainda pode ser relaxada: há ciclo de peso negativo."""
+    u: int
+    v: int
+    peso: float
+
+
+class Fim(NamedTuple):
+    """Último evento: resultado completo, igual ao da chamada normal."""
+    resultado: Dict
+
+
+Evento = Union[Visita, Enfileiramento, Relaxamento, ArestaAceita,
+               ArestaRejeitada, CicloNegativo, Fim]
@@ -0,0 +1,478 @@
+"""
+Módulo de Geradores: Grafos Sintéticos Grandes
+===============================================
+Este módulo gera grafos aleatórios reproduzíveis (com semente) de 10^3 a
+10^7 arestas, para benchmarks e testes de estresse sem depender de
+arquivos externos.
+
+MODELOS:
+--------
+- Erdős–Rényi: cada par de vértices é ligado com probabilidade p, G(n, p),
+  ou sorteiam-se exatamente m arestas distintas, G(n, m)
+- Barabási–Albert: crescimento com ligação preferencial; poucos vértices
+  concentram muitas arestas (grau em lei de potência, como redes sociais)
+- Grade 2D/3D: vértices em uma malha regular ligados aos vizinhos
+  ortogonais, e opcionalmente diagonais (labirintos, mapas de jogos)
+- Geométrico aleatório: pontos no quadrado unitário ligados quando a
+  distância é menor que um raio; peso = distância (parecido com malhas viárias)
+- DAG em camadas: arestas apenas da camada k para a camada k + 1
+  (dependências, escalonamento de tarefas)
+
+CONSTRUÇÃO:
+-----------
+As arestas são geradas em vetores compactos (array) e o grafo é montado
+de uma vez com Grafo.adicionar_arestas, ou GrafoCompacto.de_arestas com
+compacto=True (recomendado acima de ~10^6 arestas).
+
+COORDENADAS:
+------------
+A grade 2D e o grafo geométrico podem definir a posição (x, y) de cada
+vértice (coordenadas=True), usada pelas heurísticas do A* (a_estrela.py).
+
+PESOS:
+------
+- 'constante':   todas as arestas com peso 1.0
+- 'uniforme':    real uniforme em [peso_min, peso_max]
+- 'inteiro':     inteiro uniforme em [peso_min, peso_max]
+- 'exponencial': peso_min + exponencial de média (peso_max - peso_min);
+                 muitas arestas leves e poucas muito pesadas
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import math
+import random
+import time
+from array import array
+
+from grafo import Grafo
+
+
+class GeradorGrafos:
+    """
+    Geradores de grafos sintéticos com semente fixa.
+    
+    Todos os geradores aceitam os parâmetros:
+        semente (int): Semente do gerador aleatório (mesma semente = mesmo grafo)
+        distribuicao_pesos (str): 'constante', 'uniforme', 'inteiro' ou 'exponencial'
+        peso_min (float): Menor peso (ou deslocamento da exponencial)
+        peso_max (float): Maior peso (ou deslocamento + média da exponencial)
+        compacto (bool): True para retornar um GrafoCompacto em vez de Grafo
+    """
+    
+    DISTRIBUICOES = ('constante', 'uniforme', 'inteiro', 'exponencial')
+    
+    @staticmethod
+    def _sorteador_pesos(rng: random.Random, distribuicao: str,
+                         peso_min: float, peso_max: float):
+        """
+        Retorna uma função sem argumentos que sorteia um peso.
+        
+        Raises:
+            ValueError: Se a distribuição for desconhecida
+        """
+        if distribuicao == 'constante':
+            return lambda: 1.0
+        if distribuicao == 'uniforme':
+            return lambda: rng.uniform(peso_min, peso_max)
+        if distribuicao == 'inteiro':
+            inferior, superior = int(peso_min), int(peso_max)
+            return lambda: float(rng.randint(inferior, superior))
+        if distribuicao == 'exponencial':
+            taxa = 1.0 / max(peso_max - peso_min, 1e-12)
+            return lambda: peso_min + rng.expovariate(taxa)
+        raise ValueError(f"Distribuição de pesos desconhecida: {distribuicao} "
+                         f"(use {', '.join(GeradorGrafos.DISTRIBUICOES)})")
+    
+    @staticmethod
+    def _montar(origens: array, destinos: array, pesos: array, num_vertices: int,
+                direcionado: bool, compacto: bool, coordenadas: dict = None):
+        """
+        Monta o grafo em lote a partir dos vetores de arestas.
+        
+        Returns:
+            Grafo ou GrafoCompacto: Grafo gerado
+        """
+        if compacto:
+            from grafo_compacto import GrafoCompacto
+            grafo = GrafoCompacto.de_arestas(origens, destinos, pesos, direcionado,
+                                             num_vertices)
+        else:
+            grafo = Grafo(num_vertices, direcionado)
+            grafo.adicionar_arestas(origens, destinos, pesos)
+        
+        if coordenadas:
+            grafo.coordenadas = coordenadas
+        return grafo
+    
+    @staticmethod
+    def erdos_renyi(num_vertices: int, probabilidade: float = None,
+                    num_arestas: int = None, direcionado: bool = False,
+                    semente: int = 42, distribuicao_pesos: str = 'constante',
+                    peso_min: float = 1.0, peso_max: float = 10.0,
+                    compacto: bool = False):
+        """
+        Gera um grafo de Erdős–Rényi sem laços nem arestas paralelas.
+        
+        Informe exatamente um entre 'probabilidade' (modelo G(n, p)) e
+        'num_arestas' (modelo G(n, m)). O G(n, p) salta diretamente para o
+        próximo par sorteado (saltos geométricos de Batagelj–Brandes), então
+        o custo é O(n + m), não O(n²).
+        
+        Args:
+            num_vertices (int): Número de vértices
+            probabilidade (float): Probabilidade de cada par ser ligado
+            num_arestas (int): Número exato de arestas
+        
+        Returns:
+            Grafo ou GrafoCompacto: Grafo gerado
+        
+        Raises:
+            ValueError: Se os parâmetros forem inconsistentes
+        """
+        if (probabilidade is None) == (num_arestas is None):
+            raise ValueError("Informe exatamente um entre probabilidade e num_arestas")
+        
+        rng = random.Random(semente)
+        sortear_peso = GeradorGrafos._sorteador_pesos(rng, distribuicao_pesos,
+                                                      peso_min, peso_max)
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        n = num_vertices
+        total_pares = n * (n - 1) if direcionado else n * (n - 1) // 2
+        
+        if num_arestas is not None:
+            if num_arestas > total_pares:
+                raise ValueError(f"Máximo de {total_pares} arestas para {n} vértices")
+            sorteados = set()
+            while len(sorteados) < num_arestas:
+                u, v = rng.randrange(n), rng.randrange(n)
+                if u == v:
+                    continue
+                if not direcionado and u > v:
+                    u, v = v, u
+                codigo = u * n + v
+                if codigo not in sorteados:
+                    sorteados.add(codigo)
+                    origens.append(u)
+                    destinos.append(v)
+                    pesos.append(sortear_peso())
+        elif probabilidade > 0:
+            # Percorre os pares em ordem linear, saltando os não sorteados
+            log_q = math.log(1.0 - probabilidade) if probabilidade < 1 else None
+            k = -1
+            while True:
+                if log_q is None:
+                    k += 1
+                else:
+                    k += 1 + int(math.log(1.0 - rng.random()) / log_q)
+                if k >= total_pares:
+                    break
+                if direcionado:
+                    u, j = divmod(k, n - 1)
+                    v = j if j < u else j + 1
+                else:
+                    # Par k no triângulo inferior: v < u, k = u(u-1)/2 + v
+                    u = int((1 + math.isqrt(8 * k + 1)) // 2)
+                    v = k - u * (u - 1) // 2
+                origens.append(u)
+                destinos.append(v)
+                pesos.append(sortear_peso())
+        
+        return GeradorGrafos._montar(origens, destinos, pesos, n, direcionado, compacto)
+    
+    @staticmethod
+    def barabasi_albert(num_vertices: int, arestas_por_vertice: int = 2,
+                        direcionado: bool = False, semente: int = 42,
+                        distribuicao_pesos: str = 'constante',
+                        peso_min: float = 1.0, peso_max: float = 10.0,
+                        compacto: bool = False):
+        """
+        Gera um grafo de Barabási–Albert (ligação preferencial).
+        
+        Cada vértice novo liga-se a 'arestas_por_vertice' vértices antigos
+        distintos, escolhidos com probabilidade proporcional ao grau. O
+        sorteio usa uma lista com cada vértice repetido uma vez por aresta,
+        então cada escolha é O(1).
+        
+        Args:
+            num_vertices (int): Número de vértices
+            arestas_por_vertice (int): Arestas criadas por vértice novo
+            direcionado (bool): Se True, as arestas vão do vértice novo ao antigo
+        
+        Returns:
+            Grafo ou GrafoCompacto: Grafo gerado com cerca de n * m arestas
+        
+        Raises:
+            ValueError: Se arestas_por_vertice não estiver entre 1 e n - 1
+        """
+        m = arestas_por_vertice
+        if not 1 <= m < num_vertices:
+            raise ValueError(f"arestas_por_vertice deve estar entre 1 e {num_vertices - 1}")
+        
+        rng = random.Random(semente)
+        sortear_peso = GeradorGrafos._sorteador_pesos(rng, distribuicao_pesos,
+                                                      peso_min, peso_max)
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        
+        repetidos = array('q')
+        alvos = list(range(m))
+        for novo in range(m, num_vertices):
+            for alvo in alvos:
+                origens.append(novo)
+                destinos.append(alvo)
+                pesos.append(sortear_peso())
+            repetidos.extend(alvos)
+            repetidos.extend([novo] * m)
+            
+            escolhidos = set()
+            while len(escolhidos) < m:
+                escolhidos.add(repetidos[rng.randrange(len(repetidos))])
+            alvos = sorted(escolhidos)
+        
+        return GeradorGrafos._montar(origens, destinos, pesos, num_vertices,
+                                     direcionado, compacto)
+    
+    @staticmethod
+    def grade(linhas: int, colunas: int, camadas: int = 1,
+              direcionado: bool = False, semente: int = 42,
+              distribuicao_pesos: str = 'constante',
+              peso_min: float = 1.0, peso_max: float = 10.0,
+              compacto: bool = False, diagonais: bool = False,
+              coordenadas: bool = False):
+        """
+        Gera uma grade 2D (camadas=1) ou 3D com vizinhança ortogonal.
+        
+        O vértice da posição (camada, linha, coluna) é
+        (camada * linhas + linha) * colunas + coluna.
+        
+        Args:
+            linhas (int): Número de linhas
+            colunas (int): Número de colunas
+            camadas (int): Número de camadas (1 = grade 2D)
+            direcionado (bool): Se True, cada ligação vira duas arestas
+                (ida e volta) com pesos sorteados separadamente
+            diagonais (bool): Se True, liga também os vizinhos diagonais de
+                cada camada (vizinhança de 8), com peso sorteado * √2
+            coordenadas (bool): Se True, a posição de cada vértice é
+                (coluna, linha) (apenas grades 2D)
+        
+        Returns:
+            Grafo ou GrafoCompacto: Grafo gerado
+        
+        Raises:
+            ValueError: Se coordenadas=True em uma grade 3D
+        """
+        if coordenadas and camadas > 1:
+            raise ValueError("Coordenadas só estão disponíveis em grades 2D")
+        
+        rng = random.Random(semente)
+        sortear_peso = GeradorGrafos._sorteador_pesos(rng, distribuicao_pesos,
+                                                      peso_min, peso_max)
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        
+        def ligar(u: int, v: int, fator: float = 1.0):
+            origens.append(u)
+            destinos.append(v)
+            pesos.append(sortear_peso() * fator)
+            if direcionado:
+                origens.append(v)
+                destinos.append(u)
+                pesos.append(sortear_peso() * fator)
+        
+        diagonal = math.sqrt(2)
+        tamanho_camada = linhas * colunas
+        for c in range(camadas):
+            for i in range(linhas):
+                for j in range(colunas):
+                    v = c * tamanho_camada + i * colunas + j
+                    if j + 1 < colunas:
+                        ligar(v, v + 1)
+                    if i + 1 < linhas:
+                        ligar(v, v + colunas)
+                        if diagonais:
+                            if j + 1 < colunas:
+                                ligar(v, v + colunas + 1, diagonal)
+                            if j > 0:
+                                ligar(v, v + colunas - 1, diagonal)
+                    if c + 1 < camadas:
+                        ligar(v, v + tamanho_camada)
+        
+        posicoes = None
+        if coordenadas:
+            posicoes = {i * colunas + j: (float(j), float(i))
+                        for i in range(linhas) for j in range(colunas)}
+        
+        return GeradorGrafos._montar(origens, destinos, pesos,
+                                     camadas * tamanho_camada, direcionado, compacto,
+                                     posicoes)
+    
+    @staticmethod
+    def geometrico(num_vertices: int, raio: float, direcionado: bool = False,
+                   semente: int = 42, distribuicao_pesos: str = 'distancia',
+                   peso_min: float = 1.0, peso_max: float = 10.0,
+                   escala: float = 100.0, compacto: bool = False,
+                   coordenadas: bool = False):
+        """
+        Gera um grafo geométrico aleatório (semelhante a uma malha viária).
+        
+        Sorteia pontos no quadrado unitário e liga os pares a distância
+        menor ou igual a 'raio'. Os pontos são distribuídos em células de
+        lado 'raio', então cada ponto só é comparado com as 9 células
+        vizinhas: O(n + m) em vez de O(n²). O grau médio é cerca de
+        n * π * raio².
+        
+        Args:
+            num_vertices (int): Número de pontos
+            raio (float): Distância máxima de ligação (0 < raio <= 1)
+            direcionado (bool): Se True, cada ligação vira duas arestas
+            distribuicao_pesos (str): 'distancia' (padrão) ou uma das
+                distribuições comuns
+            escala (float): Fator aplicado à distância (ex.: lado em km)
+            coordenadas (bool): Se True, a posição de cada vértice é o ponto
+                sorteado multiplicado pela escala (com pesos 'distancia', a
+                heurística euclidiana do A* é exata em linha reta)
+        
+        Returns:
+            Grafo ou GrafoCompacto: Grafo gerado
+        
+        Raises:
+            ValueError: Se o raio não estiver em (0, 1]
+        """
+        if not 0 < raio <= 1:
+            raise ValueError("O raio deve estar no intervalo (0, 1]")
+        
+        rng = random.Random(semente)
+        xs = [rng.random() for _ in range(num_vertices)]
+        ys = [rng.random() for _ in range(num_vertices)]
+        
+        if distribuicao_pesos == 'distancia':
+            sortear_peso = None
+        else:
+            sortear_peso = GeradorGrafos._sorteador_pesos(rng, distribuicao_pesos,
+                                                          peso_min, peso_max)
+        
+        celulas_por_lado = max(1, int(1.0 / raio))
+        celulas = {}
+        for v in range(num_vertices):
+            chave = (min(int(xs[v] * celulas_por_lado), celulas_por_lado - 1),
+                     min(int(ys[v] * celulas_por_lado), celulas_por_lado - 1))
+            celulas.setdefault(chave, []).append(v)
+        
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        raio2 = raio * raio
+        for u in range(num_vertices):
+            cx = min(int(xs[u] * celulas_por_lado), celulas_por_lado - 1)
+            cy = min(int(ys[u] * celulas_por_lado), celulas_por_lado - 1)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for v in celulas.get((cx + dx, cy + dy), ()):
+                        if v <= u:
+                            continue
+                        d2 = (xs[u] - xs[v]) ** 2 + (ys[u] - ys[v]) ** 2
+                        if d2 > raio2:
+                            continue
+                        peso = math.sqrt(d2) * escala if sortear_peso is None else sortear_peso()
+                        origens.append(u)
+                        destinos.append(v)
+                        pesos.append(peso)
+                        if direcionado:
+                            origens.append(v)
+                            destinos.append(u)
+                            pesos.append(peso)
+        
+        posicoes = None
+        if coordenadas:
+            posicoes = {v: (xs[v] * escala, ys[v] * escala) for v in range(num_vertices)}
+        
+        return GeradorGrafos._montar(origens, destinos, pesos, num_vertices,
+                                     direcionado, compacto, posicoes)
+    
+    @staticmethod
+    def dag_em_camadas(num_camadas: int, largura: int, probabilidade: float = 0.3,
+                       semente: int = 42, distribuicao_pesos: str = 'constante',
+                       peso_min: float = 1.0, peso_max: float = 10.0,
+                       compacto: bool = False):
+        """
+        Gera um grafo acíclico direcionado (DAG) em camadas.
+        
+        A camada k contém os vértices k * largura .. (k + 1) * largura - 1.
+        Cada par (camada k, camada k + 1) é ligado com a probabilidade dada,
+        e todo vértice fora da primeira camada recebe ao menos uma aresta,
+        então todos são alcançáveis a partir da primeira camada.
+        
+        Args:
+            num_camadas (int): Número de camadas
+            largura (int): Vértices por camada
+            probabilidade (float): Probabilidade de ligar cada par de camadas vizinhas
+        
+        Returns:
+            Grafo ou GrafoCompacto: DAG gerado (sempre direcionado)
+        """
+        rng = random.Random(semente)
+        sortear_peso = GeradorGrafos._sorteador_pesos(rng, distribuicao_pesos,
+                                                      peso_min, peso_max)
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        
+        for camada in range(num_camadas - 1):
+            inicio = camada * largura
+            proxima = inicio + largura
+            for v in range(proxima, proxima + largura):
+                ligado = False
+                for u in range(inicio, proxima):
+                    if rng.random() < probabilidade:
+                        origens.append(u)
+                        destinos.append(v)
+                        pesos.append(sortear_peso())
+                        ligado = True
+                if not ligado:
+                    origens.append(inicio + rng.randrange(largura))
+                    destinos.append(v)
+                    pesos.append(sortear_peso())
+        
+        return GeradorGrafos._montar(origens, destinos, pesos, num_camadas * largura,
+                                     True, compacto)
+
+
+def demonstrar_geradores():
+    """
+    Demonstra os geradores com grafos de tamanho médio.
+    """
+    print(f"\n{'='*70}")
+    print(f"DEMONSTRAÇÃO: GERADORES DE GRAFOS SINTÉTICOS")
+    print(f"{'='*70}")
+    
+    exemplos = [
+        ("Erdős–Rényi G(n, p)", lambda: GeradorGrafos.erdos_renyi(
+            20_000, probabilidade=0.0005, distribuicao_pesos='uniforme')),
+        ("Erdős–Rényi G(n, m)", lambda: GeradorGrafos.erdos_renyi(
+            20_000, num_arestas=100_000, direcionado=True)),
+        ("Barabási–Albert", lambda: GeradorGrafos.barabasi_albert(
+            20_000, arestas_por_vertice=3, distribuicao_pesos='exponencial')),
+        ("Grade 2D 200x200", lambda: GeradorGrafos.grade(200, 200)),
+        ("Grade 3D 30x30x30", lambda: GeradorGrafos.grade(30, 30, 30,
+                                                          distribuicao_pesos='inteiro')),
+        ("Geométrico (viário)", lambda: GeradorGrafos.geometrico(20_000, raio=0.012)),
+        ("DAG em camadas 50x100", lambda: GeradorGrafos.dag_em_camadas(
+            50, 100, probabilidade=0.05)),
+    ]
+    
+    for nome, gerar in exemplos:
+        inicio = time.perf_counter()
+        grafo = gerar()
+        tempo = time.perf_counter() - inicio
+        
+        vertices = grafo.obter_vertices()
+        arestas = grafo.obter_arestas()
+        graus = [len(grafo.obter_vizinhos(v)) for v in vertices]
+        print(f"\n{nome}:")
+        print(f"  Vértices: {len(vertices)}  Arestas: {len(arestas)}  "
+              f"Grau médio: {sum(graus) / max(len(graus), 1):.2f}  "
+              f"Grau máximo: {max(graus, default=0)}")
+        print(f"  Tempo de geração: {tempo:.3f} s")
+    
+    print(f"\n{'='*70}")
+
+
+if __name__ == "__main__":
+    demonstrar_geradores()
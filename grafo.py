@@ -9,10 +9,56 @@ Data: Dezembro 2025
 """
 
 from collections import defaultdict, deque
-from typing import List, Dict, Set, Tuple, Optional
+from operator import index
+from typing import List, Dict, Set, Tuple, Optional, Iterable
 import heapq
 
 
+def _lista_nativa(valores: Iterable) -> list:
+    """
+    Converte uma sequência de números em lista de int/float do Python.
+    
+    Vetores com tolist() (NumPy, array) são convertidos de uma vez; em
+    outras sequências, escalares de outros tipos (ex.: np.int64 de um
+    laço sobre um vetor) viram int ou float.
+    
+    Args:
+        valores (Iterable): Vértices ou pesos
+    
+    Returns:
+        list: Lista com os mesmos valores, em tipos nativos
+    """
+    if hasattr(valores, 'tolist'):
+        return valores.tolist()
+    valores = list(valores)
+    if set(map(type, valores)) <= {int, float}:
+        return valores
+    return [v if type(v) in (int, float) else _numero_nativo(v) for v in valores]
+
+
+def _numero_nativo(valor):
+    """Converte um escalar numérico para int (se for inteiro) ou float."""
+    try:
+        return index(valor)
+    except TypeError:
+        return float(valor)
+
+
+class ErroCiclo(ValueError):
+    """
+    Erro lançado quando uma aresta fecharia um ciclo em um grafo com a
+    detecção de ciclos online ativa (Grafo.ativar_deteccao_ciclos).
+    
+    Atributos:
+        ciclo (List[int]): Vértices do ciclo, começando e terminando no mesmo
+            vértice (ex.: [u, v, w, u])
+    """
+    
+    def __init__(self, ciclo: List[int]):
+        self.ciclo = ciclo
+        super().__init__(f"Ciclo detectado: {' -> '.join(map(str, ciclo))}")
+
+
 class Grafo:
     """
     Classe que representa um Grafo usando lista de adjacência.
@@ -21,6 +67,10 @@ class Grafo:
         vertices (int): Número de vértices no grafo
         adj (dict): Dicionário de listas de adjacência
         direcionado (bool): Indica se o grafo é direcionado ou não
+        versao (int): Contador de modificações (incrementado a cada aresta)
+        rotulos (TabelaRotulos): Nomes externos dos vértices (None se não usados)
+        coordenadas (dict): Posição (x, y) dos vértices, usada pelas heurísticas
+            do A* (vazio se não usadas)
     """
     
     def __init__(self, vertices: int = 0, direcionado: bool = False):
@@ -34,7 +84,27 @@ class Grafo:
         self.vertices = vertices
         self.adj = defaultdict(list)  # Lista de adjacência
         self.direcionado = direcionado
-        
+        self.versao = 0
+        
+        # Índices mantidos incrementalmente por adicionar_aresta
+        self._conjunto_vertices = set()
+        self._vertices_ordenados = []     # None = precisa reordenar
+        self._posicao_chave = {}          # Ordem de criação das chaves de adj
+        self._arestas_por_chave = {}      # Arestas canônicas emitidas por chave
+        self._pares = set()               # Pares já emitidos (não direcionado)
+        self._arestas = []                # None = precisa remontar
+        self._indice_pesos = None         # {origem: {destino: peso}}, sob demanda
+        self._predecessores = None        # {destino: [(origem, peso)]}, sob demanda
+        self._snapshot = None             # Último snapshot (válido enquanto versao não mudar)
+        self._posicao_topologica = None   # {vértice: posição}, com detecção de ciclos ativa
+        self._proxima_posicao = 0
+        
+        # Tabela de rótulos externos (criada no primeiro uso de obter_id)
+        self.rotulos = None
+        
+        # Posição (x, y) de cada vértice (A*, visualização)
+        self.coordenadas = {}
+    
     def adicionar_aresta(self, origem: int, destino: int, peso: float = 1.0):
         """
         Adiciona uma aresta ao grafo.
@@ -43,61 +113,576 @@ class Grafo:
             origem (int): Vértice de origem
             destino (int): Vértice de destino
             peso (float): Peso da aresta (padrão: 1.0)
+            
+        Raises:
+            ErroCiclo: Se a detecção de ciclos estiver ativa e a aresta fechar
+                um ciclo (a aresta não é adicionada)
         """
+        if self._posicao_topologica is not None:
+            self._verificar_ciclo(origem, destino)
+        
         self.adj[origem].append((destino, peso))
         
         # Se o grafo não é direcionado, adiciona aresta reversa
         if not self.direcionado:
             self.adj[destino].append((origem, peso))
+        
+        self._registrar_aresta(origem, destino, peso)
+    
+    def adicionar_arestas(self, origens: Iterable[int], destinos: Iterable[int],
+                          pesos: Optional[Iterable[float]] = None) -> int:
+        """
+        Adiciona várias arestas de uma vez (inserção em lote).
+        
+        O resultado é idêntico a chamar adicionar_aresta para cada aresta,
+        na mesma ordem, mas sem uma chamada de método por aresta:
+        1. Intercala as arestas reversas (grafo não direcionado) em uma
+           única passada, com atribuição por fatias
+        2. Anexa todas as entradas em um único laço (as chaves novas são
+           criadas na mesma ordem da inserção aresta a aresta)
+        3. Atualiza o conjunto de vértices de uma vez
+        Os caches são invalidados uma única vez; o índice de arestas é
+        reconstruído apenas quando obter_arestas for chamado. Vetores NumPy
+        são aceitos; os valores são guardados como int/float do Python.
+        
+        Args:
+            origens (Iterable[int]): Vértice de origem de cada aresta
+            destinos (Iterable[int]): Vértice de destino de cada aresta
+            pesos (Optional[Iterable[float]]): Peso de cada aresta (padrão: 1.0)
+            
+        Returns:
+            int: Número de arestas adicionadas
+            
+        Raises:
+            ErroCiclo: Se a detecção de ciclos estiver ativa e uma aresta fechar
+                um ciclo (as arestas anteriores a ela permanecem no grafo)
+        """
+        origens = _lista_nativa(origens)
+        destinos = _lista_nativa(destinos)
+        quantidade = len(origens)
+        pesos = [1.0] * quantidade if pesos is None else _lista_nativa(pesos)
+        
+        if not (len(destinos) == quantidade == len(pesos)):
+            raise ValueError("origens, destinos e pesos devem ter o mesmo tamanho")
+        if quantidade == 0:
+            return 0
+        
+        if self._posicao_topologica is not None:
+            # Cada aresta precisa ser verificada antes da seguinte
+            for origem, destino, peso in zip(origens, destinos, pesos):
+                self.adicionar_aresta(origem, destino, peso)
+            return quantidade
+        
+        if self.direcionado:
+            fontes, alvos, valores = origens, destinos, pesos
+        else:
+            # Entrada 2k = aresta k, entrada 2k+1 = sua reversa
+            fontes = [None] * (2 * quantidade)
+            fontes[0::2] = origens
+            fontes[1::2] = destinos
+            alvos = [None] * (2 * quantidade)
+            alvos[0::2] = destinos
+            alvos[1::2] = origens
+            valores = [None] * (2 * quantidade)
+            valores[0::2] = pesos
+            valores[1::2] = pesos
+        
+        obter_lista = self.adj.__getitem__
+        for fonte, alvo, valor in zip(fontes, alvos, valores):
+            obter_lista(fonte).append((alvo, valor))
+        
+        tamanho_anterior = len(self._conjunto_vertices)
+        self._conjunto_vertices.update(fontes)
+        if self.direcionado:
+            self._conjunto_vertices.update(destinos)
+        if len(self._conjunto_vertices) != tamanho_anterior:
+            self._vertices_ordenados = None
+        
+        self.versao += quantidade
+        self._arestas = None
+        self._arestas_por_chave = None  # Reconstruído sob demanda
+        self._indice_pesos = None
+        self._predecessores = None
+        return quantidade
+    
+    def _reconstruir_indice_arestas(self):
+        """
+        Reconstrói o índice canônico de arestas com uma varredura de 'adj'.
+        
+        Usado após inserções em lote; a partir daí o índice volta a ser
+        mantido incrementalmente por adicionar_aresta.
+        """
+        posicao = self._posicao_chave = {}
+        por_chave = self._arestas_por_chave = {}
+        pares = self._pares = set()
+        
+        for origem, vizinhos in self.adj.items():
+            posicao[origem] = len(posicao)
+            arestas = por_chave[origem] = []
+            for destino, peso in vizinhos:
+                if self.direcionado:
+                    arestas.append((origem, destino, peso))
+                    continue
+                par = (origem, destino) if origem <= destino else (destino, origem)
+                if par not in pares:
+                    pares.add(par)
+                    arestas.append((origem, destino, peso))
+    
+    def _registrar_aresta(self, origem: int, destino: int, peso: float):
+        """
+        Atualiza os índices de vértices e arestas após uma inserção.
+        
+        A lista canônica de arestas segue a mesma ordem de uma varredura de
+        'adj' (chaves na ordem de criação, vizinhos na ordem de inserção),
+        emitindo cada par não direcionado apenas na primeira chave em que
+        aparece. Assim o resultado é idêntico ao cálculo completo.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            peso (float): Peso da aresta
+        """
+        self.versao += 1
+        self._arestas = None
+        
+        if self._indice_pesos is not None:
+            # Mantém a primeira ocorrência, como a busca linear em obter_vizinhos
+            self._indice_pesos.setdefault(origem, {}).setdefault(destino, peso)
+            if not self.direcionado:
+                self._indice_pesos.setdefault(destino, {}).setdefault(origem, peso)
+        
+        if self._predecessores is not None:
+            self._predecessores.setdefault(destino, []).append((origem, peso))
+        
+        for v in (origem, destino):
+            if v not in self._conjunto_vertices:
+                self._conjunto_vertices.add(v)
+                ordenados = self._vertices_ordenados
+                if ordenados is not None:
+                    # Vértices crescentes (o caso comum) mantêm a lista ordenada
+                    if not ordenados or v > ordenados[-1]:
+                        ordenados.append(v)
+                    else:
+                        self._vertices_ordenados = None
+        
+        if self._arestas_por_chave is None:
+            return  # Índice será reconstruído por completo em obter_arestas
+        
+        posicao = self._posicao_chave
+        if origem not in posicao:
+            posicao[origem] = len(posicao)
+            self._arestas_por_chave[origem] = []
+        
+        if self.direcionado:
+            self._arestas_por_chave[origem].append((origem, destino, peso))
+            return
+        
+        if destino not in posicao:
+            posicao[destino] = len(posicao)
+            self._arestas_por_chave[destino] = []
+        
+        par = (origem, destino) if origem <= destino else (destino, origem)
+        if par in self._pares:
+            return  # Aresta paralela: a varredura mantém apenas a primeira
+        self._pares.add(par)
+        
+        # O par é emitido pela chave que aparece primeiro na varredura
+        if posicao[origem] <= posicao[destino]:
+            self._arestas_por_chave[origem].append((origem, destino, peso))
+        else:
+            self._arestas_por_chave[destino].append((destino, origem, peso))
+    
+    def ativar_deteccao_ciclos(self):
+        """
+        Ativa a detecção de ciclos online (algoritmo de Pearce–Kelly).
+        
+        A partir daqui o grafo mantém uma ordem topológica dos vértices, e
+        adicionar_aresta recusa (com ErroCiclo) qualquer aresta que feche um
+        ciclo. A verificação de u -> v custa O(1) quando u já vem antes de v
+        na ordem; caso contrário, a busca fica restrita aos vértices entre
+        as posições de v e de u, e só esses são reordenados — bem menos que
+        uma DFS no grafo inteiro a cada inserção.
+        
+        Raises:
+            ValueError: Se o grafo não for direcionado
+            ErroCiclo: Se o grafo já contiver um ciclo
+        """
+        if not self.direcionado:
+            raise ValueError("A detecção de ciclos online exige um grafo direcionado")
+        
+        ordem, ciclo = self._ordenar_topologicamente()
+        if ciclo:
+            raise ErroCiclo(ciclo)
+        
+        self._posicao_topologica = {v: i for i, v in enumerate(ordem)}
+        self._proxima_posicao = len(ordem)
+    
+    def desativar_deteccao_ciclos(self):
+        """Desativa a detecção de ciclos online."""
+        self._posicao_topologica = None
+    
+    def obter_ordem_topologica(self) -> List[int]:
+        """
+        Retorna a ordem topológica mantida pela detecção de ciclos online.
+        
+        Returns:
+            List[int]: Vértices em ordem topológica
+            
+        Raises:
+            ValueError: Se a detecção de ciclos não estiver ativa
+        """
+        if self._posicao_topologica is None:
+            raise ValueError("A detecção de ciclos não está ativa")
+        return sorted(self._posicao_topologica, key=self._posicao_topologica.__getitem__)
+    
+    def _ordenar_topologicamente(self) -> Tuple[List[int], List[int]]:
+        """
+        DFS iterativa: ordem topológica (pós-ordem invertida) ou um ciclo.
+        
+        Returns:
+            Tuple[List[int], List[int]]: (ordem, ciclo); o ciclo é vazio se
+                o grafo é acíclico
+        """
+        pos_ordem = []
+        terminados = set()
+        posicao_no_caminho = {}
+        
+        for raiz in self.obter_vertices():
+            if raiz in terminados:
+                continue
+            
+            posicao_no_caminho[raiz] = 0
+            caminho = [raiz]
+            iteradores = [iter(self.obter_vizinhos(raiz))]
+            
+            while caminho:
+                for vizinho, _ in iteradores[-1]:
+                    if vizinho in posicao_no_caminho:
+                        return [], caminho[posicao_no_caminho[vizinho]:] + [vizinho]
+                    if vizinho not in terminados:
+                        posicao_no_caminho[vizinho] = len(caminho)
+                        caminho.append(vizinho)
+                        iteradores.append(iter(self.obter_vizinhos(vizinho)))
+                        break
+                else:
+                    v = caminho.pop()
+                    iteradores.pop()
+                    del posicao_no_caminho[v]
+                    terminados.add(v)
+                    pos_ordem.append(v)
+        
+        pos_ordem.reverse()
+        return pos_ordem, []
+    
+    def _verificar_ciclo(self, origem: int, destino: int):
+        """
+        Verifica a aresta origem -> destino e atualiza a ordem topológica
+        (Pearce–Kelly).
+        
+        Se posicao[origem] < posicao[destino] nada muda. Senão:
+        1. Busca para frente a partir do destino, só por vértices com posição
+           menor que a da origem; alcançar a origem = ciclo
+        2. Busca para trás a partir da origem, só por vértices com posição
+           maior que a do destino
+        3. Redistribui as posições ocupadas por esses vértices: primeiro os
+           da busca para trás, depois os da busca para frente, cada grupo
+           na ordem relativa que já tinha
+        
+        Raises:
+            ErroCiclo: Se a aresta fecha um ciclo
+        """
+        posicao = self._posicao_topologica
+        for v in (origem, destino):
+            if v not in posicao:
+                posicao[v] = self._proxima_posicao
+                self._proxima_posicao += 1
+        
+        limite_superior = posicao[origem]
+        limite_inferior = posicao[destino]
+        if limite_inferior > limite_superior:
+            return
+        if origem == destino:
+            raise ErroCiclo([origem, origem])
+        
+        # 1. Para frente a partir do destino
+        anterior = {destino: None}
+        pilha = [destino]
+        while pilha:
+            u = pilha.pop()
+            for w, _ in self.obter_vizinhos(u):
+                if w == origem:
+                    caminho = [u]
+                    while anterior[caminho[-1]] is not None:
+                        caminho.append(anterior[caminho[-1]])
+                    caminho.reverse()
+                    raise ErroCiclo([origem] + caminho + [origem])
+                if w not in anterior and posicao[w] < limite_superior:
+                    anterior[w] = u
+                    pilha.append(w)
+        
+        # 2. Para trás a partir da origem
+        afetados_tras = {origem}
+        pilha = [origem]
+        while pilha:
+            u = pilha.pop()
+            for w, _ in self.obter_predecessores(u):
+                if w not in afetados_tras and posicao[w] > limite_inferior:
+                    afetados_tras.add(w)
+                    pilha.append(w)
+        
+        # 3. Reordena apenas os vértices afetados
+        tras = sorted(afetados_tras, key=posicao.__getitem__)
+        frente = sorted(anterior, key=posicao.__getitem__)
+        posicoes = sorted(posicao[v] for v in tras + frente)
+        for v, p in zip(tras + frente, posicoes):
+            posicao[v] = p
     
     def obter_vertices(self) -> List[int]:
         """
         Retorna a lista de todos os vértices do grafo.
         
+        A lista fica em cache até a próxima modificação; não a modifique.
+        
         Returns:
             List[int]: Lista de vértices
         """
-        vertices_set = set()
-        for v in self.adj.keys():
-            vertices_set.add(v)
-            for vizinho, _ in self.adj[v]:
-                vertices_set.add(vizinho)
-        return sorted(list(vertices_set))
+        if self._vertices_ordenados is None:
+            self._vertices_ordenados = sorted(self._conjunto_vertices)
+        return self._vertices_ordenados
     
     def obter_vizinhos(self, vertice: int) -> List[Tuple[int, float]]:
         """
         Retorna os vizinhos de um vértice.
         
+        Consultar um vértice inexistente não o insere na lista de adjacência.
+        
         Args:
             vertice (int): Vértice a ser consultado
             
         Returns:
             List[Tuple[int, float]]: Lista de tuplas (vizinho, peso)
         """
-        return self.adj[vertice]
+        return self.adj.get(vertice, [])
+    
+    def obter_predecessores(self, vertice: int) -> List[Tuple[int, float]]:
+        """
+        Retorna os vértices com aresta chegando em 'vertice' (arestas de entrada).
+        
+        Em grafos direcionados usa o índice transposto, construído com uma
+        varredura de 'adj' na primeira consulta e mantido por adicionar_aresta;
+        cada consulta custa O(grau de entrada) em vez de O(E). Em grafos não
+        direcionados os predecessores são os próprios vizinhos.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+            
+        Returns:
+            List[Tuple[int, float]]: Lista de tuplas (predecessor, peso)
+        """
+        if not self.direcionado:
+            return self.obter_vizinhos(vertice)
+        if self._predecessores is None:
+            self._construir_predecessores()
+        return self._predecessores.get(vertice, [])
+    
+    def grau_entrada(self, vertice: int) -> int:
+        """
+        Retorna o número de arestas que chegam em um vértice.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+            
+        Returns:
+            int: Grau de entrada
+        """
+        return len(self.obter_predecessores(vertice))
+    
+    def _construir_predecessores(self):
+        """Constrói o índice transposto {destino: [(origem, peso)]}."""
+        predecessores = {}
+        for origem, vizinhos in self.adj.items():
+            for destino, peso in vizinhos:
+                if destino in predecessores:
+                    predecessores[destino].append((origem, peso))
+                else:
+                    predecessores[destino] = [(origem, peso)]
+        self._predecessores = predecessores
     
     def obter_arestas(self) -> List[Tuple[int, int, float]]:
         """
         Retorna todas as arestas do grafo.
         
+        A lista fica em cache até a próxima modificação; não a modifique.
+        
         Returns:
             List[Tuple[int, int, float]]: Lista de tuplas (origem, destino, peso)
         """
-        arestas = []
-        visitados = set()
+        if self._arestas is None:
+            if self._arestas_por_chave is None:
+                self._reconstruir_indice_arestas()
+            self._arestas = [aresta
+                             for arestas in self._arestas_por_chave.values()
+                             for aresta in arestas]
+        return self._arestas
+    
+    def peso(self, origem: int, destino: int) -> Optional[float]:
+        """
+        Retorna o peso da aresta origem -> destino em O(1).
         
-        for origem in self.adj:
-            for destino, peso in self.adj[origem]:
-                if self.direcionado:
-                    arestas.append((origem, destino, peso))
-                else:
-                    # Para grafos não direcionados, evita duplicatas
-                    aresta = tuple(sorted([origem, destino]))
-                    if aresta not in visitados:
-                        arestas.append((origem, destino, peso))
-                        visitados.add(aresta)
+        Usa um índice {origem: {destino: peso}} construído na primeira
+        consulta e mantido por adicionar_aresta. Com arestas paralelas,
+        retorna o peso da primeira inserida.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            
+        Returns:
+            Optional[float]: Peso da aresta, ou None se ela não existe
+        """
+        if self._indice_pesos is None:
+            self._construir_indice_pesos()
+        vizinhos = self._indice_pesos.get(origem)
+        if vizinhos is None:
+            return None
+        return vizinhos.get(destino)
+    
+    def tem_aresta(self, origem: int, destino: int) -> bool:
+        """
+        Verifica se existe a aresta origem -> destino em O(1).
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+            
+        Returns:
+            bool: True se a aresta existe
+        """
+        return self.peso(origem, destino) is not None
+    
+    def _construir_indice_pesos(self):
+        """Constrói o índice de pesos a partir das listas de adjacência."""
+        indice = {}
+        for origem, vizinhos in self.adj.items():
+            pesos = indice[origem] = {}
+            for destino, peso in vizinhos:
+                if destino not in pesos:
+                    pesos[destino] = peso
+        self._indice_pesos = indice
+    
+    def obter_id(self, rotulo: str) -> int:
+        """
+        Interna um rótulo externo e retorna o vértice inteiro correspondente.
+        
+        Rótulos novos recebem ids densos 0, 1, 2... na ordem do primeiro uso.
+        
+        Args:
+            rotulo (str): Nome externo do vértice (ex.: "Centro", "10.0.0.1")
+            
+        Returns:
+            int: Vértice correspondente ao rótulo
+        """
+        if self.rotulos is None:
+            from rotulos import TabelaRotulos
+            self.rotulos = TabelaRotulos()
+        vertice = self.rotulos.internar(rotulo)
+        if vertice >= self.vertices:
+            self.vertices = vertice + 1
+        return vertice
+    
+    def obter_rotulo(self, vertice: int) -> str:
+        """
+        Retorna o rótulo externo de um vértice.
         
-        return arestas
+        Args:
+            vertice (int): Vértice
+            
+        Returns:
+            str: Rótulo do vértice
+            
+        Raises:
+            KeyError: Se o vértice não tiver rótulo
+        """
+        if self.rotulos is None:
+            raise KeyError(vertice)
+        return self.rotulos.obter_rotulo(vertice)
+    
+    def definir_coordenadas(self, vertice: int, x: float, y: float):
+        """
+        Define a posição de um vértice no plano.
+        
+        As heurísticas do A* (a_estrela.py) usam essas posições; para a
+        heurística euclidiana ser admissível, o peso de cada aresta deve ser
+        maior ou igual à distância entre as suas pontas.
+        
+        Args:
+            vertice (int): Vértice
+            x (float): Coordenada x
+            y (float): Coordenada y
+        """
+        self.coordenadas[vertice] = (x, y)
+        self._snapshot = None  # O snapshot copia as coordenadas
+    
+    def obter_coordenadas(self, vertice: int) -> Tuple[float, float]:
+        """
+        Retorna a posição de um vértice no plano.
+        
+        Args:
+            vertice (int): Vértice
+            
+        Returns:
+            Tuple[float, float]: Coordenadas (x, y)
+            
+        Raises:
+            KeyError: Se o vértice não tiver coordenadas
+        """
+        return self.coordenadas[vertice]
+    
+    def adicionar_aresta_rotulada(self, origem: str, destino: str, peso: float = 1.0):
+        """
+        Adiciona uma aresta entre dois vértices identificados por rótulos.
+        
+        Args:
+            origem (str): Rótulo do vértice de origem
+            destino (str): Rótulo do vértice de destino
+            peso (float): Peso da aresta (padrão: 1.0)
+        """
+        self.adicionar_aresta(self.obter_id(origem), self.obter_id(destino), peso)
+    
+    def compactar(self):
+        """
+        Congela o grafo em uma cópia compacta e somente leitura (formato CSR).
+        
+        Permite construir o grafo incrementalmente com adicionar_aresta e
+        depois consultá-lo ocupando uma fração da memória. Os algoritmos
+        funcionam sem alterações sobre o resultado.
+        
+        Returns:
+            GrafoCompacto: Cópia imutável do grafo
+        """
+        from grafo_compacto import GrafoCompacto
+        return GrafoCompacto.de_grafo(self)
+    
+    def snapshot(self):
+        """
+        Retorna uma cópia congelada do grafo, segura para consultas concorrentes.
+        
+        O snapshot é um GrafoCompacto: nenhuma consulta o altera (vértices
+        inexistentes não são inseridos) e ele não muda quando o grafo
+        original recebe novas arestas. Por isso várias threads podem
+        executar algoritmos sobre ele ao mesmo tempo, sem travas.
+        
+        Enquanto o grafo não for modificado, chamadas seguintes retornam o
+        mesmo objeto. O atributo 'versao' do snapshot é a versão do grafo no
+        momento da cópia; o par (id(grafo), snapshot.versao) identifica o
+        estado e pode ser usado como chave de cache.
+        
+        Returns:
+            GrafoCompacto: Visão imutável do estado atual do grafo
+        """
+        if self._snapshot is None or self._snapshot.versao != self.versao:
+            self._snapshot = self.compactar()
+        return self._snapshot
     
     def __str__(self) -> str:
         """
@@ -215,6 +800,17 @@ class GrafoExemplos:
         # Banco (18)
         g.adicionar_aresta(18, 19, 0.7) # Banco -> Correios
         
+        # Posição aproximada de cada local (km); nenhuma distância em linha
+        # reta supera o comprimento da rua correspondente
+        posicoes = {
+            0: (2.3, 0.3), 1: (2.9, 1.6), 2: (5.0, 1.2), 3: (2.9, 0.0), 4: (2.5, 2.9),
+            5: (0.5, 0.3), 6: (0.2, 2.5), 7: (4.3, 2.2), 8: (4.7, 1.9), 9: (4.8, 1.5),
+            10: (1.9, 1.7), 11: (1.5, 1.1), 12: (3.9, 0.4), 13: (3.4, 0.5), 14: (3.0, 0.2),
+            15: (0.0, 1.3), 16: (3.3, 2.0), 17: (2.4, 2.2), 18: (2.4, 0.6), 19: (1.8, 0.6)
+        }
+        for vertice, (x, y) in posicoes.items():
+            g.definir_coordenadas(vertice, x, y)
+        
         return g
     
     @staticmethod
@@ -0,0 +1,622 @@
+"""
+Módulo de Estrutura de Dados: Grafo Compacto (CSR)
+===================================================
+Este módulo contém uma representação imutável e compacta do Grafo,
+no formato CSR (Compressed Sparse Row).
+
+CONCEITOS:
+----------
+Em vez de um dicionário de listas de tuplas (destino, peso), o formato CSR
+guarda a adjacência em três vetores contíguos:
+- offsets: offsets[i]..offsets[i+1] delimita os vizinhos da linha i
+- destinos: vértices de destino de todas as arestas, linha após linha
+- pesos: peso de cada aresta (float64), alinhado com 'destinos'
+
+Cada aresta ocupa 16 bytes (8 do destino + 8 do peso), contra mais de 100
+bytes de uma tupla Python dentro de uma lista. Os vizinhos de um vértice
+ficam em posições consecutivas da memória.
+
+O GrafoCompacto expõe o mesmo contrato de leitura do Grafo
+(obter_vertices, obter_vizinhos, obter_arestas e o atributo direcionado),
+então BFS, DFS, Bellman-Ford, Dijkstra, Kruskal e Prim funcionam sem
+nenhuma alteração.
+
+USO TÍPICO:
+-----------
+    g = Grafo(direcionado=False)
+    g.adicionar_aresta(0, 1, 2.5)   # construção incremental
+    ...
+    compacto = g.compactar()         # congela em CSR para consultas
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Tuple, Iterator, Dict, Sequence, Optional
+
+
+class GrafoCompacto:
+    """
+    Grafo somente leitura armazenado em vetores CSR.
+    
+    As linhas são indexadas pela posição do vértice na lista ordenada de
+    vértices ('ids'). Quando os vértices são exatamente 0..n-1, a linha é o
+    próprio vértice e a busca é direta; caso contrário, usa busca binária.
+    
+    Para reproduzir exatamente a ordem de obter_arestas() do Grafo original,
+    o grafo guarda também a ordem em que os vértices apareceram como chaves
+    da lista de adjacência ('ordem') e a posição de cada linha nessa ordem
+    ('posicao').
+    
+    Nenhuma consulta altera os vetores. Os índices auxiliares construídos
+    sob demanda (lista de vértices, transposto, ordenação para peso()) são
+    atribuídos de uma só vez, então consultas concorrentes em threads
+    diferentes no máximo repetem essa construção.
+    
+    Atributos:
+        vertices (int): Número de vértices informado na criação do grafo
+        direcionado (bool): Indica se o grafo é direcionado ou não
+        versao (int): Versão do Grafo de origem no momento da compactação
+        coordenadas (dict): Posição (x, y) dos vértices (cópia das do Grafo)
+    """
+    
+    GRAU_BUSCA_LINEAR = 8  # Até este grau, peso() percorre a linha diretamente
+    
+    def __init__(self, ids, offsets, destinos, pesos, ordem, posicao,
+                 direcionado: bool = False, vertices: int = 0):
+        """
+        Inicializa um grafo compacto a partir de vetores já construídos.
+        
+        Normalmente não é chamado diretamente: use Grafo.compactar()
+        ou GrafoCompacto.de_grafo().
+        
+        Args:
+            ids: Vértices em ordem crescente (um por linha)
+            offsets: Início de cada linha em 'destinos' (tamanho n + 1)
+            destinos: Destino de cada aresta
+            pesos: Peso de cada aresta
+            ordem: Linhas na ordem de inserção das chaves de adjacência
+            posicao: Posição de cada linha dentro de 'ordem'
+            direcionado (bool): True se o grafo é direcionado
+            vertices (int): Número de vértices informado na criação
+        """
+        self._ids = ids
+        self._offsets = offsets
+        self._destinos = destinos
+        self._pesos = pesos
+        self._ordem = ordem
+        self._posicao = posicao
+        self.direcionado = direcionado
+        self.vertices = vertices
+        self.versao = 0
+        self.coordenadas = {}
+        
+        n = len(ids)
+        # Vértices 0..n-1: a linha é o próprio vértice (sem busca binária)
+        self._identidade = n == 0 or (ids[0] == 0 and ids[n - 1] == n - 1)
+        self._lista_vertices = None
+        self._ordenacao_destinos = None  # Índice de busca binária (sob demanda)
+        self._transposto = None          # CSR das arestas de entrada (sob demanda)
+        self._linhas = None              # (vértice -> linha, destinos em linhas) (sob demanda)
+        self._origens_linhas = None      # Origens das arestas de entrada em linhas (sob demanda)
+    
+    @staticmethod
+    def de_grafo(grafo) -> 'GrafoCompacto':
+        """
+        Constrói a versão compacta de um Grafo baseado em dicionário.
+        
+        A ordem dos vizinhos de cada vértice é preservada, então os
+        algoritmos visitam os vértices na mesma ordem nos dois formatos.
+        
+        Args:
+            grafo (Grafo): Grafo mutável de origem (vértices inteiros)
+        
+        Returns:
+            GrafoCompacto: Cópia imutável em formato CSR
+        """
+        ids = array('q', grafo.obter_vertices())
+        n = len(ids)
+        
+        offsets = array('q', bytes(8 * (n + 1)))
+        destinos = array('q')
+        pesos = array('d')
+        
+        for i, v in enumerate(ids):
+            for destino, peso in grafo.adj.get(v, ()):
+                destinos.append(destino)
+                pesos.append(peso)
+            offsets[i + 1] = len(destinos)
+        
+        # Ordem das chaves de adjacência (define a ordem de obter_arestas)
+        linha = {v: i for i, v in enumerate(ids)}
+        ordem = array('q', (linha[v] for v in grafo.adj.keys()))
+        if len(ordem) < n:
+            # Vértices que só aparecem como destino (grafos direcionados)
+            ja_incluidas = set(ordem)
+            ordem.extend(i for i in range(n) if i not in ja_incluidas)
+        
+        posicao = array('q', bytes(8 * n))
+        for rank, i in enumerate(ordem):
+            posicao[i] = rank
+        
+        compacto = GrafoCompacto(ids, offsets, destinos, pesos, ordem, posicao,
+                                 grafo.direcionado, grafo.vertices)
+        compacto.versao = grafo.versao
+        compacto.coordenadas = dict(grafo.coordenadas)
+        return compacto
+    
+    @staticmethod
+    def de_arestas(origens, destinos, pesos, direcionado: bool = False,
+                   vertices: int = 0) -> 'GrafoCompacto':
+        """
+        Constrói um grafo compacto diretamente de vetores de arestas.
+        
+        Não cria nenhuma tupla nem lista Python por aresta: conta os graus,
+        calcula os offsets e distribui as arestas em uma única passada
+        (ordenação por contagem). O resultado é idêntico a chamar
+        adicionar_aresta para cada aresta, na mesma ordem, e depois compactar().
+        
+        Args:
+            origens: Vértice de origem de cada aresta (inteiros)
+            destinos: Vértice de destino de cada aresta (inteiros)
+            pesos: Peso de cada aresta
+            direcionado (bool): True se o grafo é direcionado
+            vertices (int): Número de vértices informado (apenas informativo)
+        
+        Returns:
+            GrafoCompacto: Grafo imutável em formato CSR
+        """
+        if not (len(origens) == len(destinos) == len(pesos)):
+            raise ValueError("origens, destinos e pesos devem ter o mesmo tamanho")
+        
+        ids = array('q', sorted(set(origens).union(destinos)))
+        n = len(ids)
+        
+        if n == 0 or (ids[0] == 0 and ids[n - 1] == n - 1):
+            linhas_origem, linhas_destino = origens, destinos
+        else:
+            linha = {v: i for i, v in enumerate(ids)}
+            linhas_origem = array('q', map(linha.__getitem__, origens))
+            linhas_destino = array('q', map(linha.__getitem__, destinos))
+        
+        # Passo 1: grau de saída de cada linha
+        grau = array('q', bytes(8 * n))
+        for i in linhas_origem:
+            grau[i] += 1
+        if not direcionado:
+            for j in linhas_destino:
+                grau[j] += 1
+        
+        # Passo 2: offsets (soma de prefixos dos graus)
+        offsets = array('q', bytes(8 * (n + 1)))
+        total = 0
+        for i in range(n):
+            offsets[i] = total
+            total += grau[i]
+        offsets[n] = total
+        
+        # Passo 3: distribui as arestas, preservando a ordem de inserção
+        destinos_csr = array('q', bytes(8 * total))
+        pesos_csr = array('d', bytes(8 * total))
+        proxima = array('q', offsets[:n])
+        ordem = array('q')
+        vista = bytearray(n)
+        
+        for i, j, u, v, peso in zip(linhas_origem, linhas_destino, origens, destinos, pesos):
+            k = proxima[i]
+            destinos_csr[k] = v
+            pesos_csr[k] = peso
+            proxima[i] = k + 1
+            if not vista[i]:
+                vista[i] = 1
+                ordem.append(i)
+            if not direcionado:
+                k = proxima[j]
+                destinos_csr[k] = u
+                pesos_csr[k] = peso
+                proxima[j] = k + 1
+                if not vista[j]:
+                    vista[j] = 1
+                    ordem.append(j)
+        
+        if len(ordem) < n:
+            # Vértices que só aparecem como destino (grafos direcionados)
+            ordem.extend(i for i in range(n) if not vista[i])
+        
+        posicao = array('q', bytes(8 * n))
+        for rank, i in enumerate(ordem):
+            posicao[i] = rank
+        
+        return GrafoCompacto(ids, offsets, destinos_csr, pesos_csr, ordem, posicao,
+                             direcionado, vertices)
+    
+    def _linha(self, vertice: int) -> int:
+        """
+        Retorna a linha CSR de um vértice, ou -1 se ele não existe.
+        
+        Args:
+            vertice (int): Vértice a ser localizado
+        
+        Returns:
+            int: Índice da linha (ou -1)
+        """
+        ids = self._ids
+        if self._identidade:
+            if 0 <= vertice < len(ids):
+                return vertice
+            return -1
+        
+        i = bisect_left(ids, vertice)
+        if i < len(ids) and ids[i] == vertice:
+            return i
+        return -1
+    
+    def adicionar_aresta(self, origem: int, destino: int, peso: float = 1.0):
+        """
+        Grafos compactos são imutáveis.
+        
+        Raises:
+            ValueError: Sempre. Adicione arestas no Grafo e compacte novamente.
+        """
+        raise ValueError("GrafoCompacto é somente leitura: adicione arestas no Grafo "
+                         "e chame compactar() novamente")
+    
+    def obter_vertices(self) -> List[int]:
+        """
+        Retorna a lista de todos os vértices do grafo (ordenada).
+        
+        A lista é montada uma única vez e reutilizada; não a modifique.
+        
+        Returns:
+            List[int]: Lista de vértices
+        """
+        if self._lista_vertices is None:
+            self._lista_vertices = list(self._ids)
+        return self._lista_vertices
+    
+    def obter_vizinhos(self, vertice: int) -> List[Tuple[int, float]]:
+        """
+        Retorna os vizinhos de um vértice.
+        
+        Diferente do Grafo, consultar um vértice inexistente não altera nada.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+        
+        Returns:
+            List[Tuple[int, float]]: Lista de tuplas (vizinho, peso)
+        """
+        i = self._linha(vertice)
+        if i < 0:
+            return []
+        inicio, fim = self._offsets[i], self._offsets[i + 1]
+        return list(zip(self._destinos[inicio:fim], self._pesos[inicio:fim]))
+    
+    def obter_predecessores(self, vertice: int) -> List[Tuple[int, float]]:
+        """
+        Retorna os vértices com aresta chegando em 'vertice' (arestas de entrada).
+        
+        Em grafos direcionados usa um CSR transposto, construído por
+        ordenação por contagem na primeira consulta (mesmo custo de memória
+        dos vetores de adjacência); cada consulta custa O(grau de entrada).
+        Em grafos não direcionados os predecessores são os próprios vizinhos.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+        
+        Returns:
+            List[Tuple[int, float]]: Lista de tuplas (predecessor, peso); em
+                grafos direcionados, em ordem crescente de predecessor
+        """
+        if not self.direcionado:
+            return self.obter_vizinhos(vertice)
+        
+        i = self._linha(vertice)
+        if i < 0:
+            return []
+        if self._transposto is None:
+            self._construir_transposto()
+        offsets, origens, pesos = self._transposto
+        inicio, fim = offsets[i], offsets[i + 1]
+        return list(zip(origens[inicio:fim], pesos[inicio:fim]))
+    
+    def grau_entrada(self, vertice: int) -> int:
+        """
+        Retorna o número de arestas que chegam em um vértice.
+        
+        Args:
+            vertice (int): Vértice a ser consultado
+        
+        Returns:
+            int: Grau de entrada
+        """
+        if not self.direcionado:
+            return len(self.obter_vizinhos(vertice))
+        i = self._linha(vertice)
+        if i < 0:
+            return 0
+        if self._transposto is None:
+            self._construir_transposto()
+        offsets = self._transposto[0]
+        return offsets[i + 1] - offsets[i]
+    
+    def _construir_transposto(self):
+        """Constrói os vetores (offsets, origens, pesos) das arestas de entrada."""
+        ids, offsets, destinos, pesos = self._ids, self._offsets, self._destinos, self._pesos
+        n = len(ids)
+        
+        if self._identidade:
+            linhas_destino = destinos
+        else:
+            linhas_destino = self._converter_linhas()[1]
+        
+        grau = array('q', bytes(8 * n))
+        for j in linhas_destino:
+            grau[j] += 1
+        
+        offsets_entrada = array('q', bytes(8 * (n + 1)))
+        total = 0
+        for j in range(n):
+            offsets_entrada[j] = total
+            total += grau[j]
+        offsets_entrada[n] = total
+        
+        origens_entrada = array('q', bytes(8 * total))
+        pesos_entrada = array('d', bytes(8 * total))
+        proxima = array('q', offsets_entrada[:n])
+        for i in range(n):
+            origem = ids[i]
+            for k in range(offsets[i], offsets[i + 1]):
+                j = linhas_destino[k]
+                posicao = proxima[j]
+                origens_entrada[posicao] = origem
+                pesos_entrada[posicao] = pesos[k]
+                proxima[j] = posicao + 1
+        
+        self._transposto = (offsets_entrada, origens_entrada, pesos_entrada)
+    
+    def peso(self, origem: int, destino: int) -> Optional[float]:
+        """
+        Retorna o peso da aresta origem -> destino.
+        
+        Vértices de grau pequeno usam busca linear na própria linha. Para
+        os demais, usa busca binária sobre uma permutação de cada linha
+        ordenada por destino (8 bytes por entrada, construída na primeira
+        consulta): O(log grau). Com arestas paralelas, retorna o peso da
+        primeira inserida.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        
+        Returns:
+            Optional[float]: Peso da aresta, ou None se ela não existe
+        """
+        i = self._linha(origem)
+        if i < 0:
+            return None
+        
+        destinos = self._destinos
+        inicio, fim = self._offsets[i], self._offsets[i + 1]
+        
+        if fim - inicio <= GrafoCompacto.GRAU_BUSCA_LINEAR:
+            for k in range(inicio, fim):
+                if destinos[k] == destino:
+                    return self._pesos[k]
+            return None
+        
+        if self._ordenacao_destinos is None:
+            self._construir_ordenacao_destinos()
+        ordenacao = self._ordenacao_destinos
+        
+        # Busca binária pela primeira posição com destinos[k] >= destino
+        baixo, alto = inicio, fim
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if destinos[ordenacao[meio]] < destino:
+                baixo = meio + 1
+            else:
+                alto = meio
+        
+        if baixo < fim and destinos[ordenacao[baixo]] == destino:
+            return self._pesos[ordenacao[baixo]]
+        return None
+    
+    def tem_aresta(self, origem: int, destino: int) -> bool:
+        """
+        Verifica se existe a aresta origem -> destino.
+        
+        Args:
+            origem (int): Vértice de origem
+            destino (int): Vértice de destino
+        
+        Returns:
+            bool: True se a aresta existe
+        """
+        return self.peso(origem, destino) is not None
+    
+    def obter_coordenadas(self, vertice: int) -> Tuple[float, float]:
+        """
+        Retorna a posição de um vértice no plano.
+        
+        Args:
+            vertice (int): Vértice
+        
+        Returns:
+            Tuple[float, float]: Coordenadas (x, y)
+        
+        Raises:
+            KeyError: Se o vértice não tiver coordenadas
+        """
+        return self.coordenadas[vertice]
+    
+    def _construir_ordenacao_destinos(self):
+        """
+        Constrói, para cada linha, as posições das arestas ordenadas por destino.
+        
+        A ordenação é estável, então entre arestas paralelas a primeira
+        inserida vem antes.
+        """
+        offsets = self._offsets
+        chave = self._destinos.__getitem__
+        ordenacao = array('q')
+        for i in range(len(self._ids)):
+            ordenacao.extend(sorted(range(offsets[i], offsets[i + 1]), key=chave))
+        self._ordenacao_destinos = ordenacao
+    
+    def iterar_arestas(self) -> Iterator[Tuple[int, int, float]]:
+        """
+        Percorre as arestas sob demanda, na mesma ordem de obter_arestas().
+        
+        Útil em grafos grandes, pois não materializa a lista inteira.
+        
+        Yields:
+            Tuple[int, int, float]: Tuplas (origem, destino, peso)
+        """
+        ids = self._ids
+        offsets = self._offsets
+        destinos = self._destinos
+        pesos = self._pesos
+        posicao = self._posicao
+        
+        for i in self._ordem:
+            origem = ids[i]
+            inicio, fim = offsets[i], offsets[i + 1]
+            
+            if self.direcionado:
+                for k in range(inicio, fim):
+                    yield (origem, destinos[k], pesos[k])
+                continue
+            
+            # Não direcionado: cada par aparece nas duas linhas; emite apenas
+            # na linha que vem primeiro na ordem das chaves (como o Grafo faz)
+            rank = posicao[i]
+            vistos = set()
+            for k in range(inicio, fim):
+                destino = destinos[k]
+                if posicao[self._linha(destino)] < rank or destino in vistos:
+                    continue
+                vistos.add(destino)
+                yield (origem, destino, pesos[k])
+    
+    def obter_arestas(self) -> List[Tuple[int, int, float]]:
+        """
+        Retorna todas as arestas do grafo.
+        
+        Returns:
+            List[Tuple[int, int, float]]: Lista de tuplas (origem, destino, peso)
+        """
+        return list(self.iterar_arestas())
+    
+    def obter_vetores(self) -> Dict[str, Sequence]:
+        """
+        Retorna os vetores CSR internos (para serialização e algoritmos vetoriais).
+        
+        Os vetores são compartilhados com o grafo; não os modifique.
+        
+        Returns:
+            Dict[str, Sequence]: Vetores 'ids', 'offsets', 'destinos', 'pesos',
+                'ordem' e 'posicao'
+        """
+        return {
+            'ids': self._ids,
+            'offsets': self._offsets,
+            'destinos': self._destinos,
+            'pesos': self._pesos,
+            'ordem': self._ordem,
+            'posicao': self._posicao
+        }
+    
+    def obter_vetores_entrada(self) -> Dict[str, Sequence]:
+        """
+        Retorna os vetores CSR das arestas de entrada (grafo transposto).
+        
+        Em grafos não direcionados são os próprios vetores de adjacência.
+        Os vetores são compartilhados com o grafo; não os modifique.
+        
+        Returns:
+            Dict[str, Sequence]: Vetores 'offsets', 'origens' e 'pesos',
+                indexados pelas mesmas linhas de obter_vetores()
+        """
+        if not self.direcionado:
+            return {'offsets': self._offsets, 'origens': self._destinos, 'pesos': self._pesos}
+        if self._transposto is None:
+            self._construir_transposto()
+        offsets, origens, pesos = self._transposto
+        return {'offsets': offsets, 'origens': origens, 'pesos': pesos}
+    
+    def obter_vetores_linhas(self, entrada: bool = False) -> Dict[str, Sequence]:
+        """
+        Retorna os vetores de vizinhos com os vértices convertidos em linhas.
+        
+        Com vértices 0..n-1 são os próprios vetores de obter_vetores() e
+        obter_vetores_entrada(). Caso contrário, a conversão (O(E)) é feita
+        na primeira chamada e guardada no grafo, que é imutável.
+        Os vetores são compartilhados com o grafo; não os modifique.
+        
+        Args:
+            entrada (bool): Se True, inclui também 'origens' (arestas de entrada)
+        
+        Returns:
+            Dict[str, Sequence]: 'destinos' (e 'origens') em linhas, e 'linha',
+                o mapa vértice -> linha (None quando a linha é o próprio vértice)
+        """
+        if self._identidade:
+            vetores = {'destinos': self._destinos, 'linha': None}
+            if entrada:
+                vetores['origens'] = self.obter_vetores_entrada()['origens']
+            return vetores
+        
+        linha, destinos = self._converter_linhas()
+        vetores = {'destinos': destinos, 'linha': linha}
+        if entrada:
+            if not self.direcionado:
+                vetores['origens'] = destinos
+            else:
+                if self._origens_linhas is None:
+                    origens = self.obter_vetores_entrada()['origens']
+                    self._origens_linhas = array('q', map(linha.__getitem__, origens))
+                vetores['origens'] = self._origens_linhas
+        return vetores
+    
+    def _converter_linhas(self) -> Tuple[Dict[int, int], Sequence]:
+        """Constrói (uma vez) o mapa vértice -> linha e os destinos em linhas."""
+        if self._linhas is None:
+            linha = {v: i for i, v in enumerate(self._ids)}
+            self._linhas = (linha, array('q', map(linha.__getitem__, self._destinos)))
+        return self._linhas
+    
+    def tamanho_bytes(self) -> int:
+        """
+        Retorna o espaço ocupado pelos vetores CSR (sem contar caches).
+        
+        Returns:
+            int: Tamanho em bytes
+        """
+        return sum(len(v) * v.itemsize for v in
+                   (self._ids, self._offsets, self._destinos, self._pesos,
+                    self._ordem, self._posicao))
+    
+    def __str__(self) -> str:
+        """
+        Representação em string do grafo.
+        
+        Returns:
+            str: Representação do grafo
+        """
+        resultado = f"Grafo Compacto {'Direcionado' if self.direcionado else 'Não Direcionado'}\n"
+        resultado += f"Vértices: {len(self._ids)}\n"
+        resultado += "Arestas:\n"
+        
+        for i, origem in enumerate(self._ids):
+            for k in range(self._offsets[i], self._offsets[i + 1]):
+                destino, peso = self._destinos[k], self._pesos[k]
+                if self.direcionado:
+                    resultado += f"  {origem} -> {destino} (peso: {peso})\n"
+                else:
+                    if origem <= destino:  # Evita duplicatas
+                        resultado += f"  {origem} -- {destino} (peso: {peso})\n"
+        
+        return resultado
@@ -11,7 +11,7 @@ Data: Dezembro 2025
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import math
 from typing import Dict, List, Tuple, Optional
 import threading
@@ -22,6 +22,11 @@ from grafo import Grafo, GrafoExemplos
 from bfs_dfs import BFS, DFS
 from bellman_ford_dijkstra import BellmanFord, Dijkstra
 from mst_kruskal_prim import Kruskal, Prim
+from eventos import (
+    Visita, Enfileiramento, Relaxamento, ArestaAceita, ArestaRejeitada,
+    CicloNegativo, Fim
+)
+from trilha import reproduzir
 from aplicacoes_praticas import (
     AplicacaoRedeSocial, AplicacaoDependencias, AplicacaoJogoRPG,
     AplicacaoMercadoFinanceiro, AplicacaoRedeEletrica
@@ -33,6 +38,8 @@ class VisualizadorGrafos:
     Classe principal da interface gráfica para visualização de grafos.
     """
     
+    INTERVALO_ANIMACAO_MS = 400  # Tempo entre dois passos da animação
+    
     def __init__(self, root):
         """Inicializa a interface gráfica."""
         self.root = root
@@ -69,6 +76,7 @@ class VisualizadorGrafos:
         self.arestas_destacadas = []
         self.vertices_destacados = {}
         self.animacao_ativa = False
+        self.animacao_passos = None  # Gerador de eventos sendo animado
         
         # Criar interface
         self.criar_interface()
@@ -352,6 +360,26 @@ class VisualizadorGrafos:
         btn_frame5 = tk.Frame(scrollable_frame, bg=self.cores['bg_frame'])
         btn_frame5.pack(fill=tk.X, padx=10, pady=5)
         
+        self.animar_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            btn_frame5,
+            text="Animar passo a passo",
+            variable=self.animar_var,
+            bg=self.cores['bg_frame'],
+            fg=self.cores['fg'],
+            selectcolor='#11111b',
+            activebackground=self.cores['bg_frame'],
+            activeforeground=self.cores['fg'],
+            font=("Arial", 9)
+        ).pack(anchor="w", pady=2)
+        
+        self.criar_botao(
+            btn_frame5,
+            "📼 Reproduzir Trilha",
+            self.reproduzir_trilha,
+            '#585b70'
+        ).pack(fill=tk.X, pady=2)
+        
         self.criar_botao(
             btn_frame5,
             "🔄 Resetar Visualização",
@@ -522,7 +550,8 @@ class VisualizadorGrafos:
             self.info_label.config(text=info)
     
     def resetar_visualizacao(self):
-        """Reseta a visualização do grafo."""
+        """Reseta a visualização do grafo (e interrompe a animação, se houver)."""
+        self.parar_animacao()
         self.arestas_destacadas = []
         self.vertices_destacados = {}
         self.desenhar_grafo()
@@ -696,6 +725,139 @@ class VisualizadorGrafos:
         
         self.desenhar_grafo()
     
+    # ===== ANIMAÇÃO PASSO A PASSO =====
+    
+    def executar_algoritmo(self, executar, passos, mostrar):
+        """
+        Executa um algoritmo de uma vez ou, se a opção estiver marcada,
+        animando seus passos.
+        
+        Args:
+            executar: Função sem argumentos que executa o algoritmo e
+                retorna o dicionário de resultado
+            passos: Função sem argumentos que retorna o gerador de eventos
+                do algoritmo (ex.: BFS.passos)
+            mostrar: Função que recebe o resultado e o exibe
+        """
+        self.parar_animacao()
+        if self.animar_var.get():
+            self.animar_passos(passos(), mostrar)
+        else:
+            mostrar(executar())
+    
+    def animar_passos(self, passos, ao_terminar):
+        """
+        Anima um gerador de eventos, pedindo um evento a cada intervalo.
+        
+        O algoritmo só avança quando o próximo evento é pedido, então a
+        execução nunca fica inteira em memória e a interface continua
+        respondendo entre os passos.
+        
+        Args:
+            passos: Gerador de eventos (ex.: Dijkstra.passos(grafo, 0, 5))
+            ao_terminar: Função chamada com o resultado do evento Fim
+        """
+        self.arestas_destacadas = []
+        self.vertices_destacados = {}
+        self.animacao_ativa = True
+        self.animacao_passos = passos
+        
+        def proximo():
+            # Outra execução (ou o botão Resetar) interrompeu esta animação
+            if self.animacao_passos is not passos:
+                return
+            
+            evento = next(passos)
+            if isinstance(evento, Fim):
+                self.animacao_ativa = False
+                self.animacao_passos = None
+                self.arestas_destacadas = []
+                self.vertices_destacados = {}
+                ao_terminar(evento.resultado)
+                return
+            
+            self.mostrar_evento(evento)
+            self.desenhar_grafo()
+            self.root.after(self.INTERVALO_ANIMACAO_MS, proximo)
+        
+        proximo()
+    
+    def parar_animacao(self):
+        """Interrompe a animação em andamento, se houver."""
+        if self.animacao_passos is not None:
+            self.animacao_passos.close()
+        self.animacao_passos = None
+        self.animacao_ativa = False
+    
+    def mostrar_evento(self, evento):
+        """Atualiza destaques e log de acordo com um evento do algoritmo."""
+        if isinstance(evento, Visita):
+            self.vertices_destacados[evento.vertice] = self.cores['vertice_visitado']
+            self.log(f"Visitando {evento.vertice} (distância: {evento.distancia})")
+        elif isinstance(evento, Enfileiramento):
+            self.vertices_destacados.setdefault(evento.vertice, self.cores['warning'])
+            self.arestas_destacadas.append((evento.predecessor, evento.vertice))
+            self.log(f"  Descoberto {evento.vertice} a partir de {evento.predecessor}")
+        elif isinstance(evento, Relaxamento):
+            self.vertices_destacados.setdefault(evento.v, self.cores['warning'])
+            self.arestas_destacadas.append((evento.u, evento.v))
+            self.log(f"  Relaxando {evento.u} → {evento.v}: distância = {evento.distancia}")
+        elif isinstance(evento, ArestaAceita):
+            self.vertices_destacados[evento.u] = self.cores['aresta_mst']
+            self.vertices_destacados[evento.v] = self.cores['aresta_mst']
+            self.arestas_destacadas.append((evento.u, evento.v))
+            self.log(f"✓ Aresta {evento.u} -- {evento.v} (peso: {evento.peso}) aceita")
+        elif isinstance(evento, ArestaRejeitada):
+            self.log(f"✗ Aresta {evento.u} -- {evento.v} (peso: {evento.peso}) rejeitada")
+        elif isinstance(evento, CicloNegativo):
+            self.vertices_destacados[evento.u] = self.cores['error']
+            self.vertices_destacados[evento.v] = self.cores['error']
+            self.log(f"⚠ Ciclo negativo: aresta {evento.u} → {evento.v} ainda relaxa")
+    
+    def reproduzir_trilha(self):
+        """Anima uma execução gravada em trilha binária (trilha.py)."""
+        if not self.grafo_atual:
+            messagebox.showwarning("Aviso", "Carregue um grafo primeiro!")
+            return
+        
+        caminho = filedialog.askopenfilename(
+            title="Abrir trilha de execução",
+            filetypes=[("Trilhas de execução", "*.trc"), ("Todos os arquivos", "*.*")]
+        )
+        if not caminho:
+            return
+        
+        try:
+            passos = reproduzir(caminho)
+            primeiro = next(passos)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Erro", f"Não foi possível abrir a trilha:\n{e}")
+            return
+        
+        def todos_os_passos():
+            yield primeiro
+            yield from passos
+        
+        def mostrar(resultado):
+            """Mostra o resultado gravado no log e no grafo."""
+            if resultado.get('arestas'):
+                self.log(f"✓ MST gravada: custo total {resultado['custo_total']}")
+                self.destacar_arestas_mst(resultado['arestas'])
+            elif resultado['caminho']:
+                caminho_str = " → ".join(str(v) for v in resultado['caminho'])
+                self.log(f"✓ Caminho gravado: {caminho_str} (custo: {resultado['custo']})")
+                self.destacar_caminho(resultado['caminho'])
+            else:
+                self.log("✗ A execução gravada não encontrou caminho")
+        
+        self.parar_animacao()
+        self.limpar_log()
+        self.log(f"=== REPRODUZINDO TRILHA ===")
+        self.log(f"Arquivo: {caminho}")
+        self.log("(os vértices da trilha devem existir no grafo carregado)")
+        self.log("")
+        self.animar_passos(todos_os_passos(), mostrar)
+    
     # ===== EXECUTORES DE ALGORITMOS =====
     
     def executar_bfs(self):
@@ -715,27 +877,26 @@ class VisualizadorGrafos:
             self.log(f"Destino: {destino}" + (f" ({self.nomes_vertices[destino]})" if self.nomes_vertices and destino in self.nomes_vertices else ""))
         self.log("")
         
-        # Executa BFS (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = BFS.buscar(self.grafo_atual, origem, destino)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        if resultado['caminho']:
-            self.log(f"✓ Caminho encontrado:")
-            caminho_str = " → ".join(str(v) for v in resultado['caminho'])
-            self.log(f"  {caminho_str}")
-            self.log(f"  Distância: {len(resultado['caminho']) - 1} arestas")
-            
-            self.destacar_caminho(resultado['caminho'])
-        else:
-            self.log("✗ Caminho não encontrado")
-            self.resetar_visualizacao()
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            if resultado['caminho']:
+                self.log(f"✓ Caminho encontrado:")
+                caminho_str = " → ".join(str(v) for v in resultado['caminho'])
+                self.log(f"  {caminho_str}")
+                self.log(f"  Distância: {len(resultado['caminho']) - 1} arestas")
+                
+                self.destacar_caminho(resultado['caminho'])
+            else:
+                self.log("✗ Caminho não encontrado")
+                self.resetar_visualizacao()
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: BFS.buscar(grafo, origem, destino, mostrar_passos=False),
+            lambda: BFS.passos(grafo, origem, destino),
+            mostrar
+        )
     
     def executar_dfs(self):
         """Executa DFS."""
@@ -754,27 +915,26 @@ class VisualizadorGrafos:
             self.log(f"Destino: {destino}" + (f" ({self.nomes_vertices[destino]})" if self.nomes_vertices and destino in self.nomes_vertices else ""))
         self.log("")
         
-        # Executa DFS (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = DFS.buscar(self.grafo_atual, origem, destino, usar_recursao=True)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        if resultado['caminho']:
-            self.log(f"✓ Caminho encontrado:")
-            caminho_str = " → ".join(str(v) for v in resultado['caminho'])
-            self.log(f"  {caminho_str}")
-            self.log(f"  Distância: {len(resultado['caminho']) - 1} arestas")
-            
-            self.destacar_caminho(resultado['caminho'])
-        else:
-            self.log("✗ Caminho não encontrado")
-            self.resetar_visualizacao()
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            if resultado['caminho']:
+                self.log(f"✓ Caminho encontrado:")
+                caminho_str = " → ".join(str(v) for v in resultado['caminho'])
+                self.log(f"  {caminho_str}")
+                self.log(f"  Distância: {len(resultado['caminho']) - 1} arestas")
+                
+                self.destacar_caminho(resultado['caminho'])
+            else:
+                self.log("✗ Caminho não encontrado")
+                self.resetar_visualizacao()
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: DFS.buscar(grafo, origem, destino, usar_recursao=True, mostrar_passos=False),
+            lambda: DFS.passos(grafo, origem, destino, usar_recursao=True),
+            mostrar
+        )
     
     def executar_bellman_ford(self):
         """Executa Bellman-Ford."""
@@ -796,27 +956,26 @@ class VisualizadorGrafos:
         self.log(f"Destino: {destino}" + (f" ({self.nomes_vertices[destino]})" if self.nomes_vertices and destino in self.nomes_vertices else ""))
         self.log("")
         
-        # Executa (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = BellmanFord.menor_caminho(self.grafo_atual, origem, destino)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        if resultado['caminho']:
-            self.log(f"✓ Menor caminho encontrado:")
-            caminho_str = " → ".join(str(v) for v in resultado['caminho'])
-            self.log(f"  {caminho_str}")
-            self.log(f"  Custo total: {resultado['custo']}")
-            
-            self.destacar_caminho(resultado['caminho'])
-        else:
-            self.log("✗ Caminho não encontrado")
-            self.resetar_visualizacao()
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            if resultado['caminho']:
+                self.log(f"✓ Menor caminho encontrado:")
+                caminho_str = " → ".join(str(v) for v in resultado['caminho'])
+                self.log(f"  {caminho_str}")
+                self.log(f"  Custo total: {resultado['custo']}")
+                
+                self.destacar_caminho(resultado['caminho'])
+            else:
+                self.log("✗ Caminho não encontrado")
+                self.resetar_visualizacao()
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: BellmanFord.menor_caminho(grafo, origem, destino, mostrar_passos=False),
+            lambda: BellmanFord.passos(grafo, origem, destino),
+            mostrar
+        )
     
     def executar_dijkstra(self):
         """Executa Dijkstra."""
@@ -838,27 +997,26 @@ class VisualizadorGrafos:
         self.log(f"Destino: {destino}" + (f" ({self.nomes_vertices[destino]})" if self.nomes_vertices and destino in self.nomes_vertices else ""))
         self.log("")
         
-        # Executa (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = Dijkstra.menor_caminho(self.grafo_atual, origem, destino)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        if resultado['caminho']:
-            self.log(f"✓ Menor caminho encontrado:")
-            caminho_str = " → ".join(str(v) for v in resultado['caminho'])
-            self.log(f"  {caminho_str}")
-            self.log(f"  Custo total: {resultado['custo']}")
-            
-            self.destacar_caminho(resultado['caminho'])
-        else:
-            self.log("✗ Caminho não encontrado")
-            self.resetar_visualizacao()
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            if resultado['caminho']:
+                self.log(f"✓ Menor caminho encontrado:")
+                caminho_str = " → ".join(str(v) for v in resultado['caminho'])
+                self.log(f"  {caminho_str}")
+                self.log(f"  Custo total: {resultado['custo']}")
+                
+                self.destacar_caminho(resultado['caminho'])
+            else:
+                self.log("✗ Caminho não encontrado")
+                self.resetar_visualizacao()
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: Dijkstra.menor_caminho(grafo, origem, destino, mostrar_passos=False),
+            lambda: Dijkstra.passos(grafo, origem, destino),
+            mostrar
+        )
     
     def executar_kruskal(self):
         """Executa Kruskal."""
@@ -875,22 +1033,21 @@ class VisualizadorGrafos:
         self.log("Procurando Árvore Geradora Mínima...")
         self.log("")
         
-        # Executa (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = Kruskal.mst(self.grafo_atual)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        self.log(f"✓ MST encontrada!")
-        self.log(f"  Custo total: {resultado['custo_total']}")
-        self.log(f"  Número de arestas: {len(resultado['arestas'])}")
-        
-        self.destacar_arestas_mst(resultado['arestas'])
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            self.log(f"✓ MST encontrada!")
+            self.log(f"  Custo total: {resultado['custo_total']}")
+            self.log(f"  Número de arestas: {len(resultado['arestas'])}")
+            
+            self.destacar_arestas_mst(resultado['arestas'])
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: Kruskal.mst(grafo, mostrar_passos=False),
+            lambda: Kruskal.passos(grafo),
+            mostrar
+        )
     
     def executar_prim(self):
         """Executa Prim."""
@@ -912,22 +1069,21 @@ class VisualizadorGrafos:
         self.log("Procurando Árvore Geradora Mínima...")
         self.log("")
         
-        # Executa (sem saída detalhada)
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        
-        resultado = Prim.mst(self.grafo_atual, origem)
-        
-        sys.stdout = old_stdout
-        
-        # Mostra resultado
-        self.log(f"✓ MST encontrada!")
-        self.log(f"  Custo total: {resultado['custo_total']}")
-        self.log(f"  Número de arestas: {len(resultado['arestas'])}")
-        
-        self.destacar_arestas_mst(resultado['arestas'])
+        def mostrar(resultado):
+            """Mostra o resultado no log e no grafo."""
+            self.log(f"✓ MST encontrada!")
+            self.log(f"  Custo total: {resultado['custo_total']}")
+            self.log(f"  Número de arestas: {len(resultado['arestas'])}")
+            
+            self.destacar_arestas_mst(resultado['arestas'])
+        
+        # Executa de uma vez (sem saída detalhada) ou anima passo a passo
+        grafo = self.grafo_atual.snapshot()
+        self.executar_algoritmo(
+            lambda: Prim.mst(grafo, origem, mostrar_passos=False),
+            lambda: Prim.passos(grafo, origem),
+            mostrar
+        )
 
 
 def main():
@@ -0,0 +1,298 @@
+"""
+Heap Indexado: Fila de Prioridade com Diminuição de Chave
+==========================================================
+Heap d-ário (binário ou 4-ário) sobre itens inteiros densos (0..n-1), com
+operação de diminuir a chave de um item que já está no heap.
+
+CONCEITOS:
+----------
+HEAP COM REMOÇÃO PREGUIÇOSA (heapq):
+- A cada melhoria de distância, uma nova entrada (chave, item) é inserida;
+  a entrada antiga continua no heap e é descartada quando sai dele
+- Em grafos densos o heap chega a O(E) entradas, e metade das remoções
+  pode ser de entradas obsoletas
+
+HEAP INDEXADO:
+- Cada item aparece no máximo uma vez; posicao[item] guarda onde ele está
+  no vetor do heap
+- diminuir_chave sobe o item a partir da sua posição: O(log n), sem
+  entradas duplicadas
+- O heap nunca passa de n itens, e toda remoção é útil
+
+HEAP d-ÁRIO:
+- Cada nó tem d filhos: a árvore tem altura log_d(n)
+- Subir (inserir, diminuir chave) fica mais barato; descer (remover o
+  mínimo) compara até d filhos por nível
+- d = 4 costuma valer a pena quando há muitas diminuições de chave
+  (Dijkstra e Prim em grafos densos)
+
+USO:
+----
+    heap = HeapIndexado(n)
+    heap.inserir_ou_diminuir(item, chave)
+    chave, item = heap.remover_minimo()
+
+Empates na chave são decididos pelo menor item, como no heapq com tuplas
+(chave, item): Dijkstra e Prim visitam os vértices na mesma ordem com
+qualquer uma das filas.
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+from typing import Any, Dict, Tuple
+
+
+# Filas de prioridade aceitas por Dijkstra e Prim (além de 'heapq')
+ARIDADE_POR_FILA = {'binario': 2, 'quaternario': 4}
+
+
+class HeapIndexado:
+    """
+    Heap d-ário de mínimo com diminuição de chave, sobre itens 0..capacidade-1.
+    
+    Atributos:
+        aridade (int): Número de filhos de cada nó
+        insercoes (int): Itens inseridos
+        remocoes (int): Itens removidos (remover_minimo)
+        diminuicoes (int): Chaves diminuídas
+        tamanho_maximo (int): Maior número de itens no heap ao mesmo tempo
+    """
+    
+    def __init__(self, capacidade: int, aridade: int = 2):
+        """
+        Inicializa um heap vazio.
+        
+        Args:
+            capacidade (int): Número de itens possíveis (itens de 0 a capacidade-1)
+            aridade (int): Número de filhos de cada nó (padrão: 2, heap binário)
+        
+        Raises:
+            ValueError: Se a aridade for menor que 2
+        """
+        if aridade < 2:
+            raise ValueError("A aridade do heap deve ser pelo menos 2")
+        
+        self.aridade = aridade
+        self._heap = []                    # Itens, na ordem do heap
+        self._posicao = [-1] * capacidade  # Posição de cada item no heap (-1 = fora)
+        self._chave = [None] * capacidade  # (chave, item) de cada item no heap
+        self.insercoes = 0
+        self.remocoes = 0
+        self.diminuicoes = 0
+        self.tamanho_maximo = 0
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def __contains__(self, item: int) -> bool:
+        return self._posicao[item] >= 0
+    
+    def chave(self, item: int) -> Any:
+        """
+        Retorna a chave de um item que está no heap.
+        
+        Args:
+            item (int): Item a ser consultado
+        
+        Returns:
+            Any: Chave atual do item
+        
+        Raises:
+            KeyError: Se o item não estiver no heap
+        """
+        if self._posicao[item] < 0:
+            raise KeyError(item)
+        return self._chave[item][0]
+    
+    def inserir(self, item: int, chave: Any):
+        """
+        Insere um item que não está no heap.
+        
+        Args:
+            item (int): Item a ser inserido
+            chave (Any): Prioridade do item (menor sai primeiro)
+        
+        Raises:
+            ValueError: Se o item já estiver no heap
+        """
+        if self._posicao[item] >= 0:
+            raise ValueError(f"O item {item} já está no heap")
+        
+        self._chave[item] = (chave, item)
+        self._posicao[item] = len(self._heap)
+        self._heap.append(item)
+        self.insercoes += 1
+        if len(self._heap) > self.tamanho_maximo:
+            self.tamanho_maximo = len(self._heap)
+        self._subir(len(self._heap) - 1)
+    
+    def diminuir_chave(self, item: int, chave: Any):
+        """
+        Diminui a chave de um item que está no heap.
+        
+        Args:
+            item (int): Item a ser atualizado
+            chave (Any): Nova chave (não pode ser maior que a atual)
+        
+        Raises:
+            KeyError: Se o item não estiver no heap
+            ValueError: Se a nova chave for maior que a atual
+        """
+        if self._posicao[item] < 0:
+            raise KeyError(item)
+        if (chave, item) > self._chave[item]:
+            raise ValueError(f"A nova chave do item {item} é maior que a atual")
+        
+        self._chave[item] = (chave, item)
+        self.diminuicoes += 1
+        self._subir(self._posicao[item])
+    
+    def inserir_ou_diminuir(self, item: int, chave: Any) -> bool:
+        """
+        Insere o item ou, se ele já estiver no heap, diminui a sua chave.
+        
+        Args:
+            item (int): Item
+            chave (Any): Nova chave
+        
+        Returns:
+            bool: False se o item já estava no heap com chave menor ou igual
+                (nada muda)
+        """
+        if self._posicao[item] < 0:
+            self.inserir(item, chave)
+            return True
+        if (chave, item) < self._chave[item]:
+            self._chave[item] = (chave, item)
+            self.diminuicoes += 1
+            self._subir(self._posicao[item])
+            return True
+        return False
+    
+    def minimo(self) -> Tuple[Any, int]:
+        """
+        Retorna o item de menor chave, sem removê-lo.
+        
+        Returns:
+            Tuple[Any, int]: (chave, item)
+        
+        Raises:
+            IndexError: Se o heap estiver vazio
+        """
+        if not self._heap:
+            raise IndexError("O heap está vazio")
+        return self._chave[self._heap[0]]
+    
+    def remover_minimo(self) -> Tuple[Any, int]:
+        """
+        Remove e retorna o item de menor chave.
+        
+        Returns:
+            Tuple[Any, int]: (chave, item)
+        
+        Raises:
+            IndexError: Se o heap estiver vazio
+        """
+        heap = self._heap
+        if not heap:
+            raise IndexError("O heap está vazio")
+        
+        item = heap[0]
+        ultimo = heap.pop()
+        if heap:
+            heap[0] = ultimo
+            self._posicao[ultimo] = 0
+            self._descer(0)
+        
+        self._posicao[item] = -1
+        entrada = self._chave[item]
+        self._chave[item] = None
+        self.remocoes += 1
+        return entrada
+    
+    def estatisticas(self) -> Dict[str, int]:
+        """
+        Retorna os contadores de operações do heap.
+        
+        Returns:
+            Dict[str, int]: insercoes, remocoes, diminuicoes e tamanho_maximo
+        """
+        return {
+            'insercoes': self.insercoes,
+            'remocoes': self.remocoes,
+            'diminuicoes': self.diminuicoes,
+            'tamanho_maximo': self.tamanho_maximo
+        }
+    
+    def _subir(self, i: int):
+        """Sobe o item da posição i até o pai ter chave menor."""
+        heap = self._heap
+        posicao = self._posicao
+        chave = self._chave
+        aridade = self.aridade
+        
+        item = heap[i]
+        entrada = chave[item]
+        while i > 0:
+            pai = (i - 1) // aridade
+            item_pai = heap[pai]
+            if not entrada < chave[item_pai]:
+                break
+            heap[i] = item_pai
+            posicao[item_pai] = i
+            i = pai
+        heap[i] = item
+        posicao[item] = i
+    
+    def _descer(self, i: int):
+        """Desce o item da posição i até os filhos terem chaves maiores."""
+        heap = self._heap
+        posicao = self._posicao
+        chave = self._chave
+        aridade = self.aridade
+        n = len(heap)
+        
+        item = heap[i]
+        entrada = chave[item]
+        while True:
+            primeiro = aridade * i + 1
+            if primeiro >= n:
+                break
+            
+            # Menor entre os filhos
+            menor = primeiro
+            entrada_menor = chave[heap[primeiro]]
+            for filho in range(primeiro + 1, min(primeiro + aridade, n)):
+                entrada_filho = chave[heap[filho]]
+                if entrada_filho < entrada_menor:
+                    menor = filho
+                    entrada_menor = entrada_filho
+            
+            if not entrada_menor < entrada:
+                break
+            heap[i] = heap[menor]
+            posicao[heap[i]] = i
+            i = menor
+        heap[i] = item
+        posicao[item] = i
+
+
+def criar_heap(fila: str, capacidade: int) -> HeapIndexado:
+    """
+    Cria o heap indexado correspondente ao nome da fila.
+    
+    Args:
+        fila (str): 'binario' ou 'quaternario'
+        capacidade (int): Número de itens possíveis
+    
+    Returns:
+        HeapIndexado: Heap vazio com a aridade da fila
+    
+    Raises:
+        ValueError: Se a fila não for conhecida
+    """
+    if fila not in ARIDADE_POR_FILA:
+        raise ValueError(f"Fila de prioridade desconhecida: {fila!r} "
+                         f"(use 'heapq', 'binario' ou 'quaternario')")
+    return HeapIndexado(capacidade, ARIDADE_POR_FILA[fila])
@@ -0,0 +1,281 @@
+"""
+Importação de Grafos a partir de Arquivos de Arestas
+=====================================================
+Leitores em fluxo (streaming) para formatos comuns de listas de arestas:
+
+- Lista de arestas separada por espaços (formato SNAP):
+      # comentário
+      0   1
+      0   2   3.5        (terceira coluna opcional = peso)
+- DIMACS de menor caminho (.gr, 9th DIMACS Implementation Challenge):
+      c comentário
+      p sp 264346 733846
+      a 1 2 803
+- CSV com colunas de origem, destino e (opcionalmente) peso:
+      origem,destino,peso
+      0,1,2.5
+
+FUNCIONAMENTO:
+--------------
+O arquivo é lido em blocos de tamanho fixo (padrão: 1 MiB). Cada bloco é
+convertido em três vetores compactos (array) de origens, destinos e pesos,
+e entregue por um gerador. Nenhuma tupla Python por aresta é mantida: um
+arquivo de 10 GB nunca é materializado como lista de tuplas.
+
+GARANTIA DE MEMÓRIA:
+--------------------
+- Leitura: no máximo um bloco de texto e os vetores desse bloco por vez.
+- carregar(): 24 bytes por aresta no acumulador (8 + 8 + 8) e depois
+  os vetores CSR do GrafoCompacto; o acumulador é descartado ao final.
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import os
+from array import array
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from grafo_compacto import GrafoCompacto
+
+
+# Um bloco de arestas: (origens, destinos, pesos)
+BlocoArestas = Tuple[array, array, array]
+
+# progresso(bytes_lidos, bytes_totais, arestas_lidas)
+FuncaoProgresso = Callable[[int, int, int], None]
+
+
+class ImportadorArestas:
+    """
+    Leitores em fluxo de arquivos de arestas e construção do grafo em lote.
+    """
+    
+    TAMANHO_BLOCO = 1 << 20  # 1 MiB
+    
+    @staticmethod
+    def _linhas_em_blocos(caminho: str, tamanho_bloco: int) -> Iterator[Tuple[List[bytes], int, int]]:
+        """
+        Lê o arquivo em blocos de tamanho fixo e entrega as linhas completas.
+        
+        A última linha de cada bloco (possivelmente cortada) é guardada e
+        concatenada ao início do bloco seguinte.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            tamanho_bloco (int): Tamanho de cada leitura em bytes
+        
+        Yields:
+            Tuple[List[bytes], int, int]: (linhas, bytes lidos, bytes totais)
+        """
+        total = os.path.getsize(caminho)
+        lidos = 0
+        resto = b''
+        
+        with open(caminho, 'rb') as arquivo:
+            while True:
+                bloco = arquivo.read(tamanho_bloco)
+                if not bloco:
+                    break
+                lidos += len(bloco)
+                linhas = (resto + bloco).split(b'\n')
+                resto = linhas.pop()
+                yield linhas, lidos, total
+        
+        if resto:
+            yield [resto], lidos, total
+    
+    @staticmethod
+    def _ler(caminho: str, interpretar: Callable[[bytes], Optional[Tuple[int, int, float]]],
+             tamanho_bloco: int, progresso: Optional[FuncaoProgresso],
+             pular_linhas: int = 0) -> Iterator[BlocoArestas]:
+        """
+        Leitor genérico: aplica 'interpretar' a cada linha de cada bloco.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            interpretar: Converte uma linha em (origem, destino, peso) ou None
+            tamanho_bloco (int): Tamanho de cada leitura em bytes
+            progresso (Optional[FuncaoProgresso]): Chamada após cada bloco
+            pular_linhas (int): Número de linhas iniciais ignoradas (cabeçalho)
+        
+        Yields:
+            BlocoArestas: Vetores (origens, destinos, pesos) de cada bloco
+        """
+        arestas_lidas = 0
+        
+        for linhas, lidos, total in ImportadorArestas._linhas_em_blocos(caminho, tamanho_bloco):
+            if pular_linhas:
+                descartar = min(pular_linhas, len(linhas))
+                del linhas[:descartar]
+                pular_linhas -= descartar
+            
+            origens, destinos, pesos = array('q'), array('q'), array('d')
+            for linha in linhas:
+                try:
+                    aresta = interpretar(linha)
+                except (ValueError, IndexError):
+                    raise ValueError(f"Linha inválida em {caminho}: {linha[:80]!r}")
+                if aresta is not None:
+                    origens.append(aresta[0])
+                    destinos.append(aresta[1])
+                    pesos.append(aresta[2])
+            
+            arestas_lidas += len(origens)
+            if progresso is not None:
+                progresso(lidos, total, arestas_lidas)
+            
+            yield origens, destinos, pesos
+    
+    @staticmethod
+    def ler_lista_arestas(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO,
+                          progresso: Optional[FuncaoProgresso] = None) -> Iterator[BlocoArestas]:
+        """
+        Lê uma lista de arestas separada por espaços (formato SNAP).
+        
+        Linhas vazias ou iniciadas por '#' ou '%' são ignoradas. Sem a
+        terceira coluna, o peso é 1.0.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            tamanho_bloco (int): Tamanho de cada leitura em bytes
+            progresso (Optional[FuncaoProgresso]): Chamada após cada bloco
+        
+        Yields:
+            BlocoArestas: Vetores (origens, destinos, pesos) de cada bloco
+        """
+        def interpretar(linha: bytes):
+            campos = linha.split()
+            if not campos or campos[0][:1] in (b'#', b'%'):
+                return None
+            peso = float(campos[2]) if len(campos) > 2 else 1.0
+            return int(campos[0]), int(campos[1]), peso
+        
+        return ImportadorArestas._ler(caminho, interpretar, tamanho_bloco, progresso)
+    
+    @staticmethod
+    def ler_dimacs(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO,
+                   progresso: Optional[FuncaoProgresso] = None) -> Iterator[BlocoArestas]:
+        """
+        Lê um arquivo DIMACS de menor caminho (.gr).
+        
+        Apenas as linhas de arco ('a origem destino peso') geram arestas;
+        comentários ('c') e a linha de problema ('p sp n m') são ignorados.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            tamanho_bloco (int): Tamanho de cada leitura em bytes
+            progresso (Optional[FuncaoProgresso]): Chamada após cada bloco
+        
+        Yields:
+            BlocoArestas: Vetores (origens, destinos, pesos) de cada bloco
+        """
+        def interpretar(linha: bytes):
+            if not linha.startswith(b'a'):
+                return None
+            _, origem, destino, peso = linha.split()
+            return int(origem), int(destino), float(peso)
+        
+        return ImportadorArestas._ler(caminho, interpretar, tamanho_bloco, progresso)
+    
+    @staticmethod
+    def ler_csv(caminho: str, coluna_origem: Union[int, str] = 0,
+                coluna_destino: Union[int, str] = 1,
+                coluna_peso: Optional[Union[int, str]] = 2,
+                delimitador: str = ',', cabecalho: bool = True,
+                tamanho_bloco: int = TAMANHO_BLOCO,
+                progresso: Optional[FuncaoProgresso] = None) -> Iterator[BlocoArestas]:
+        """
+        Lê um arquivo CSV com uma aresta por linha.
+        
+        As colunas podem ser indicadas pelo índice (0, 1, 2...) ou, quando há
+        cabeçalho, pelo nome. Sem coluna de peso, o peso é 1.0.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            coluna_origem (Union[int, str]): Coluna do vértice de origem
+            coluna_destino (Union[int, str]): Coluna do vértice de destino
+            coluna_peso (Optional[Union[int, str]]): Coluna do peso (None = sem peso)
+            delimitador (str): Separador de campos
+            cabecalho (bool): True se a primeira linha contém os nomes das colunas
+            tamanho_bloco (int): Tamanho de cada leitura em bytes
+            progresso (Optional[FuncaoProgresso]): Chamada após cada bloco
+        
+        Yields:
+            BlocoArestas: Vetores (origens, destinos, pesos) de cada bloco
+        """
+        separador = delimitador.encode('utf-8')
+        colunas = [coluna_origem, coluna_destino, coluna_peso]
+        
+        if any(isinstance(c, str) for c in colunas):
+            if not cabecalho:
+                raise ValueError("Colunas por nome exigem um arquivo CSV com cabeçalho")
+            with open(caminho, 'rb') as arquivo:
+                nomes = [n.strip().decode('utf-8') for n in arquivo.readline().split(separador)]
+            try:
+                colunas = [nomes.index(c) if isinstance(c, str) else c for c in colunas]
+            except ValueError:
+                raise ValueError(f"Coluna não encontrada no cabeçalho: {nomes}")
+        
+        i_origem, i_destino, i_peso = colunas
+        
+        def interpretar(linha: bytes):
+            if not linha.strip():
+                return None
+            campos = linha.split(separador)
+            peso = float(campos[i_peso]) if i_peso is not None else 1.0
+            return int(campos[i_origem]), int(campos[i_destino]), peso
+        
+        return ImportadorArestas._ler(caminho, interpretar, tamanho_bloco, progresso,
+                                      pular_linhas=1 if cabecalho else 0)
+    
+    @staticmethod
+    def construir(blocos: Iterator[BlocoArestas], direcionado: bool = False) -> GrafoCompacto:
+        """
+        Constrói um grafo compacto em lote a partir de blocos de arestas.
+        
+        Args:
+            blocos (Iterator[BlocoArestas]): Blocos produzidos por um leitor
+            direcionado (bool): True se o grafo é direcionado
+        
+        Returns:
+            GrafoCompacto: Grafo imutável em formato CSR
+        """
+        origens, destinos, pesos = array('q'), array('q'), array('d')
+        for bloco_origens, bloco_destinos, bloco_pesos in blocos:
+            origens.extend(bloco_origens)
+            destinos.extend(bloco_destinos)
+            pesos.extend(bloco_pesos)
+        
+        return GrafoCompacto.de_arestas(origens, destinos, pesos, direcionado)
+    
+    @staticmethod
+    def carregar(caminho: str, formato: str = 'snap', direcionado: Optional[bool] = None,
+                 progresso: Optional[FuncaoProgresso] = None, **opcoes) -> GrafoCompacto:
+        """
+        Lê um arquivo de arestas e constrói o grafo compacto.
+        
+        Args:
+            caminho (str): Caminho do arquivo
+            formato (str): 'snap' (lista de arestas), 'dimacs' ou 'csv'
+            direcionado (Optional[bool]): Tipo do grafo (padrão: True para
+                DIMACS, False para os demais)
+            progresso (Optional[FuncaoProgresso]): Chamada após cada bloco lido
+            **opcoes: Opções repassadas ao leitor (ex.: colunas do CSV)
+        
+        Returns:
+            GrafoCompacto: Grafo imutável em formato CSR
+        """
+        leitores = {
+            'snap': ImportadorArestas.ler_lista_arestas,
+            'dimacs': ImportadorArestas.ler_dimacs,
+            'csv': ImportadorArestas.ler_csv,
+        }
+        if formato not in leitores:
+            raise ValueError(f"Formato desconhecido: {formato} (use {', '.join(leitores)})")
+        
+        if direcionado is None:
+            direcionado = formato == 'dimacs'
+        
+        blocos = leitores[formato](caminho, progresso=progresso, **opcoes)
+        return ImportadorArestas.construir(blocos, direcionado)
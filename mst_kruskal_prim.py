@@ -23,6 +23,8 @@ ALGORITMO DE PRIM:
   que conecta um vértice da árvore a um vértice fora dela
 - Usa fila de prioridade (heap) para selecionar próxima aresta
 - Complexidade: O((V + E) log V) com heap binário
+- Com heap indexado (fila='binario' ou 'quaternario'), cada vértice fora da
+  árvore fica no heap uma única vez, com a aresta mais leve até ele
 - Funciona bem para grafos densos (muitas arestas)
 
 APLICAÇÕES PRÁTICAS:
@@ -37,9 +39,12 @@ Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
 Data: Dezembro 2025
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import Iterator, List, Dict, Tuple, Set, Optional
 import heapq
+from eventos import Evento, Visita, ArestaAceita, ArestaRejeitada, Fim
 from grafo import Grafo
+from heap_indexado import criar_heap
+from rastreamento import Rastreador, obter_rastreador
 
 
 class UnionFind:
@@ -112,7 +117,8 @@ class Kruskal:
     """
     
     @staticmethod
-    def mst(grafo: Grafo) -> Dict:
+    def mst(grafo: Grafo, mostrar_passos: bool = True,
+            rastreador: Optional[Rastreador] = None) -> Dict:
         """
         Encontra a Árvore Geradora Mínima usando o algoritmo de Kruskal.
         
@@ -128,6 +134,9 @@ class Kruskal:
         
         Args:
             grafo (Grafo): Grafo não-direcionado e ponderado
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
             
         Returns:
             Dict: Dicionário contendo:
@@ -138,53 +147,60 @@ class Kruskal:
         if grafo.direcionado:
             raise ValueError("Algoritmo de Kruskal requer grafo não-direcionado")
         
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
         vertices = grafo.obter_vertices()
         arestas = grafo.obter_arestas()
         
-        print(f"\n{'='*70}")
-        print(f"EXECUTANDO KRUSKAL - ÁRVORE GERADORA MÍNIMA (MST)")
-        print(f"{'='*70}")
-        print(f"Número de vértices: {len(vertices)}")
-        print(f"Número de arestas: {len(arestas)}")
-        print(f"Arestas necessárias na MST: {len(vertices) - 1}")
-        
-        # Passo 1: Ordena arestas por peso
-        print(f"\n{'─'*70}")
-        print(f"PASSO 1: ORDENAR ARESTAS POR PESO")
-        print(f"{'─'*70}")
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO KRUSKAL - ÁRVORE GERADORA MÍNIMA (MST)")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.evento('inicio', f"Número de vértices: {len(vertices)}",
+                              algoritmo='Kruskal', vertices=len(vertices))
+            rastreador.mensagem(f"Número de arestas: {len(arestas)}")
+            rastreador.mensagem(f"Arestas necessárias na MST: {len(vertices) - 1}")
+            
+            # Passo 1: Ordena arestas por peso
+            rastreador.mensagem(f"\n{'─'*70}")
+            rastreador.mensagem(f"PASSO 1: ORDENAR ARESTAS POR PESO")
+            rastreador.mensagem(f"{'─'*70}")
         
         arestas_ordenadas = sorted(arestas, key=lambda x: x[2])
         
-        print(f"Arestas ordenadas:")
-        for u, v, peso in arestas_ordenadas:
-            print(f"  {u} -- {v}: peso = {peso}")
-        
-        # Passo 2: Inicializa Union-Find
-        print(f"\n{'─'*70}")
-        print(f"PASSO 2: INICIALIZAR UNION-FIND")
-        print(f"{'─'*70}")
-        print(f"Cada vértice começa em seu próprio conjunto")
+        if ativo:
+            rastreador.mensagem(f"Arestas ordenadas:")
+            for u, v, peso in arestas_ordenadas:
+                rastreador.mensagem(f"  {u} -- {v}: peso = {peso}")
+            
+            # Passo 2: Inicializa Union-Find
+            rastreador.mensagem(f"\n{'─'*70}")
+            rastreador.mensagem(f"PASSO 2: INICIALIZAR UNION-FIND")
+            rastreador.mensagem(f"{'─'*70}")
+            rastreador.mensagem(f"Cada vértice começa em seu próprio conjunto")
         
         uf = UnionFind(vertices)
         
         # Passo 3: Processa arestas
-        print(f"\n{'─'*70}")
-        print(f"PASSO 3: PROCESSAR ARESTAS E CONSTRUIR MST")
-        print(f"{'─'*70}")
+        if ativo:
+            rastreador.mensagem(f"\n{'─'*70}")
+            rastreador.mensagem(f"PASSO 3: PROCESSAR ARESTAS E CONSTRUIR MST")
+            rastreador.mensagem(f"{'─'*70}")
         
         mst_arestas = []
         custo_total = 0
         passos = []
         
         for i, (u, v, peso) in enumerate(arestas_ordenadas, 1):
-            print(f"\nIteração {i}:")
-            print(f"  Considerando aresta: {u} -- {v} (peso: {peso})")
-            
             raiz_u = uf.find(u)
             raiz_v = uf.find(v)
             
-            print(f"  Conjunto de {u}: representante = {raiz_u}")
-            print(f"  Conjunto de {v}: representante = {raiz_v}")
+            if ativo:
+                texto = (f"\nIteração {i}:\n"
+                         f"  Considerando aresta: {u} -- {v} (peso: {peso})\n"
+                         f"  Conjunto de {u}: representante = {raiz_u}\n"
+                         f"  Conjunto de {v}: representante = {raiz_v}")
             
             if raiz_u != raiz_v:
                 # Adiciona aresta à MST
@@ -192,8 +208,12 @@ class Kruskal:
                 custo_total += peso
                 uf.union(u, v)
                 
-                print(f"  ✓ ACEITA - Conjuntos diferentes, aresta adicionada à MST")
-                print(f"  Custo acumulado: {custo_total}")
+                if ativo:
+                    rastreador.evento('aresta',
+                                      texto + f"\n  ✓ ACEITA - Conjuntos diferentes, aresta adicionada à MST"
+                                              f"\n  Custo acumulado: {custo_total}",
+                                      iteracao=i, u=u, v=v, peso=peso, aceita=True,
+                                      custo=custo_total)
                 
                 passos.append({
                     'aresta': (u, v, peso),
@@ -203,10 +223,15 @@ class Kruskal:
                 
                 # Verifica se já tem V-1 arestas
                 if len(mst_arestas) == len(vertices) - 1:
-                    print(f"\n  ✓ MST COMPLETA! Todas as {len(vertices) - 1} arestas necessárias foram adicionadas.")
+                    if ativo:
+                        rastreador.mensagem(f"\n  ✓ MST COMPLETA! Todas as {len(vertices) - 1} arestas necessárias foram adicionadas.")
                     break
             else:
-                print(f"  ✗ REJEITADA - Formaria ciclo (vértices já estão conectados)")
+                if ativo:
+                    rastreador.evento('aresta',
+                                      texto + f"\n  ✗ REJEITADA - Formaria ciclo (vértices já estão conectados)",
+                                      iteracao=i, u=u, v=v, peso=peso, aceita=False,
+                                      custo=custo_total)
                 
                 passos.append({
                     'aresta': (u, v, peso),
@@ -214,28 +239,68 @@ class Kruskal:
                     'motivo': 'Formaria ciclo'
                 })
         
-        # Resultado final
-        print(f"\n{'='*70}")
-        print(f"ÁRVORE GERADORA MÍNIMA (MST) - RESULTADO FINAL")
-        print(f"{'='*70}")
-        print(f"\nArestas na MST:")
-        for u, v, peso in mst_arestas:
-            print(f"  {u} -- {v}: peso = {peso}")
-        
-        print(f"\nCusto total da MST: {custo_total}")
-        print(f"Número de arestas: {len(mst_arestas)}")
-        
-        # Verifica se a MST está completa
-        if len(mst_arestas) == len(vertices) - 1:
-            print(f"✓ MST está completa (conecta todos os vértices)")
-        else:
-            print(f"⚠ ATENÇÃO: Grafo não é conectado! MST incompleta.")
+        if ativo:
+            _rastrear_resultado(rastreador, vertices, mst_arestas, custo_total)
         
         return {
             'arestas': mst_arestas,
             'custo_total': custo_total,
             'passos': passos
         }
+    
+    @staticmethod
+    def passos(grafo: Grafo) -> Iterator[Evento]:
+        """
+        Executa o Kruskal passo a passo (gerador de eventos).
+        
+        Args:
+            grafo (Grafo): Grafo não-direcionado e ponderado
+            
+        Yields:
+            Evento: ArestaAceita ou ArestaRejeitada para cada aresta
+                considerada, em ordem de peso, e por último Fim com o mesmo
+                resultado de Kruskal.mst
+            
+        Raises:
+            ValueError: Se o grafo for direcionado (ao pedir o primeiro evento)
+        """
+        if grafo.direcionado:
+            raise ValueError("Algoritmo de Kruskal requer grafo não-direcionado")
+        
+        vertices = grafo.obter_vertices()
+        arestas_ordenadas = sorted(grafo.obter_arestas(), key=lambda x: x[2])
+        uf = UnionFind(vertices)
+        mst_arestas = []
+        custo_total = 0
+        passos = []
+        
+        for u, v, peso in arestas_ordenadas:
+            if uf.find(u) != uf.find(v):
+                mst_arestas.append((u, v, peso))
+                custo_total += peso
+                uf.union(u, v)
+                passos.append({
+                    'aresta': (u, v, peso),
+                    'aceita': True,
+                    'motivo': 'Não forma ciclo'
+                })
+                yield ArestaAceita(u, v, peso)
+                
+                if len(mst_arestas) == len(vertices) - 1:
+                    break
+            else:
+                passos.append({
+                    'aresta': (u, v, peso),
+                    'aceita': False,
+                    'motivo': 'Formaria ciclo'
+                })
+                yield ArestaRejeitada(u, v, peso)
+        
+        yield Fim({
+            'arestas': mst_arestas,
+            'custo_total': custo_total,
+            'passos': passos
+        })
 
 
 class Prim:
@@ -244,7 +309,8 @@ class Prim:
     """
     
     @staticmethod
-    def mst(grafo: Grafo, origem: int = None) -> Dict:
+    def mst(grafo: Grafo, origem: int = None, mostrar_passos: bool = True,
+            rastreador: Optional[Rastreador] = None, fila: str = 'heapq') -> Dict:
         """
         Encontra a Árvore Geradora Mínima usando o algoritmo de Prim.
         
@@ -259,31 +325,49 @@ class Prim:
         Args:
             grafo (Grafo): Grafo não-direcionado e ponderado
             origem (int): Vértice inicial (se None, usa o primeiro vértice)
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+            fila (str): Fila de prioridade: 'heapq' (arestas candidatas com
+                remoção preguiçosa), 'binario' ou 'quaternario' (heap indexado
+                por vértice, com diminuição de chave)
             
         Returns:
             Dict: Dicionário contendo:
                 - 'arestas': lista de arestas na MST
                 - 'custo_total': custo total da MST
                 - 'vertices_visitados': ordem de inclusão dos vértices
+                - 'estatisticas_fila': inserções, remoções, diminuições de
+                  chave e tamanho máximo da fila
+        
+        Raises:
+            ValueError: Se o grafo for direcionado ou a fila não for conhecida
         """
         if grafo.direcionado:
             raise ValueError("Algoritmo de Prim requer grafo não-direcionado")
         
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
         vertices = grafo.obter_vertices()
         
         if not vertices:
-            return {'arestas': [], 'custo_total': 0, 'vertices_visitados': []}
+            return {'arestas': [], 'custo_total': 0, 'vertices_visitados': [],
+                    'estatisticas_fila': {'insercoes': 0, 'remocoes': 0,
+                                          'diminuicoes': 0, 'tamanho_maximo': 0}}
         
         # Se origem não foi especificada, usa o primeiro vértice
         if origem is None:
             origem = vertices[0]
         
-        print(f"\n{'='*70}")
-        print(f"EXECUTANDO PRIM - ÁRVORE GERADORA MÍNIMA (MST)")
-        print(f"{'='*70}")
-        print(f"Número de vértices: {len(vertices)}")
-        print(f"Vértice inicial: {origem}")
-        print(f"Arestas necessárias na MST: {len(vertices) - 1}")
+        if ativo:
+            rastreador.mensagem(f"\n{'='*70}")
+            rastreador.mensagem(f"EXECUTANDO PRIM - ÁRVORE GERADORA MÍNIMA (MST)")
+            rastreador.mensagem(f"{'='*70}")
+            rastreador.mensagem(f"Número de vértices: {len(vertices)}")
+            rastreador.evento('inicio', f"Vértice inicial: {origem}", algoritmo='Prim',
+                              origem=origem, vertices=len(vertices))
+            rastreador.mensagem(f"Arestas necessárias na MST: {len(vertices) - 1}")
         
         # Inicialização
         mst_arestas = []
@@ -293,84 +377,213 @@ class Prim:
         
         # Heap: (peso, vértice_origem, vértice_destino)
         # Adiciona todas as arestas do vértice inicial
-        heap = []
-        for vizinho, peso in grafo.obter_vizinhos(origem):
-            heapq.heappush(heap, (peso, origem, vizinho))
-        
-        print(f"\n{'─'*70}")
-        print(f"INICIALIZAÇÃO")
-        print(f"{'─'*70}")
-        print(f"Vértice inicial {origem} adicionado à MST")
-        print(f"Arestas candidatas no heap: {len(heap)}")
+        indexado = fila != 'heapq'
+        if indexado:
+            # Heap indexado: item = índice do vértice fora da MST,
+            # chave = (peso, vértice_origem) da aresta mais leve até ele
+            heap = criar_heap(fila, len(vertices))
+            indice = {v: i for i, v in enumerate(vertices)}
+            for vizinho, peso in grafo.obter_vizinhos(origem):
+                if vizinho != origem:
+                    heap.inserir_ou_diminuir(indice[vizinho], (peso, origem))
+        else:
+            heap = []
+            for vizinho, peso in grafo.obter_vizinhos(origem):
+                heapq.heappush(heap, (peso, origem, vizinho))
+        remocoes = 0
+        tamanho_maximo = 0
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'─'*70}")
+            rastreador.mensagem(f"INICIALIZAÇÃO")
+            rastreador.mensagem(f"{'─'*70}")
+            rastreador.mensagem(f"Vértice inicial {origem} adicionado à MST")
+            rastreador.mensagem(f"Arestas candidatas no heap: {len(heap)}")
         
         passo = 1
         
         # Loop principal
         while heap and len(mst_arestas) < len(vertices) - 1:
-            print(f"\n{'─'*70}")
-            print(f"PASSO {passo}")
-            print(f"{'─'*70}")
+            if ativo:
+                rastreador.mensagem(f"\n{'─'*70}")
+                rastreador.mensagem(f"PASSO {passo}")
+                rastreador.mensagem(f"{'─'*70}")
             
             # Encontra a menor aresta que conecta MST a um vértice fora dela
             while heap:
-                peso, u, v = heapq.heappop(heap)
+                if indexado:
+                    (peso, u), i = heap.remover_minimo()
+                    v = vertices[i]
+                else:
+                    # O tamanho máximo do heap sempre é atingido logo antes de uma remoção
+                    if len(heap) > tamanho_maximo:
+                        tamanho_maximo = len(heap)
+                    remocoes += 1
+                    peso, u, v = heapq.heappop(heap)
                 
                 # Se v já está na MST, ignora esta aresta
                 if v in na_mst:
-                    print(f"  Ignorando aresta {u} -- {v} (peso: {peso}) - vértice {v} já está na MST")
+                    if ativo:
+                        rastreador.evento('descarte',
+                                          f"  Ignorando aresta {u} -- {v} (peso: {peso}) - vértice {v} já está na MST",
+                                          u=u, v=v, peso=peso)
                     continue
                 
-                # Aresta válida encontrada!
-                print(f"  Menor aresta válida: {u} -- {v} (peso: {peso})")
-                print(f"  Conecta vértice {u} (na MST) ao vértice {v} (fora da MST)")
-                
                 # Adiciona aresta à MST
                 mst_arestas.append((u, v, peso))
                 custo_total += peso
                 na_mst.add(v)
                 vertices_visitados.append(v)
                 
-                print(f"  ✓ Aresta adicionada à MST")
-                print(f"  Custo acumulado: {custo_total}")
-                print(f"  Vértices na MST: {sorted(na_mst)}")
+                if ativo:
+                    # Aresta válida encontrada!
+                    rastreador.evento('aresta',
+                                      f"  Menor aresta válida: {u} -- {v} (peso: {peso})\n"
+                                      f"  Conecta vértice {u} (na MST) ao vértice {v} (fora da MST)\n"
+                                      f"  ✓ Aresta adicionada à MST\n"
+                                      f"  Custo acumulado: {custo_total}\n"
+                                      f"  Vértices na MST: {sorted(na_mst)}",
+                                      passo=passo, u=u, v=v, peso=peso, aceita=True,
+                                      custo=custo_total)
                 
                 # Adiciona arestas do novo vértice ao heap
                 novas_arestas = 0
                 for vizinho, peso_viz in grafo.obter_vizinhos(v):
                     if vizinho not in na_mst:
-                        heapq.heappush(heap, (peso_viz, v, vizinho))
+                        if indexado:
+                            if not heap.inserir_ou_diminuir(indice[vizinho], (peso_viz, v)):
+                                continue
+                        else:
+                            heapq.heappush(heap, (peso_viz, v, vizinho))
                         novas_arestas += 1
                 
-                if novas_arestas > 0:
-                    print(f"  Novas arestas candidatas adicionadas: {novas_arestas}")
+                if novas_arestas > 0 and ativo:
+                    rastreador.mensagem(f"  Novas arestas candidatas adicionadas: {novas_arestas}")
                 
                 break
             
             passo += 1
         
-        # Resultado final
-        print(f"\n{'='*70}")
-        print(f"ÁRVORE GERADORA MÍNIMA (MST) - RESULTADO FINAL")
-        print(f"{'='*70}")
-        print(f"\nArestas na MST:")
-        for u, v, peso in mst_arestas:
-            print(f"  {u} -- {v}: peso = {peso}")
-        
-        print(f"\nCusto total da MST: {custo_total}")
-        print(f"Número de arestas: {len(mst_arestas)}")
-        print(f"Ordem de inclusão dos vértices: {vertices_visitados}")
-        
-        # Verifica se a MST está completa
-        if len(mst_arestas) == len(vertices) - 1:
-            print(f"✓ MST está completa (conecta todos os vértices)")
+        if indexado:
+            estatisticas_fila = heap.estatisticas()
         else:
-            print(f"⚠ ATENÇÃO: Grafo não é conectado! MST incompleta.")
+            # Toda entrada inserida foi removida ou ainda está no heap (que
+            # pode ter crescido depois da última remoção)
+            estatisticas_fila = {
+                'insercoes': remocoes + len(heap),
+                'remocoes': remocoes,
+                'diminuicoes': 0,
+                'tamanho_maximo': max(tamanho_maximo, len(heap))
+            }
+        
+        if ativo:
+            _rastrear_resultado(rastreador, vertices, mst_arestas, custo_total,
+                                vertices_visitados)
         
         return {
             'arestas': mst_arestas,
             'custo_total': custo_total,
-            'vertices_visitados': vertices_visitados
+            'vertices_visitados': vertices_visitados,
+            'estatisticas_fila': estatisticas_fila
         }
+    
+    @staticmethod
+    def passos(grafo: Grafo, origem: int = None) -> Iterator[Evento]:
+        """
+        Executa o Prim passo a passo (gerador de eventos).
+        
+        Args:
+            grafo (Grafo): Grafo não-direcionado e ponderado
+            origem (int): Vértice inicial (se None, usa o primeiro vértice)
+            
+        Yields:
+            Evento: Visita do vértice inicial, ArestaAceita (aresta
+                adicionada à MST), ArestaRejeitada (aresta retirada do heap
+                que levaria a um vértice já na MST) e, por último, Fim com
+                o mesmo resultado de Prim.mst
+            
+        Raises:
+            ValueError: Se o grafo for direcionado (ao pedir o primeiro evento)
+        """
+        if grafo.direcionado:
+            raise ValueError("Algoritmo de Prim requer grafo não-direcionado")
+        
+        vertices = grafo.obter_vertices()
+        if not vertices:
+            yield Fim({'arestas': [], 'custo_total': 0, 'vertices_visitados': [],
+                       'estatisticas_fila': {'insercoes': 0, 'remocoes': 0,
+                                             'diminuicoes': 0, 'tamanho_maximo': 0}})
+            return
+        
+        if origem is None:
+            origem = vertices[0]
+        
+        mst_arestas = []
+        custo_total = 0
+        na_mst = {origem}
+        vertices_visitados = [origem]
+        yield Visita(origem, 0)
+        
+        heap = []
+        for vizinho, peso in grafo.obter_vizinhos(origem):
+            heapq.heappush(heap, (peso, origem, vizinho))
+        remocoes = 0
+        tamanho_maximo = 0
+        
+        while heap and len(mst_arestas) < len(vertices) - 1:
+            if len(heap) > tamanho_maximo:
+                tamanho_maximo = len(heap)
+            remocoes += 1
+            peso, u, v = heapq.heappop(heap)
+            if v in na_mst:
+                yield ArestaRejeitada(u, v, peso)
+                continue
+            
+            mst_arestas.append((u, v, peso))
+            custo_total += peso
+            na_mst.add(v)
+            vertices_visitados.append(v)
+            yield ArestaAceita(u, v, peso)
+            
+            for vizinho, peso_viz in grafo.obter_vizinhos(v):
+                if vizinho not in na_mst:
+                    heapq.heappush(heap, (peso_viz, v, vizinho))
+        
+        yield Fim({
+            'arestas': mst_arestas,
+            'custo_total': custo_total,
+            'vertices_visitados': vertices_visitados,
+            'estatisticas_fila': {
+                'insercoes': remocoes + len(heap),
+                'remocoes': remocoes,
+                'diminuicoes': 0,
+                'tamanho_maximo': max(tamanho_maximo, len(heap))
+            }
+        })
+
+
+def _rastrear_resultado(rastreador: Rastreador, vertices: List[int],
+                        mst_arestas: List[Tuple[int, int, float]], custo_total: float,
+                        vertices_visitados: Optional[List[int]] = None):
+    """Envia ao rastreador a MST final e se ela conecta todos os vértices."""
+    rastreador.mensagem(f"\n{'='*70}")
+    rastreador.mensagem(f"ÁRVORE GERADORA MÍNIMA (MST) - RESULTADO FINAL")
+    rastreador.mensagem(f"{'='*70}")
+    rastreador.mensagem(f"\nArestas na MST:")
+    for u, v, peso in mst_arestas:
+        rastreador.mensagem(f"  {u} -- {v}: peso = {peso}")
+    
+    rastreador.evento('fim', f"\nCusto total da MST: {custo_total}",
+                      custo_total=custo_total, arestas=len(mst_arestas))
+    rastreador.mensagem(f"Número de arestas: {len(mst_arestas)}")
+    if vertices_visitados is not None:
+        rastreador.mensagem(f"Ordem de inclusão dos vértices: {vertices_visitados}")
+    
+    # Verifica se a MST está completa
+    if len(mst_arestas) == len(vertices) - 1:
+        rastreador.mensagem(f"✓ MST está completa (conecta todos os vértices)")
+    else:
+        rastreador.mensagem(f"⚠ ATENÇÃO: Grafo não é conectado! MST incompleta.")
 
 
 # Função auxiliar para demonstração
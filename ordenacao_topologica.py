@@ -0,0 +1,415 @@
+"""
+Ordenação Topológica: Algoritmo de Kahn, Ondas e Caminho Crítico
+================================================================
+Ordena os vértices de um grafo direcionado acíclico (DAG) de forma que
+toda aresta u -> v tenha u antes de v, agrupando-os em "ondas" de vértices
+que podem ser processados ao mesmo tempo.
+
+CONCEITOS:
+----------
+ALGORITMO DE KAHN:
+- Conta as arestas de entrada (grau de entrada) de cada vértice
+- Os vértices com grau 0 não dependem de ninguém: formam a primeira onda
+- Ao processar uma onda, o grau de cada sucessor diminui; quem chega a 0
+  entra na onda seguinte
+- Se sobrarem vértices com grau > 0, o grafo tem ciclo (esses vértices e
+  os que dependem deles nunca ficam prontos)
+- Complexidade: O(V + E), com os graus em um array indexado pela linha CSR
+
+ONDAS (INSTALAÇÃO EM PARALELO):
+- Onda k = vértices cujas dependências estão todas nas ondas 0..k-1
+- Os vértices de uma mesma onda são independentes entre si: podem ser
+  instalados ao mesmo tempo
+- Kahn.ondas é um gerador: cada onda é entregue assim que fica pronta, sem
+  esperar a ordem completa
+- O Escalonador vai além: um vértice fica pronto no instante em que sua
+  última dependência é concluída, sem esperar o fim da onda inteira
+
+CAMINHO CRÍTICO:
+- Com a duração de cada tarefa (ex.: tempo de instalação), o início mais
+  cedo de v é o maior término entre as suas dependências
+- O caminho crítico é a cadeia de dependências que define o tempo total:
+  atrasar qualquer tarefa dele atrasa tudo
+
+DIREÇÃO DAS ARESTAS:
+- Padrão: u -> v significa "u vem antes de v"
+- reverso=True: u -> v significa "u depende de v" (v vem antes), como no
+  sistema de dependências de aplicacoes_praticas.py
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bfs_dfs import _vetores_por_linha
+from grafo import Grafo
+from rastreamento import Rastreador, obter_rastreador
+
+
+def _preparar(grafo: Grafo, reverso: bool) -> Tuple:
+    """
+    Obtém os sucessores (no sentido da ordenação) e os graus de entrada.
+    
+    Returns:
+        Tuple: (ids, offsets, sucessores, grau, obter_linha), com os
+            sucessores em linhas CSR e grau[linha] = dependências pendentes
+    """
+    ids, offsets, destinos, obter_linha, entrada = _vetores_por_linha(grafo, entrada=True)
+    offsets_entrada, origens = entrada
+    
+    if reverso:
+        # u -> v = "u depende de v": v libera u (arestas de entrada de v)
+        offsets, offsets_entrada, destinos = offsets_entrada, offsets, origens
+    
+    n = len(ids)
+    grau = array('q', [0]) * n
+    for v in range(n):
+        grau[v] = offsets_entrada[v + 1] - offsets_entrada[v]
+    
+    return ids, offsets, destinos, grau, obter_linha
+
+
+def _converter(ids: Sequence[int]) -> Callable[[List[int]], List[int]]:
+    """Retorna a função que converte uma lista de linhas em vértices."""
+    n = len(ids)
+    if n and ids[0] == 0 and ids[n - 1] == n - 1:
+        return lambda linhas: linhas
+    return lambda linhas: [ids[linha] for linha in linhas]
+
+
+class Kahn:
+    """
+    Implementação do algoritmo de Kahn para ordenação topológica.
+    """
+    
+    @staticmethod
+    def ordenar(grafo: Grafo, reverso: bool = False, mostrar_passos: bool = True,
+                rastreador: Optional[Rastreador] = None) -> Dict:
+        """
+        Calcula a ordem topológica e as ondas de um grafo direcionado.
+        
+        FUNCIONAMENTO:
+        1. Calcula o grau de entrada de cada vértice
+        2. Primeira onda: vértices com grau 0
+        3. Para cada vértice da onda atual, decrementa o grau dos sucessores;
+           os que chegam a 0 formam a próxima onda
+        4. Repete até uma onda vazia; vértices que sobraram estão em ciclos
+           ou dependem de um ciclo
+        
+        Args:
+            grafo (Grafo): Grafo direcionado (Grafo ou GrafoCompacto)
+            reverso (bool): Se True, u -> v significa "u depende de v"
+            mostrar_passos (bool): Se False, não imprime os passos
+            rastreador (Optional[Rastreador]): Destino dos eventos de execução
+                (tem prioridade sobre mostrar_passos)
+        
+        Returns:
+            Dict: Dicionário contendo:
+                - 'ordem': vértices em ordem topológica (onda a onda)
+                - 'ondas': lista de ondas (vértices independentes entre si)
+                - 'onda': índice da onda de cada vértice ordenado
+                - 'tem_ciclo': True se algum vértice não pôde ser ordenado
+                - 'restantes': vértices não ordenados (em ciclos ou após eles)
+        """
+        rastreador = obter_rastreador(mostrar_passos, rastreador)
+        ativo = rastreador.ativo
+        
+        ids, offsets, sucessores, grau, _ = _preparar(grafo, reverso)
+        
+        if ativo:
+            rastreador.mensagem(f"\n{'='*60}")
+            rastreador.mensagem(f"EXECUTANDO KAHN - ORDENAÇÃO TOPOLÓGICA")
+            rastreador.mensagem(f"{'='*60}")
+            rastreador.evento('inicio', f"Vértices: {len(ids)}",
+                              algoritmo='Kahn', vertices=len(ids))
+        
+        converter = _converter(ids)
+        ondas = []
+        ordem = []
+        onda = {}
+        
+        for linhas in Kahn._ondas_linhas(offsets, sucessores, grau):
+            vertices = converter(linhas)
+            if ativo:
+                rastreador.evento('onda', f"  Onda {len(ondas)}: {vertices}",
+                                  onda=len(ondas), vertices=vertices)
+            for v in vertices:
+                onda[v] = len(ondas)
+            ordem.extend(vertices)
+            ondas.append(vertices)
+        
+        restantes = [v for v in ids if v not in onda] if len(ordem) < len(ids) else []
+        
+        if ativo:
+            if restantes:
+                rastreador.evento('ciclo',
+                                  f"\n⚠ {len(restantes)} vértices em ciclos (ou dependentes "
+                                  f"de ciclos) não foram ordenados: {restantes}",
+                                  restantes=restantes)
+            rastreador.evento('fim',
+                              f"\nOndas: {len(ondas)}  Vértices ordenados: {len(ordem)}",
+                              visitados=len(ordem))
+        
+        return {
+            'ordem': ordem,
+            'ondas': ondas,
+            'onda': onda,
+            'tem_ciclo': bool(restantes),
+            'restantes': restantes
+        }
+    
+    @staticmethod
+    def ondas(grafo: Grafo, reverso: bool = False) -> Iterator[List[int]]:
+        """
+        Gera as ondas uma a uma, à medida que ficam prontas.
+        
+        Args:
+            grafo (Grafo): Grafo direcionado (Grafo ou GrafoCompacto)
+            reverso (bool): Se True, u -> v significa "u depende de v"
+        
+        Yields:
+            List[int]: Vértices da próxima onda
+        
+        Raises:
+            ValueError: Ao final, se o grafo tem ciclo (depois de entregar
+                todas as ondas possíveis)
+        """
+        ids, offsets, sucessores, grau, _ = _preparar(grafo, reverso)
+        converter = _converter(ids)
+        total = 0
+        for linhas in Kahn._ondas_linhas(offsets, sucessores, grau):
+            total += len(linhas)
+            yield converter(linhas)
+        
+        if total < len(ids):
+            raise ValueError(f"O grafo contém ciclo: {len(ids) - total} vértices "
+                             f"não podem ser ordenados")
+    
+    @staticmethod
+    def _ondas_linhas(offsets: Sequence[int], sucessores: Sequence[int],
+                      grau: array) -> Iterator[List[int]]:
+        """Laço de Kahn sobre as linhas CSR; gera cada onda (em linhas)."""
+        onda = [v for v in range(len(grau)) if grau[v] == 0]
+        while onda:
+            yield onda
+            proxima = []
+            for u in onda:
+                for w in sucessores[offsets[u]:offsets[u + 1]]:
+                    grau[w] -= 1
+                    if grau[w] == 0:
+                        proxima.append(w)
+            onda = proxima
+    
+    @staticmethod
+    def caminho_critico(grafo: Grafo, duracao: Optional[Dict[int, float]] = None,
+                        reverso: bool = False) -> Dict:
+        """
+        Calcula os tempos mais cedo de início/término e o caminho crítico.
+        
+        FUNCIONAMENTO:
+        - Percorre os vértices em ordem topológica
+        - inicio[v] = maior termino entre as dependências de v (0 se nenhuma)
+        - termino[v] = inicio[v] + duracao[v]
+        - O caminho crítico termina no vértice de maior término e volta pela
+          dependência que definiu cada início
+        
+        Args:
+            grafo (Grafo): Grafo direcionado (Grafo ou GrafoCompacto)
+            duracao (Optional[Dict[int, float]]): Duração de cada vértice (None =
+                todas 1; vértices ausentes do dicionário têm duração 0)
+            reverso (bool): Se True, u -> v significa "u depende de v"
+        
+        Returns:
+            Dict: Dicionário contendo:
+                - 'inicio': início mais cedo de cada vértice ordenado
+                - 'termino': término mais cedo de cada vértice ordenado
+                - 'caminho': caminho crítico, na ordem de execução
+                - 'duracao_total': tempo total (término do caminho crítico)
+                - 'tem_ciclo': True se algum vértice não pôde ser ordenado
+                  (ele e seus dependentes ficam fora do cálculo)
+        """
+        ids, offsets, sucessores, grau, _ = _preparar(grafo, reverso)
+        n = len(ids)
+        
+        if duracao is None:
+            tempo = array('d', [1.0]) * n
+        else:
+            tempo = array('d', (duracao.get(v, 0.0) for v in ids))
+        
+        inicio = array('d', bytes(8 * n))
+        anterior = array('q', [-1]) * n  # Dependência que define o início
+        ordenados = 0
+        fim_maximo = -1.0
+        ultimo = -1
+        
+        onda = [v for v in range(n) if grau[v] == 0]
+        while onda:
+            proxima = []
+            for u in onda:
+                ordenados += 1
+                termino_u = inicio[u] + tempo[u]
+                if termino_u > fim_maximo:
+                    fim_maximo = termino_u
+                    ultimo = u
+                for w in sucessores[offsets[u]:offsets[u + 1]]:
+                    if termino_u > inicio[w] or anterior[w] < 0:
+                        inicio[w] = termino_u
+                        anterior[w] = u
+                    grau[w] -= 1
+                    if grau[w] == 0:
+                        proxima.append(w)
+            onda = proxima
+        
+        caminho = []
+        v = ultimo
+        while v >= 0:
+            caminho.append(ids[v])
+            v = anterior[v]
+        caminho.reverse()
+        
+        inicios = {}
+        terminos = {}
+        for v in range(n):
+            if grau[v] == 0:
+                inicios[ids[v]] = inicio[v]
+                terminos[ids[v]] = inicio[v] + tempo[v]
+        
+        return {
+            'inicio': inicios,
+            'termino': terminos,
+            'caminho': caminho,
+            'duracao_total': max(fim_maximo, 0.0),
+            'tem_ciclo': ordenados < n
+        }
+
+
+class Escalonador:
+    """
+    Libera as tarefas de um grafo de dependências à medida que são concluídas.
+    
+    Uma tarefa fica pronta no instante em que sua última dependência é
+    concluída, sem esperar as demais tarefas da mesma onda:
+        
+        escalonador = Escalonador(grafo, reverso=True)
+        prontas = escalonador.prontas()
+        while prontas:
+            ...                                    # inicia as tarefas prontas
+            prontas = escalonador.concluir(tarefa) # ao terminar cada uma
+    
+    Atributos:
+        concluidas (int): Número de tarefas concluídas
+        total (int): Número total de tarefas
+    """
+    
+    def __init__(self, grafo: Grafo, reverso: bool = False):
+        """
+        Inicializa o escalonador com os graus de entrada do grafo.
+        
+        Args:
+            grafo (Grafo): Grafo direcionado (Grafo ou GrafoCompacto)
+            reverso (bool): Se True, u -> v significa "u depende de v"
+        """
+        ids, offsets, sucessores, grau, obter_linha = _preparar(grafo, reverso)
+        self._ids = ids
+        self._offsets = offsets
+        self._sucessores = sucessores
+        self._grau = grau
+        self._obter_linha = obter_linha
+        self._concluida = bytearray(len(ids))
+        self._iniciais = [ids[v] for v in range(len(ids)) if grau[v] == 0]
+        self.concluidas = 0
+        self.total = len(ids)
+    
+    def prontas(self) -> List[int]:
+        """
+        Retorna as tarefas sem dependências (prontas desde o início).
+        
+        Returns:
+            List[int]: Tarefas que podem ser iniciadas imediatamente
+        """
+        return list(self._iniciais)
+    
+    def concluir(self, tarefa: int) -> List[int]:
+        """
+        Marca uma tarefa como concluída.
+        
+        Args:
+            tarefa (int): Tarefa concluída
+        
+        Returns:
+            List[int]: Tarefas que acabaram de ficar prontas
+        
+        Raises:
+            ValueError: Se a tarefa não existe, já foi concluída ou ainda
+                tem dependências pendentes
+        """
+        u = self._obter_linha(tarefa)
+        if u is None:
+            raise ValueError(f"Tarefa {tarefa} não pertence ao grafo")
+        if self._concluida[u]:
+            raise ValueError(f"Tarefa {tarefa} já foi concluída")
+        if self._grau[u] > 0:
+            raise ValueError(f"Tarefa {tarefa} ainda tem {self._grau[u]} dependência(s) pendente(s)")
+        
+        self._concluida[u] = 1
+        self.concluidas += 1
+        
+        grau = self._grau
+        liberadas = []
+        for w in self._sucessores[self._offsets[u]:self._offsets[u + 1]]:
+            grau[w] -= 1
+            if grau[w] == 0:
+                liberadas.append(self._ids[w])
+        return liberadas
+    
+    def finalizado(self) -> bool:
+        """
+        Indica se todas as tarefas foram concluídas.
+        
+        Returns:
+            bool: True se não resta nenhuma tarefa
+        """
+        return self.concluidas == self.total
+
+
+def demonstrar_ordenacao_topologica():
+    """
+    Função de demonstração da ordenação topológica no sistema de dependências.
+    """
+    from aplicacoes_praticas import AplicacaoDependencias
+    
+    print("\n" + "="*70)
+    print("DEMONSTRAÇÃO: ORDENAÇÃO TOPOLÓGICA (KAHN) E CAMINHO CRÍTICO")
+    print("="*70)
+    
+    grafo = AplicacaoDependencias.criar_sistema()
+    nomes = AplicacaoDependencias.obter_nomes()
+    tempos = AplicacaoDependencias.obter_tempos_instalacao()
+    
+    # Arestas "A depende de B": B é instalado antes de A
+    resultado = Kahn.ordenar(grafo, reverso=True)
+    
+    print("\nOndas de instalação:")
+    for k, onda in enumerate(resultado['ondas']):
+        print(f"  Onda {k}: {', '.join(nomes[v] for v in onda)}")
+    
+    critico = Kahn.caminho_critico(grafo, tempos, reverso=True)
+    print(f"\nCaminho crítico ({critico['duracao_total']:.0f} s):")
+    print(f"  {' → '.join(nomes[v] for v in critico['caminho'])}")
+    
+    print("\nEscalonador (cada pacote é liberado quando suas dependências terminam):")
+    escalonador = Escalonador(grafo, reverso=True)
+    fila = escalonador.prontas()
+    while fila:
+        pacote = fila.pop(0)
+        liberados = escalonador.concluir(pacote)
+        if liberados:
+            print(f"  {nomes[pacote]} concluído → libera {', '.join(nomes[v] for v in liberados)}")
+        fila.extend(liberados)
+    print(f"  Concluídos: {escalonador.concluidas} de {escalonador.total}")
+
+
+if __name__ == "__main__":
+    demonstrar_ordenacao_topologica()
@@ -0,0 +1,226 @@
+"""
+Módulo de Rastreamento: Eventos de Execução dos Algoritmos
+===========================================================
+Os algoritmos não chamam print() diretamente: cada passo relevante é
+enviado a um "rastreador", que decide o que fazer com ele.
+
+RASTREADORES:
+-------------
+- RastreadorNulo:    descarta tudo (usado com mostrar_passos=False)
+- RastreadorConsole: imprime o texto dos passos (comportamento padrão)
+- RastreadorLista:   guarda os eventos em memória (GUI, testes)
+- RastreadorArquivo: grava um evento por linha em JSON (análise posterior)
+- RastreadorTrilha:  registros binários de tamanho fixo (trilha.py)
+
+INTERFACE:
+----------
+    ativo (bool)                     False = os algoritmos nem montam os eventos
+    evento(tipo, texto, **dados)     passo estruturado + texto legível
+    mensagem(texto)                  linha de texto sem dados (cabeçalhos, resumos)
+
+CUSTO:
+------
+Dentro dos laços, os algoritmos testam 'ativo' antes de formatar qualquer
+texto ou montar os dados:
+
+    if ativo:
+        rastreador.evento('visita', f"Visitando {v}", vertice=v)
+
+Com o rastreador nulo o custo por passo é apenas esse teste.
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import json
+import sys
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+
+class Rastreador:
+    """
+    Interface dos rastreadores. Subclasses sobrescrevem evento() e mensagem().
+    
+    Atributos:
+        ativo (bool): Se False, os algoritmos não geram eventos
+    """
+    
+    ativo = True
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """
+        Registra um passo do algoritmo.
+        
+        Args:
+            tipo (str): Tipo do evento (ex.: 'visita', 'relaxamento')
+            texto (str): Descrição legível do passo (pode ter várias linhas)
+            **dados: Dados estruturados do passo (vértices, pesos, distâncias)
+        """
+        raise NotImplementedError
+    
+    def mensagem(self, texto: str):
+        """
+        Registra uma linha de texto sem dados estruturados.
+        
+        Args:
+            texto (str): Texto a ser registrado
+        """
+        self.evento('mensagem', texto)
+
+
+class RastreadorNulo(Rastreador):
+    """
+    Rastreador que descarta todos os eventos.
+    """
+    
+    ativo = False
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """Descarta o evento."""
+    
+    def mensagem(self, texto: str):
+        """Descarta a mensagem."""
+
+
+class RastreadorConsole(Rastreador):
+    """
+    Rastreador que imprime o texto de cada evento.
+    """
+    
+    def __init__(self, saida: Optional[TextIO] = None):
+        """
+        Inicializa o rastreador.
+        
+        Args:
+            saida (Optional[TextIO]): Arquivo de saída (padrão: sys.stdout)
+        """
+        self.saida = saida
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """Imprime o texto do evento (eventos sem texto não geram saída)."""
+        if texto:
+            print(texto, file=self.saida if self.saida is not None else sys.stdout)
+    
+    def mensagem(self, texto: str):
+        """Imprime a mensagem."""
+        print(texto, file=self.saida if self.saida is not None else sys.stdout)
+
+
+class RastreadorLista(Rastreador):
+    """
+    Rastreador que guarda os eventos em memória.
+    
+    Atributos:
+        eventos (List[Tuple[str, Dict]]): Pares (tipo, dados) na ordem de emissão
+        textos (List[str]): Texto de cada evento e mensagem, na mesma ordem
+    """
+    
+    def __init__(self, guardar_mensagens: bool = True):
+        """
+        Inicializa o rastreador.
+        
+        Args:
+            guardar_mensagens (bool): Se False, ignora mensagens de texto puro
+        """
+        self.eventos: List[Tuple[str, Dict[str, Any]]] = []
+        self.textos: List[str] = []
+        self.guardar_mensagens = guardar_mensagens
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """Guarda o evento."""
+        self.eventos.append((tipo, dados))
+        self.textos.append(texto)
+    
+    def mensagem(self, texto: str):
+        """Guarda a mensagem como um evento do tipo 'mensagem'."""
+        if self.guardar_mensagens:
+            self.eventos.append(('mensagem', {}))
+            self.textos.append(texto)
+    
+    def filtrar(self, tipo: str) -> List[Dict[str, Any]]:
+        """
+        Retorna os dados de todos os eventos de um tipo.
+        
+        Args:
+            tipo (str): Tipo do evento
+        
+        Returns:
+            List[Dict[str, Any]]: Dados dos eventos, na ordem de emissão
+        """
+        return [dados for t, dados in self.eventos if t == tipo]
+    
+    def obter_texto(self) -> str:
+        """
+        Retorna todo o texto registrado, como seria impresso no console.
+        
+        Returns:
+            str: Textos não vazios separados por quebra de linha
+        """
+        return '\n'.join(texto for texto in self.textos if texto)
+
+
+class RastreadorArquivo(Rastreador):
+    """
+    Rastreador que grava um evento por linha em formato JSON (JSON Lines).
+    
+    Cada linha tem o campo 'tipo', os dados do evento e, nas mensagens,
+    o campo 'texto'. Pode ser usado como gerenciador de contexto:
+    
+        with RastreadorArquivo('bfs.jsonl') as r:
+            BFS.buscar(grafo, 0, rastreador=r)
+    """
+    
+    def __init__(self, caminho: str, incluir_texto: bool = False):
+        """
+        Inicializa o rastreador, abrindo o arquivo para escrita.
+        
+        Args:
+            caminho (str): Caminho do arquivo de saída
+            incluir_texto (bool): Se True, grava também o texto de cada evento
+        """
+        self.arquivo = open(caminho, 'w', encoding='utf-8')
+        self.incluir_texto = incluir_texto
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """Grava o evento como uma linha JSON."""
+        registro = {'tipo': tipo}
+        registro.update(dados)
+        if self.incluir_texto and texto:
+            registro['texto'] = texto
+        self.arquivo.write(json.dumps(registro, ensure_ascii=False, default=str) + '\n')
+    
+    def mensagem(self, texto: str):
+        """Grava a mensagem como um evento do tipo 'mensagem'."""
+        self.arquivo.write(json.dumps({'tipo': 'mensagem', 'texto': texto},
+                                      ensure_ascii=False) + '\n')
+    
+    def fechar(self):
+        """Fecha o arquivo."""
+        self.arquivo.close()
+    
+    def __enter__(self) -> 'RastreadorArquivo':
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+RASTREADOR_NULO = RastreadorNulo()
+
+
+def obter_rastreador(mostrar_passos: bool = True,
+                     rastreador: Optional[Rastreador] = None) -> Rastreador:
+    """
+    Escolhe o rastreador usado por um algoritmo.
+    
+    Args:
+        mostrar_passos (bool): Se False e nenhum rastreador for informado,
+            usa o rastreador nulo
+        rastreador (Optional[Rastreador]): Rastreador explícito (tem prioridade)
+    
+    Returns:
+        Rastreador: Rastreador a ser usado
+    """
+    if rastreador is not None:
+        return rastreador
+    return RastreadorConsole() if mostrar_passos else RASTREADOR_NULO
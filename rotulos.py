@@ -0,0 +1,267 @@
+"""
+Módulo de Rótulos: Tabela de Internação de Nomes
+=================================================
+Este módulo converte rótulos externos (nomes de cidades, IPs, códigos de
+pacotes) em identificadores inteiros densos 0, 1, 2... e vice-versa.
+
+CONCEITOS:
+----------
+Internar um rótulo significa guardá-lo uma única vez e passar a usar
+apenas o seu identificador inteiro. Os algoritmos continuam trabalhando
+com vértices inteiros; o nome só é consultado na hora de exibir.
+
+ESTRUTURA:
+----------
+- texto:    todos os rótulos em UTF-8, concatenados (um único bloco)
+- offsets:  int64[n + 1], início de cada rótulo no texto
+- hashes:   uint32[n], hash CRC-32 de cada rótulo
+- slots:    int64[capacidade], tabela de hash com endereçamento aberto
+            (sondagem linear) guardando o id de cada rótulo, -1 = vazio
+
+Consultas:
+- id -> rótulo: O(1), fatia texto[offsets[id]:offsets[id + 1]]
+- rótulo -> id: O(1) em média, uma sondagem na tabela de hash
+
+O hash é o CRC-32 (zlib), estável entre execuções, diferente do hash()
+do Python, que é aleatório por processo. Assim os vetores podem ser
+gravados em disco ou mapeados em memória e reutilizados sem reconstrução.
+
+Custo de memória por rótulo: tamanho em UTF-8 + 8 (offset) + 4 (hash)
++ até 16 bytes de tabela (ocupação máxima de 50%).
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import zlib
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class TabelaRotulos:
+    """
+    Tabela bidirecional rótulo <-> id com armazenamento compacto.
+    
+    Comporta-se como o dicionário vértice -> nome usado no resto do projeto
+    (nomes[v], v in nomes, nomes.get(v), nomes.items()).
+    """
+    
+    CAPACIDADE_INICIAL = 16
+    
+    def __init__(self):
+        """Inicializa uma tabela vazia."""
+        self._texto = bytearray()
+        self._offsets = array('q', [0])
+        self._hashes = array('I')
+        self._slots = array('q', [-1]) * TabelaRotulos.CAPACIDADE_INICIAL
+        self._somente_leitura = False
+    
+    @staticmethod
+    def de_vetores(offsets, texto, hashes=None, slots=None) -> 'TabelaRotulos':
+        """
+        Cria uma tabela somente leitura sobre vetores já existentes.
+        
+        Os vetores podem ser arrays ou memoryviews de um arquivo mapeado
+        (mmap); nada é copiado. Se 'hashes' e 'slots' não forem
+        informados, são calculados a partir do texto. Rótulos repetidos
+        resolvem para o primeiro id.
+        
+        Args:
+            offsets: Início de cada rótulo no texto (tamanho n + 1)
+            texto: Rótulos em UTF-8 concatenados
+            hashes: CRC-32 de cada rótulo (opcional)
+            slots: Tabela de hash com os ids (opcional)
+        
+        Returns:
+            TabelaRotulos: Tabela somente leitura
+        """
+        tabela = TabelaRotulos.__new__(TabelaRotulos)
+        tabela._texto = texto
+        tabela._offsets = offsets
+        tabela._somente_leitura = True
+        
+        n = len(offsets) - 1
+        if hashes is None:
+            hashes = array('I', (zlib.crc32(texto[offsets[i]:offsets[i + 1]])
+                                 for i in range(n)))
+        tabela._hashes = hashes
+        
+        if slots is None:
+            capacidade = TabelaRotulos.CAPACIDADE_INICIAL
+            while capacidade < 2 * n:
+                capacidade *= 2
+            tabela._slots = array('q', [-1]) * capacidade
+            for i in range(n):
+                if tabela._procurar(tabela._rotulo_bytes(i), hashes[i]) < 0:
+                    tabela._inserir_slot(i)
+        else:
+            tabela._slots = slots
+        
+        return tabela
+    
+    @staticmethod
+    def de_dicionario(nomes: Dict[int, str]) -> 'TabelaRotulos':
+        """
+        Cria uma tabela a partir de um dicionário de nomes com ids densos.
+        
+        Args:
+            nomes (Dict[int, str]): Dicionário id -> nome com ids 0..n-1
+        
+        Returns:
+            TabelaRotulos: Tabela em que tabela[v] == nomes[v]
+        
+        Raises:
+            ValueError: Se os ids não forem 0..n-1 ou houver nomes repetidos
+        """
+        tabela = TabelaRotulos()
+        for v in range(len(nomes)):
+            if v not in nomes:
+                raise ValueError(f"Ids dos nomes devem ser 0..{len(nomes) - 1}")
+            if tabela.internar(nomes[v]) != v:
+                raise ValueError(f"Nome repetido: {nomes[v]}")
+        return tabela
+    
+    def _rotulo_bytes(self, i: int):
+        """Retorna os bytes do rótulo de id i."""
+        return self._texto[self._offsets[i]:self._offsets[i + 1]]
+    
+    def _procurar(self, chave: bytes, h: int) -> int:
+        """
+        Procura um rótulo na tabela de hash.
+        
+        Returns:
+            int: Id do rótulo, ou -1 se não estiver na tabela
+        """
+        slots = self._slots
+        mascara = len(slots) - 1
+        i = h & mascara
+        while True:
+            ident = slots[i]
+            if ident < 0:
+                return -1
+            if self._hashes[ident] == h and self._rotulo_bytes(ident) == chave:
+                return ident
+            i = (i + 1) & mascara
+    
+    def _inserir_slot(self, ident: int):
+        """Coloca um id no primeiro slot livre a partir do seu hash."""
+        slots = self._slots
+        mascara = len(slots) - 1
+        i = self._hashes[ident] & mascara
+        while slots[i] >= 0:
+            i = (i + 1) & mascara
+        slots[i] = ident
+    
+    def _redimensionar(self):
+        """Dobra a capacidade da tabela de hash e reinsere todos os ids."""
+        self._slots = array('q', [-1]) * (2 * len(self._slots))
+        for ident in range(len(self)):
+            self._inserir_slot(ident)
+    
+    def internar(self, rotulo: str) -> int:
+        """
+        Retorna o id de um rótulo, criando um novo id se necessário.
+        
+        Args:
+            rotulo (str): Rótulo externo
+        
+        Returns:
+            int: Id denso do rótulo (0, 1, 2... na ordem de internação)
+        
+        Raises:
+            ValueError: Se a tabela for somente leitura e o rótulo for novo
+        """
+        chave = rotulo.encode('utf-8')
+        h = zlib.crc32(chave)
+        ident = self._procurar(chave, h)
+        if ident >= 0:
+            return ident
+        
+        if self._somente_leitura:
+            raise ValueError(f"Tabela de rótulos somente leitura: '{rotulo}' não existe")
+        
+        ident = len(self)
+        self._texto += chave
+        self._offsets.append(len(self._texto))
+        self._hashes.append(h)
+        if 2 * (ident + 1) > len(self._slots):
+            self._redimensionar()
+        else:
+            self._inserir_slot(ident)
+        return ident
+    
+    def obter_id(self, rotulo: str) -> Optional[int]:
+        """
+        Retorna o id de um rótulo sem internar.
+        
+        Args:
+            rotulo (str): Rótulo externo
+        
+        Returns:
+            Optional[int]: Id do rótulo, ou None se não existir
+        """
+        chave = rotulo.encode('utf-8')
+        ident = self._procurar(chave, zlib.crc32(chave))
+        return ident if ident >= 0 else None
+    
+    def obter_rotulo(self, ident: int) -> str:
+        """
+        Retorna o rótulo de um id.
+        
+        Args:
+            ident (int): Id do rótulo
+        
+        Returns:
+            str: Rótulo
+        
+        Raises:
+            KeyError: Se o id não existir
+        """
+        if not 0 <= ident < len(self):
+            raise KeyError(ident)
+        return bytes(self._rotulo_bytes(ident)).decode('utf-8')
+    
+    def obter_vetores(self) -> Dict[str, object]:
+        """
+        Retorna os vetores internos, para gravação em disco.
+        
+        Returns:
+            Dict[str, object]: Vetores 'offsets', 'texto', 'hashes' e 'slots'
+        """
+        return {
+            'offsets': self._offsets,
+            'texto': self._texto,
+            'hashes': self._hashes,
+            'slots': self._slots
+        }
+    
+    def __getitem__(self, ident: int) -> str:
+        """Retorna o rótulo de um id (KeyError se não existir)."""
+        return self.obter_rotulo(ident)
+    
+    def get(self, ident: int, padrao: Optional[str] = None) -> Optional[str]:
+        """Retorna o rótulo de um id, ou 'padrao' se não existir."""
+        if isinstance(ident, int) and 0 <= ident < len(self):
+            return self.obter_rotulo(ident)
+        return padrao
+    
+    def __contains__(self, ident: int) -> bool:
+        """Verifica se o id existe na tabela."""
+        return isinstance(ident, int) and 0 <= ident < len(self)
+    
+    def __len__(self) -> int:
+        """Retorna o número de rótulos."""
+        return len(self._offsets) - 1
+    
+    def __iter__(self) -> Iterator[int]:
+        """Percorre os ids em ordem crescente."""
+        return iter(range(len(self)))
+    
+    def items(self) -> Iterator[Tuple[int, str]]:
+        """Percorre os pares (id, rótulo)."""
+        for ident in range(len(self)):
+            yield ident, self.obter_rotulo(ident)
+    
+    def __str__(self) -> str:
+        """Representação em string da tabela."""
+        return f"TabelaRotulos({len(self)} rótulos, {len(self._texto)} bytes de texto)"
@@ -0,0 +1,441 @@
+"""
+Módulo de Trilhas: Gravação Binária e Reprodução de Execuções
+==============================================================
+Grava todos os passos de uma execução (vértice visitado, aresta relaxada,
+tamanho do heap...) em um arquivo binário compacto, para depois reproduzir
+a execução na interface gráfica ou gerar um relatório em texto, sem
+executar o algoritmo de novo.
+
+FORMATO DO ARQUIVO:
+-------------------
+Cabeçalho (16 bytes):
+    magic 'GTRC' | versão (uint16) | tamanho do registro (uint16) | reservado
+
+Registros de tamanho fixo (40 bytes, little-endian):
+    tipo    uint8    código do evento (TIPOS)
+    marca   uint8    1 = aresta aceita (eventos 'aresta')
+    a       int32    vértice / origem da aresta (-1 = nenhum)
+    b       int32    vértice / destino da aresta (-1 = nenhum)
+    c       uint32   passo, iteração, posição no caminho ou código do algoritmo
+    x       float64  distância, peso ou custo
+    y       float64  nova distância ou custo acumulado
+    z       float64  distância anterior
+
+O arquivo só recebe registros no final (modo 'ab'): várias execuções podem
+ser gravadas no mesmo arquivo, cada uma começando por um registro 'inicio'.
+Com tamanho fixo, o registro i está sempre em 16 + 40 * i, e a leitura é
+feita em blocos, sem carregar o arquivo inteiro.
+
+Eventos com listas ('descoberta', 'caminho') viram um registro por elemento.
+
+USO:
+----
+    with RastreadorTrilha('dijkstra.trc') as trilha:
+        Dijkstra.menor_caminho(grafo, 0, 5, rastreador=trilha)
+
+    print(relatorio('dijkstra.trc'))
+    for evento in reproduzir('dijkstra.trc'):   # eventos do módulo eventos
+        ...
+
+Autores: [COLOQUE OS NOMES DA EQUIPE AQUI]
+Data: Dezembro 2025
+"""
+
+import os
+import struct
+from collections import deque
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from eventos import (
+    Evento, Visita, Enfileiramento, Relaxamento, ArestaAceita,
+    ArestaRejeitada, CicloNegativo, Fim
+)
+from rastreamento import Rastreador
+
+
+MAGIC = b'GTRC'
+VERSAO = 1
+CABECALHO = struct.Struct('<4sHH8x')
+REGISTRO = struct.Struct('<BBxxiiIddd')
+
+# Código de cada tipo de evento (a posição na tupla)
+TIPOS = ('inicio', 'visita', 'descoberta', 'destino', 'caminho', 'sem_caminho',
+         'fim', 'iteracao', 'relaxamento', 'ciclo_negativo', 'aresta', 'descarte')
+CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS)}
+
+# Código de cada algoritmo (a posição na tupla): novos algoritmos entram no
+# final, para não mudar o código dos que já estão em trilhas gravadas
+ALGORITMOS = ('BFS', 'DFS', 'Bellman-Ford', 'Dijkstra', 'Kruskal', 'Prim', 'Tarjan', 'Kahn', 'A*')
+CODIGO_ALGORITMO = {nome: codigo for codigo, nome in enumerate(ALGORITMOS)}
+
+REGISTROS_POR_BLOCO = 4096
+
+
+class Registro(NamedTuple):
+    """Registro lido de uma trilha (campos conforme o tipo do evento)."""
+    tipo: str
+    marca: int
+    a: int
+    b: int
+    c: int
+    x: float
+    y: float
+    z: float
+
+
+def _vertice(v: Optional[int]) -> int:
+    """Converte um vértice opcional para int32 (-1 = nenhum)."""
+    return -1 if v is None else v
+
+
+class RastreadorTrilha(Rastreador):
+    """
+    Rastreador que grava os eventos em uma trilha binária de registros fixos.
+    
+    Mensagens de texto puro não são gravadas: a trilha guarda apenas os
+    dados; o texto é refeito por relatorio().
+    """
+    
+    def __init__(self, caminho: str):
+        """
+        Abre a trilha para acrescentar registros (cria o arquivo se necessário).
+        
+        Args:
+            caminho (str): Caminho do arquivo da trilha
+        
+        Raises:
+            ValueError: Se o arquivo existir e não for uma trilha válida
+        """
+        novo = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+        if not novo:
+            with open(caminho, 'rb') as arquivo:
+                _validar_cabecalho(arquivo.read(CABECALHO.size), caminho)
+            # Descarta um registro incompleto (gravação interrompida) para
+            # manter os próximos registros alinhados
+            excesso = (os.path.getsize(caminho) - CABECALHO.size) % REGISTRO.size
+            if excesso:
+                os.truncate(caminho, os.path.getsize(caminho) - excesso)
+        
+        self.arquivo = open(caminho, 'ab')
+        if novo:
+            self.arquivo.write(CABECALHO.pack(MAGIC, VERSAO, REGISTRO.size))
+        self._pack = REGISTRO.pack
+        self.registros = 0
+    
+    def _gravar(self, tipo: str, a: int = -1, b: int = -1, c: int = 0,
+                x: float = 0.0, y: float = 0.0, z: float = 0.0, marca: int = 0):
+        """Acrescenta um registro ao arquivo."""
+        self.arquivo.write(self._pack(CODIGO_TIPO[tipo], marca, a, b, c, x, y, z))
+        self.registros += 1
+    
+    def evento(self, tipo: str, texto: str = '', **dados):
+        """Converte o evento em um ou mais registros binários."""
+        if tipo == 'visita':
+            # Distância (BFS, Dijkstra) ou profundidade (DFS recursivo)
+            distancia = dados.get('distancia', dados.get('profundidade', 0))
+            if 'tamanho_heap' in dados:
+                tamanho = dados['tamanho_heap']
+            else:
+                tamanho = len(dados.get('fila', dados.get('pilha', ())))
+            self._gravar(tipo, dados['vertice'], tamanho, dados.get('passo', 0), distancia)
+        elif tipo == 'relaxamento':
+            self._gravar(tipo, dados['u'], dados['v'], 0,
+                         dados['peso'], dados['nova'], dados['anterior'])
+        elif tipo == 'descoberta':
+            for vizinho in dados['vizinhos']:
+                self._gravar(tipo, vizinho, dados['vertice'])
+        elif tipo == 'aresta':
+            self._gravar(tipo, dados['u'], dados['v'],
+                         dados.get('iteracao', dados.get('passo', 0)),
+                         dados['peso'], dados['custo'], marca=int(dados['aceita']))
+        elif tipo in ('descarte', 'ciclo_negativo'):
+            self._gravar(tipo, dados['u'], dados['v'], 0, dados['peso'])
+        elif tipo == 'iteracao':
+            self._gravar(tipo, dados['total'], -1, dados['iteracao'])
+        elif tipo == 'inicio':
+            self._gravar(tipo, _vertice(dados.get('origem')), _vertice(dados.get('destino')),
+                         CODIGO_ALGORITMO[dados['algoritmo']], dados.get('vertices', 0))
+        elif tipo == 'destino':
+            self._gravar(tipo, dados['vertice'])
+        elif tipo == 'sem_caminho':
+            self._gravar(tipo, -1, dados['destino'])
+        elif tipo == 'caminho':
+            for posicao, v in enumerate(dados['caminho']):
+                self._gravar(tipo, v, -1, posicao, dados['custo'])
+        elif tipo == 'fim':
+            self._gravar(tipo, -1, -1, dados.get('visitados', dados.get('arestas', 0)),
+                         dados.get('custo_total', 0.0))
+    
+    def mensagem(self, texto: str):
+        """Mensagens de texto não são gravadas na trilha."""
+    
+    def fechar(self):
+        """Fecha o arquivo."""
+        self.arquivo.close()
+    
+    def __enter__(self) -> 'RastreadorTrilha':
+        return self
+    
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def _validar_cabecalho(dados: bytes, caminho: str):
+    """Verifica o cabeçalho de uma trilha."""
+    if len(dados) < CABECALHO.size:
+        raise ValueError(f"Trilha inválida (cabeçalho incompleto): {caminho}")
+    magic, versao, tamanho = CABECALHO.unpack(dados)
+    if magic != MAGIC:
+        raise ValueError(f"Arquivo não é uma trilha de execução: {caminho}")
+    if versao != VERSAO or tamanho != REGISTRO.size:
+        raise ValueError(f"Versão de trilha não suportada ({versao}): {caminho}")
+
+
+def ler_trilha(caminho: str) -> Iterator[Registro]:
+    """
+    Lê os registros de uma trilha, em blocos.
+    
+    Args:
+        caminho (str): Caminho do arquivo da trilha
+    
+    Returns:
+        Iterator[Registro]: Registros na ordem de gravação
+    
+    Raises:
+        ValueError: Se o arquivo não for uma trilha válida
+    """
+    with open(caminho, 'rb') as arquivo:
+        _validar_cabecalho(arquivo.read(CABECALHO.size), caminho)
+        tamanho_bloco = REGISTRO.size * REGISTROS_POR_BLOCO
+        
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            # Um registro incompleto no final (gravação interrompida) é ignorado
+            bloco = bloco[:len(bloco) - len(bloco) % REGISTRO.size]
+            if not bloco:
+                break
+            for tipo, marca, a, b, c, x, y, z in REGISTRO.iter_unpack(bloco):
+                yield Registro(TIPOS[tipo], marca, a, b, c, x, y, z)
+
+
+def execucoes(caminho: str) -> Iterator[List[Registro]]:
+    """
+    Separa a trilha em execuções (cada uma começa por um registro 'inicio').
+    
+    Args:
+        caminho (str): Caminho do arquivo da trilha
+    
+    Returns:
+        Iterator[List[Registro]]: Registros de cada execução
+    """
+    atual = []
+    for registro in ler_trilha(caminho):
+        if registro.tipo == 'inicio' and atual:
+            yield atual
+            atual = []
+        atual.append(registro)
+    if atual:
+        yield atual
+
+
+def _formatar_distancia(d: float) -> str:
+    """Formata uma distância, usando ∞ para infinito."""
+    return '∞' if d == float('inf') else f"{d:g}"
+
+
+def relatorio(caminho: str, detalhado: bool = True) -> str:
+    """
+    Gera um relatório em texto de uma trilha, sem executar o algoritmo.
+    
+    Args:
+        caminho (str): Caminho do arquivo da trilha
+        detalhado (bool): Se False, mostra apenas o resumo de cada execução
+    
+    Returns:
+        str: Relatório com os passos e um resumo (contagens, maior heap)
+    """
+    linhas = []
+    for numero, registros in enumerate(execucoes(caminho), 1):
+        inicio = registros[0]
+        linhas.append(f"{'='*70}")
+        if inicio.tipo == 'inicio':
+            algoritmo = ALGORITMOS[inicio.c]
+            cabecalho = f"EXECUÇÃO {numero}: {algoritmo}"
+            if inicio.a >= 0:
+                cabecalho += f" - origem {inicio.a}"
+            if inicio.b >= 0:
+                cabecalho += f", destino {inicio.b}"
+        else:
+            cabecalho = f"EXECUÇÃO {numero}: (sem registro de início)"
+        linhas.append(cabecalho)
+        linhas.append(f"{'='*70}")
+        
+        contagem = {}
+        maior_estrutura = 0
+        caminho_encontrado = []
+        custo = None
+        
+        for r in registros:
+            contagem[r.tipo] = contagem.get(r.tipo, 0) + 1
+            if r.tipo == 'visita':
+                maior_estrutura = max(maior_estrutura, r.b)
+                if detalhado:
+                    linhas.append(f"Passo {r.c}: visita {r.a} "
+                                  f"(distância: {_formatar_distancia(r.x)}, fila/heap: {r.b})")
+            elif r.tipo == 'relaxamento':
+                if detalhado:
+                    linhas.append(f"  Relaxa {r.a} → {r.b} (peso: {r.x:g}): "
+                                  f"{_formatar_distancia(r.z)} → {_formatar_distancia(r.y)}")
+            elif r.tipo == 'descoberta':
+                if detalhado:
+                    linhas.append(f"  Descobre {r.a} a partir de {r.b}")
+            elif r.tipo == 'iteracao':
+                if detalhado:
+                    linhas.append(f"Iteração {r.c}/{r.a}")
+            elif r.tipo == 'aresta':
+                if detalhado:
+                    situacao = "✓ aceita" if r.marca else "✗ rejeitada"
+                    linhas.append(f"  Aresta {r.a} -- {r.b} (peso: {r.x:g}) {situacao}, "
+                                  f"custo acumulado: {r.y:g}")
+            elif r.tipo == 'descarte':
+                if detalhado:
+                    linhas.append(f"  Ignora {r.a} -- {r.b} (peso: {r.x:g})")
+            elif r.tipo == 'ciclo_negativo':
+                linhas.append(f"⚠ Ciclo negativo: {r.a} → {r.b} (peso: {r.x:g}) ainda relaxa")
+            elif r.tipo == 'sem_caminho':
+                linhas.append(f"✗ Sem caminho até {r.b}")
+            elif r.tipo == 'caminho':
+                caminho_encontrado.append(r.a)
+                custo = r.x
+            elif r.tipo == 'fim' and r.x:
+                linhas.append(f"Custo total da MST: {r.x:g}")
+        
+        if caminho_encontrado:
+            linhas.append(f"Caminho: {' → '.join(map(str, caminho_encontrado))} "
+                          f"(custo: {custo:g})")
+        
+        linhas.append(f"{'─'*70}")
+        linhas.append(f"Registros: {len(registros)}")
+        for tipo in TIPOS:
+            if tipo in contagem and tipo != 'inicio':
+                linhas.append(f"  {tipo}: {contagem[tipo]}")
+        if 'visita' in contagem:
+            linhas.append(f"Maior fila/heap/pilha: {maior_estrutura}")
+    
+    return '\n'.join(linhas)
+
+
+def reproduzir(caminho: str, execucao: int = -1) -> Iterator[Evento]:
+    """
+    Reproduz uma execução gravada como eventos do modo passo a passo.
+    
+    Os eventos são os mesmos de BFS.passos, Dijkstra.passos etc., então a
+    interface gráfica anima uma trilha do mesmo jeito que uma execução.
+    
+    Args:
+        caminho (str): Caminho do arquivo da trilha
+        execucao (int): Índice da execução no arquivo (-1 = a última)
+    
+    Returns:
+        Iterator[Evento]: Eventos da execução; o último é Fim com um
+            resultado parcial: 'algoritmo', 'caminho', 'custo' (menor
+            caminho) ou 'arestas', 'custo_total' (MST)
+    
+    Raises:
+        ValueError: Se a trilha não tiver a execução pedida
+    """
+    if execucao < 0:
+        # Guarda só as últimas -execucao execuções (com -1, apenas a mais
+        # recente): as anteriores são descartadas durante a leitura
+        ultimas = deque(execucoes(caminho), maxlen=-execucao)
+        if not ultimas:
+            raise ValueError(f"Trilha vazia: {caminho}")
+        if len(ultimas) < -execucao:
+            raise ValueError(f"Trilha não tem a execução {execucao}: {caminho}")
+        registros = ultimas[0]
+    else:
+        for indice, registros in enumerate(execucoes(caminho)):
+            if indice == execucao:
+                break
+        else:
+            raise ValueError(f"Trilha não tem a execução {execucao}: {caminho}")
+    
+    resultado: Dict = {'algoritmo': None, 'caminho': None, 'custo': None}
+    arestas = []
+    
+    for r in registros:
+        if r.tipo == 'inicio':
+            resultado['algoritmo'] = ALGORITMOS[r.c]
+        elif r.tipo == 'visita':
+            yield Visita(r.a, r.x)
+        elif r.tipo == 'descoberta':
+            yield Enfileiramento(r.a, r.b)
+        elif r.tipo == 'relaxamento':
+            yield Relaxamento(r.a, r.b, r.x, r.y)
+        elif r.tipo == 'ciclo_negativo':
+            yield CicloNegativo(r.a, r.b, r.x)
+        elif r.tipo == 'aresta':
+            if r.marca:
+                arestas.append((r.a, r.b, r.x))
+                yield ArestaAceita(r.a, r.b, r.x)
+            else:
+                yield ArestaRejeitada(r.a, r.b, r.x)
+        elif r.tipo == 'descarte':
+            yield ArestaRejeitada(r.a, r.b, r.x)
+        elif r.tipo == 'caminho':
+            if resultado['caminho'] is None:
+                resultado['caminho'] = []
+            resultado['caminho'].append(r.a)
+            resultado['custo'] = r.x
+    
+    if resultado['algoritmo'] in ('Kruskal', 'Prim'):
+        resultado['arestas'] = arestas
+        resultado['custo_total'] = sum(peso for _, _, peso in arestas)
+    
+    yield Fim(resultado)
+
+
+# Função auxiliar para demonstração
+def demonstrar_trilha():
+    """
+    Função de demonstração da gravação e reprodução de trilhas.
+    """
+    import tempfile
+    from grafo import GrafoExemplos
+    from bellman_ford_dijkstra import Dijkstra
+    from mst_kruskal_prim import Kruskal
+    from rastreamento import RastreadorArquivo
+    
+    print("\n" + "="*70)
+    print("DEMONSTRAÇÃO: TRILHAS BINÁRIAS DE EXECUÇÃO")
+    print("="*70)
+    
+    grafo = GrafoExemplos.criar_mapa_cidade()
+    pasta = tempfile.mkdtemp()
+    arquivo_trilha = os.path.join(pasta, 'execucoes.trc')
+    arquivo_json = os.path.join(pasta, 'execucoes.jsonl')
+    
+    # Duas execuções acrescentadas ao mesmo arquivo
+    with RastreadorTrilha(arquivo_trilha) as trilha:
+        Dijkstra.menor_caminho(grafo, 0, 5, rastreador=trilha)
+    with RastreadorTrilha(arquivo_trilha) as trilha:
+        Kruskal.mst(grafo, rastreador=trilha)
+    
+    with RastreadorArquivo(arquivo_json) as r:
+        Dijkstra.menor_caminho(grafo, 0, 5, rastreador=r)
+        Kruskal.mst(grafo, rastreador=r)
+    
+    print(f"\nTamanho da trilha binária: {os.path.getsize(arquivo_trilha)} bytes")
+    print(f"Tamanho em JSON Lines:     {os.path.getsize(arquivo_json)} bytes")
+    
+    print("\nRelatório (resumo):")
+    print(relatorio(arquivo_trilha, detalhado=False))
+    
+    print("\nReprodução da execução do Dijkstra (primeiros eventos):")
+    for i, evento in enumerate(reproduzir(arquivo_trilha, execucao=0)):
+        if i < 5 or isinstance(evento, Fim):
+            print(f"  {evento}")
+
+
+if __name__ == "__main__":
+    demonstrar_trilha()